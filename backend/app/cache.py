@@ -0,0 +1,200 @@
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple, Hashable, Sequence
+
+from spatial import SpatialIndex
+
+CacheKey = Tuple[Hashable, ...]
+
+
+@lru_cache(maxsize=32)
+def _resolution_digits(resolution: float) -> int:
+    """Çözünürlüğün ondalık basamak sayısı"""
+    return max(0, len(f"{resolution:.10f}".rstrip("0").split(".")[1]))
+
+
+def snap_coordinate(value: float, resolution: float) -> float:
+    """Koordinatı verilen ızgara çözünürlüğüne yuvarlar"""
+    if resolution <= 0:
+        return value
+    # Ondalık gürültüyü önlemek için çözünürlüğün basamak sayısına yuvarla
+    return round(round(value / resolution) * resolution, _resolution_digits(resolution))
+
+
+def make_key(lat: float, lon: float, units: str, resolution: float) -> CacheKey:
+    """(ızgara hücresi, birim) önbellek anahtarı üretir"""
+    return (snap_coordinate(lat, resolution), snap_coordinate(lon, resolution), units)
+
+
+class ForecastCache:
+    """
+    Süre (TTL) ve LRU tahliyesi olan süreç içi tahmin önbelleği
+
+    Her kayıt TTL dolduğunda veya verilen `expires_at` anında (ör. bir sonraki
+    Open-Meteo güncelleme sınırı) hangisi önce gelirse geçersiz olur. Süresi
+    dolan kayıt `stale_grace` saniye boyunca "bayat" olarak döndürülebilir.
+    Süresi tamamen dolan kayıtlar silinmez; upstream erişilemezken son bilinen
+    değer olarak `peek` ile okunabilir ve LRU sırasıyla tahliye edilir.
+
+    `index` verilirse (enlem, boylam, ...) anahtarları uzamsal indekste tutulur;
+    `lookup_near` kesin hücre yoksa yakındaki geçerli kayıtlarla yanıt verebilir.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 600, stale_grace: float = 0,
+                 index: Optional[SpatialIndex] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_grace = stale_grace
+        self.index = index
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.nearest_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: CacheKey) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Kaydı döndürür ve en son kullanılan olarak işaretler
+
+        Returns:
+            (değer, bayat mı) ikilisi; kayıt yoksa veya tolerans da geçtiyse (None, False)
+        """
+        return self.lookup_any((key,))
+
+    def lookup_any(self, keys: Sequence[CacheKey]) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Verilen sırayla ilk geçerli kaydı, yoksa ilk bayat kaydı döndürür
+
+        Dar bir isteğin onu kapsayan daha geniş kayıtlarla karşılanması için
+        kullanılır; sayaçlara tek bir arama olarak yansır.
+        """
+        value, stale, _ = self.lookup_near(keys)
+        return value, stale
+
+    def lookup_near(self, keys: Sequence[CacheKey], lat: float = 0.0, lon: float = 0.0,
+                    max_distance_km: float = 0.0) -> Tuple[Optional[Dict[str, Any]], bool, Optional[CacheKey]]:
+        """
+        `lookup_any` gibi arar; kesin anahtarlarda geçerli kayıt yoksa bayat kayda
+        düşmeden önce `max_distance_km` içindeki en yakın geçerli kaydı dener
+
+        Yakındaki kayıtlar yalnızca `keys` ile aynı soneke (birim, profil) sahip
+        anahtarlar arasından seçilir. Bayat komşu kayıtlar kullanılmaz.
+
+        Returns:
+            (değer, bayat mı, yanıtlayan anahtar); bulunamazsa (None, False, None)
+        """
+        now = time.time()
+        stale_key = None
+        stale_value = None
+        expired = False
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+
+            expires_at, value = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value, False, key
+
+            if now < expires_at + self.stale_grace:
+                if stale_key is None:
+                    stale_key, stale_value = key, value
+            else:
+                expired = True
+
+        if max_distance_km > 0 and self.index is not None:
+            rests = [key[2:] for key in keys]
+            for _, key in self.index.nearby(lat, lon, rests, max_distance_km):
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.nearest_hits += 1
+                    return entry[1], False, key
+
+        if stale_key is not None:
+            self._entries.move_to_end(stale_key)
+            self.stale_hits += 1
+            return stale_value, True, stale_key
+
+        if expired:
+            self.expirations += 1
+        self.misses += 1
+        return None, False, None
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Yalnızca süresi dolmamış kaydı döndürür"""
+        value, stale = self.lookup(key)
+        return None if stale else value
+
+    def peek(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Süresine bakmadan son bilinen değeri döndürür (sayaçları etkilemez)"""
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def _peek_fresh_entry(self, keys: Sequence[CacheKey]) -> Optional[Tuple[float, Dict[str, Any]]]:
+        now = time.time()
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry
+        return None
+
+    def peek_fresh(self, keys: Sequence[CacheKey]) -> Optional[Dict[str, Any]]:
+        """Sayaçları ve LRU sırasını etkilemeden ilk geçerli kaydı döndürür"""
+        entry = self._peek_fresh_entry(keys)
+        return entry[1] if entry is not None else None
+
+    def expires_at(self, keys: Sequence[CacheKey]) -> Optional[float]:
+        """İlk geçerli kaydın geçerliliğini yitireceği an (epoch); geçerli kayıt yoksa None"""
+        entry = self._peek_fresh_entry(keys)
+        return entry[0] if entry is not None else None
+
+    def set(self, key: CacheKey, value: Dict[str, Any], expires_at: Optional[float] = None) -> None:
+        """Kaydı ekler; kapasite aşılırsa en az kullanılanı tahliye eder"""
+        deadline = time.time() + self.ttl
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+
+        if self.index is not None and key not in self._entries:
+            self.index.add(key)
+        self._entries[key] = (deadline, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            if self.index is not None:
+                self.index.discard(evicted)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self.index is not None:
+            self.index.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Önbellek sayaçlarını döndürür"""
+        lookups = self.hits + self.nearest_hits + self.stale_hits + self.misses
+        stats = {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "stale_grace": self.stale_grace,
+            "hits": self.hits,
+            "nearest_hits": self.nearest_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": round((self.hits + self.nearest_hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+        }
+        if self.index is not None:
+            stats["spatial_index"] = self.index.stats()
+        return stats
@@ -0,0 +1,153 @@
+import zlib
+from typing import Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+
+# Brotli kuruluysa tercih edilir; değilse yalnızca gzip sunulur
+try:
+    import brotli
+except ImportError:  # pragma: no cover - isteğe bağlı bağımlılık
+    brotli = None
+
+# Sunucu tercih sırası (istemci eşit q değeri verdiğinde)
+ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Sıkıştırılmayan içerik türleri: SSE olayları tamponlanmadan hemen iletilmeli
+EXCLUDED_MEDIA_TYPES: Tuple[str, ...] = ("text/event-stream",)
+
+
+def negotiate(accept_encoding: Optional[str], available: Sequence[str] = ENCODINGS) -> Optional[str]:
+    """
+    `Accept-Encoding` başlığına göre kullanılacak kodlamayı seçer
+
+    En yüksek q değerli kodlama seçilir; eşitlikte `available` sırası geçerlidir.
+    q=0 kodlamalar reddedilmiş sayılır; `*` listede olmayan kodlamaları kapsar.
+    """
+    if not accept_encoding:
+        return None
+
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        weights[name.strip()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class _Compressor:
+    """gzip ve brotli akış sıkıştırıcıları için ortak arayüz"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+            self._zlib = None
+        else:
+            self._brotli = None
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        """Parçayı sıkıştırır ve istemcinin hemen çözebilmesi için tamponu boşaltır"""
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._zlib.compress(data) + self._zlib.flush()
+
+
+class CompressionMiddleware:
+    """
+    `Accept-Encoding` ile müzakere edilen Brotli/gzip yanıt sıkıştırması
+
+    Tek parçalı yanıtlar `minimum_size` bayttan küçükse olduğu gibi gönderilir;
+    küçük gövdelerde sıkıştırma başlığı ve CPU maliyeti kazançtan fazladır.
+    Akış yanıtları (NDJSON/CSV dışa aktarım) her parça sıkıştırılıp boşaltılarak
+    gönderilir. SSE, gövdesiz (304) ve zaten kodlanmış yanıtlara dokunulmaz.
+    Starlette'in GZipMiddleware'i gibi saf ASGI olarak yazılmıştır.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4,
+                 encodings: Sequence[str] = ENCODINGS):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.encodings = tuple(encoding for encoding in encodings if encoding in ENCODINGS)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor: Optional[_Compressor] = None
+        passthrough = False
+
+        async def send_compressed(message) -> None:
+            nonlocal start_message, compressor, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "").split(";")[0].strip()
+                if (message["status"] in (204, 304) or "content-encoding" in headers
+                        or media_type in EXCLUDED_MEDIA_TYPES):
+                    passthrough = True
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                # İlk gövde parçası: tek parçalı küçük yanıtlar sıkıştırılmaz
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressor = _Compressor(encoding, self.gzip_level, self.brotli_quality)
+                headers = MutableHeaders(raw=start_message["headers"])
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    del headers["Content-Length"]
+                    body = compressor.chunk(body)
+                else:
+                    body = compressor.finish(body)
+                    headers["Content-Length"] = str(len(body))
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                return
+
+            body = compressor.chunk(body) if more_body else compressor.finish(body)
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,67 @@
+import hashlib
+import time
+from typing import Optional, Dict, Any, Hashable
+
+from cache import snap_coordinate
+from config import CACHE_GRID_RESOLUTION
+
+# Geçerli veri olmadığında (bayat kayıt, önbellek kapalı) istemci her seferinde
+# doğrulama yapar; ETag eşleşirse yine gövdesiz 304 döner
+NO_CACHE = "no-cache"
+
+
+def make_etag(*parts: Hashable) -> str:
+    """
+    Verilen parçalardan zayıf (W/) bir ETag üretir
+
+    Yanıt gövdesindeki `updated_at` aynı upstream verisi yeniden çekildiğinde
+    değişebildiğinden ETag'ler anlamca eşdeğer gövdeler için zayıftır.
+    """
+    return 'W/"' + hashlib.sha1(repr(parts).encode()).hexdigest()[:16] + '"'
+
+
+def forecast_etag(weather_data: Dict[str, Any], *variant: Hashable) -> str:
+    """
+    Normalize tahmin verisi için ETag
+
+    Upstream `current.time`, yanıtı veren ızgara hücresi ve birimden türetilir;
+    `variant` aynı veriden üretilen farklı gövdeleri (uç nokta, dil, biçim)
+    ayırır. Gövdeyi serileştirmeden hesaplanır. Enterpole edilmiş veri noktaya
+    özgü olduğundan tam koordinatlar da eklenir.
+    """
+    location = weather_data["location"]
+    current = weather_data.get("current") or {}
+    if weather_data.get("interpolated"):
+        variant = (location["latitude"], location["longitude"], *variant)
+    return make_etag(
+        snap_coordinate(location["latitude"], CACHE_GRID_RESOLUTION),
+        snap_coordinate(location["longitude"], CACHE_GRID_RESOLUTION),
+        weather_data["units"],
+        current.get("time"),
+        *variant,
+    )
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """`If-None-Match` başlığı ETag ile eşleşiyor mu (zayıf karşılaştırma)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def cache_headers(etag: str, expires_at: Optional[float]) -> Dict[str, str]:
+    """
+    ETag ve bir sonraki veri güncellemesine kadar geçerli Cache-Control başlıkları
+
+    Args:
+        etag: Yanıtın ETag'i
+        expires_at: Verinin geçerliliğini yitireceği an (epoch); None ise `no-cache`
+    """
+    max_age = int(expires_at - time.time()) if expires_at is not None else 0
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}" if max_age > 0 else NO_CACHE,
+    }
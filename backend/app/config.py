@@ -0,0 +1,100 @@
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Open-Meteo uç noktası (benchmark'larda yerel mock sunucuya yönlendirilebilir)
+OPEN_METEO_URL = os.getenv("OPEN_METEO_URL", "https://api.open-meteo.com/v1/forecast")
+
+# Paylaşılan HTTP bağlantı havuzu ayarları
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "10"))
+
+# Süreç içi tahmin önbelleği (TTL + LRU)
+CACHE_ENABLED = _env_bool("CACHE_ENABLED", True)
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "2048"))
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "900"))
+# Süresi dolan kaydın arka planda yenilenirken döndürülebileceği süre (0 = kapalı)
+CACHE_STALE_GRACE_SECONDS = float(os.getenv("CACHE_STALE_GRACE_SECONDS", "600"))
+# Yakın koordinatların aynı kaydı paylaşması için ızgara çözünürlüğü (derece)
+CACHE_GRID_RESOLUTION = float(os.getenv("CACHE_GRID_RESOLUTION", "0.01"))
+# Kesin hücre önbellekte yoksa bu mesafedeki (km) en yakın geçerli kayıtla yanıt ver (0 = kapalı)
+CACHE_NEAREST_MAX_KM = float(os.getenv("CACHE_NEAREST_MAX_KM", "2"))
+# Yakın kayıt aramasında kullanılan uzamsal indeks kovası (derece)
+CACHE_SPATIAL_BUCKET_DEGREES = float(os.getenv("CACHE_SPATIAL_BUCKET_DEGREES", "0.05"))
+# Noktayı çevreleyen dört ızgara hücresi önbellekteyse anlık değerleri bilinear enterpolasyonla hesapla
+CACHE_NEAREST_INTERPOLATE = _env_bool("CACHE_NEAREST_INTERPOLATE", False)
+
+# Toplu (çoklu konum) istek ayarları
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "1000"))
+# Open-Meteo'ya tek istekte gönderilecek en fazla konum sayısı
+BATCH_CHUNK_SIZE = int(os.getenv("BATCH_CHUNK_SIZE", "100"))
+
+# Toplu bölge dışa aktarımı (NDJSON/CSV)
+EXPORT_MAX_POINTS = int(os.getenv("EXPORT_MAX_POINTS", "1000000"))
+# Aynı anda işlenen toplu parça sayısı (her parça BATCH_CHUNK_SIZE nokta)
+EXPORT_CONCURRENCY = int(os.getenv("EXPORT_CONCURRENCY", "4"))
+# Dışa aktarma işlerinin çıktı ve ilerleme dosyalarının dizini
+EXPORT_DIR = os.getenv("EXPORT_DIR", "exports")
+# Çalışan işin yaşam sinyali aralığı; 3 aralık boyunca sinyal yoksa iş kesintiye uğramış sayılır
+EXPORT_HEARTBEAT_SECONDS = float(os.getenv("EXPORT_HEARTBEAT_SECONDS", "10"))
+
+# Harita karosu ızgarası ve karo önbelleği
+TILE_GRID_SIZE = int(os.getenv("TILE_GRID_SIZE", "8"))
+TILE_MAX_ZOOM = int(os.getenv("TILE_MAX_ZOOM", "18"))
+TILE_CACHE_MAX_ENTRIES = int(os.getenv("TILE_CACHE_MAX_ENTRIES", "512"))
+TILE_CACHE_TTL_SECONDS = float(os.getenv("TILE_CACHE_TTL_SECONDS", "900"))
+
+# Worker'lar arasında paylaşılan disk (SQLite) önbelleği
+DISK_CACHE_ENABLED = _env_bool("DISK_CACHE_ENABLED", False)
+DISK_CACHE_PATH = os.getenv("DISK_CACHE_PATH", "forecast_cache.sqlite3")
+DISK_CACHE_TTL_SECONDS = float(os.getenv("DISK_CACHE_TTL_SECONDS", "3600"))
+# Süresi dolmuş kayıtların temizlenme aralığı (saniye)
+DISK_CACHE_COMPACT_INTERVAL = float(os.getenv("DISK_CACHE_COMPACT_INTERVAL", "600"))
+
+# En çok istenen hücrelerin saat başı arka planda yenilenmesi
+HOT_REFRESH_ENABLED = _env_bool("HOT_REFRESH_ENABLED", True)
+HOT_REFRESH_TOP_N = int(os.getenv("HOT_REFRESH_TOP_N", "50"))
+HOT_REFRESH_INTERVAL_SECONDS = float(os.getenv("HOT_REFRESH_INTERVAL_SECONDS", "3600"))
+# Sınırdan sonra, Open-Meteo'nun yeni veriyi yayınlaması için beklenen süre
+HOT_REFRESH_OFFSET_SECONDS = float(os.getenv("HOT_REFRESH_OFFSET_SECONDS", "60"))
+
+# Open-Meteo dayanıklılık katmanı
+UPSTREAM_MAX_CONCURRENCY = int(os.getenv("UPSTREAM_MAX_CONCURRENCY", "20"))
+UPSTREAM_QUEUE_TIMEOUT = float(os.getenv("UPSTREAM_QUEUE_TIMEOUT", "5"))
+UPSTREAM_MAX_RETRIES = int(os.getenv("UPSTREAM_MAX_RETRIES", "2"))
+UPSTREAM_RETRY_BASE_DELAY = float(os.getenv("UPSTREAM_RETRY_BASE_DELAY", "0.2"))
+# Her ilk istek için bütçeye eklenen yeniden deneme jetonu ve kova kapasitesi
+UPSTREAM_RETRY_BUDGET_RATIO = float(os.getenv("UPSTREAM_RETRY_BUDGET_RATIO", "0.2"))
+UPSTREAM_RETRY_BUDGET_MAX = float(os.getenv("UPSTREAM_RETRY_BUDGET_MAX", "10"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("BREAKER_RESET_TIMEOUT", "30"))
+
+# Önceden oluşturulmuş sohbet/tahmin metinleri (anlık görüntü başına)
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "4096"))
+
+# Sohbet mesajı -> niyet sınıflandırma önbelleği (tekrar eden mesajlar için)
+CHAT_INTENT_CACHE_SIZE = int(os.getenv("CHAT_INTENT_CACHE_SIZE", "4096"))
+# Sohbet mesajının en fazla karakter sayısı (önbellek belleğini ve tarama süresini sınırlar)
+CHAT_MESSAGE_MAX_LENGTH = int(os.getenv("CHAT_MESSAGE_MAX_LENGTH", "500"))
+
+# Accept-Encoding ile müzakere edilen yanıt sıkıştırması (brotli kuruluysa Brotli, yoksa gzip)
+COMPRESSION_ENABLED = _env_bool("COMPRESSION_ENABLED", True)
+# Bu boyuttan (bayt) küçük yanıtlar sıkıştırılmadan gönderilir
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+# /metrics uç noktası ve istek süresi middleware'i
+METRICS_ENABLED = _env_bool("METRICS_ENABLED", True)
@@ -0,0 +1,154 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple, Sequence
+import logging
+
+import json_backend
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS forecast_cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+class DiskForecastCache:
+    """
+    Birden çok uvicorn worker'ı ve yeniden başlatmalar arasında paylaşılan
+    SQLite tabanlı tahmin önbelleği
+
+    WAL kipi sayesinde birden çok süreç aynı dosyayı güvenle okuyup yazabilir.
+    Bloklayan SQLite çağrıları event loop dışında (thread havuzunda) çalıştırılır.
+    """
+
+    def __init__(self, path: str, ttl: float = 900, busy_timeout: float = 5.0):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=busy_timeout, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        # Satır sayısı tahmini: açılışta bir kez sayılır, yazma ve sıkıştırmada
+        # güncellenir. Diğer worker'ların yazdıkları bir sonraki sıkıştırmada yansır.
+        self._entries = self._count()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @staticmethod
+    def serialize_key(key: Sequence[Any]) -> str:
+        """Önbellek anahtarını (hücre, birim, değişken kümesi) metne çevirir"""
+        return "|".join(str(part) for part in key)
+
+    def _count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM forecast_cache").fetchone()[0]
+
+    def _get_many(self, keys: List[str]) -> Dict[str, Tuple[Dict[str, Any], float]]:
+        now = time.time()
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, value, expires_at FROM forecast_cache WHERE key IN ({placeholders}) AND expires_at > ?",
+                (*keys, now),
+            ).fetchall()
+        return {key: (json_backend.loads(value), expires_at) for key, value, expires_at in rows}
+
+    def _set_many(self, items: List[Tuple[str, Dict[str, Any], float]]) -> None:
+        rows = [(key, json_backend.dumps(value), expires_at) for key, value, expires_at in items]
+        keys = {key for key, _, _ in rows}
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            existing = self._conn.execute(
+                f"SELECT COUNT(*) FROM forecast_cache WHERE key IN ({placeholders})", tuple(keys)
+            ).fetchone()[0]
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO forecast_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._entries += len(keys) - existing
+
+    def _compact(self) -> int:
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM forecast_cache WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._entries = self._count()
+        return deleted
+
+    async def get_many(self, keys: Sequence[Sequence[Any]]) -> Dict[str, Tuple[Dict[str, Any], float]]:
+        """
+        Geçerli kayıtları toplu olarak okur
+
+        Returns:
+            serialize_key(anahtar) -> (değer, geçerlilik sonu) eşlemesi
+        """
+        if not keys:
+            return {}
+        serialized = [self.serialize_key(key) for key in keys]
+        try:
+            found = await asyncio.to_thread(self._get_many, serialized)
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.error(f"Disk önbelleği okunamadı: {e}")
+            return {}
+        self.hits += len(found)
+        self.misses += len(serialized) - len(found)
+        return found
+
+    async def get(self, key: Sequence[Any]) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Tek bir geçerli kaydı (değer, geçerlilik sonu) olarak döndürür"""
+        found = await self.get_many([key])
+        return found.get(self.serialize_key(key))
+
+    async def set_many(self, items: Sequence[Tuple[Sequence[Any], Dict[str, Any], Optional[float]]]) -> None:
+        """Kayıtları TTL veya verilen `expires_at` (hangisi önce) ile yazar"""
+        if not items:
+            return
+        deadline = time.time() + self.ttl
+        rows = [
+            (self.serialize_key(key), value, min(deadline, expires_at) if expires_at else deadline)
+            for key, value, expires_at in items
+        ]
+        try:
+            await asyncio.to_thread(self._set_many, rows)
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.error(f"Disk önbelleğine yazılamadı: {e}")
+
+    async def compact(self) -> int:
+        """Süresi dolmuş kayıtları siler ve WAL dosyasını küçültür"""
+        try:
+            return await asyncio.to_thread(self._compact)
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.error(f"Disk önbelleği sıkıştırılamadı: {e}")
+            return 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Disk önbelleği sayaçlarını döndürür
+
+        Metrik toplama yolunda çağrıldığından veritabanına gitmez; `entries`
+        yazma ve sıkıştırmada güncellenen tahmindir.
+        """
+        return {
+            "path": self.path,
+            "entries": self._entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+        }
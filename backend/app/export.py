@@ -0,0 +1,500 @@
+import asyncio
+import csv
+import io
+import math
+import os
+import re
+import time
+import uuid
+from collections import deque
+from itertools import islice
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Iterator, AsyncIterator
+import logging
+
+import json_backend
+from config import BATCH_CHUNK_SIZE, EXPORT_CONCURRENCY, EXPORT_DIR, EXPORT_MAX_POINTS, EXPORT_HEARTBEAT_SECONDS
+from normalize import CURRENT_KEYS, TODAY_KEYS
+from profiles import WEATHER
+from weather_service import WeatherService
+
+logger = logging.getLogger(__name__)
+
+Point = Tuple[float, float]
+Record = Tuple[Point, Optional[Dict[str, Any]]]
+
+EXPORT_FORMATS = ("ndjson", "csv")
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# CSV sütunları: nokta, `current` ve `today` alanları (ön ekli), güncelleme zamanı, hata
+CSV_COLUMNS: Tuple[str, ...] = (
+    "latitude",
+    "longitude",
+    *(f"current_{key}" for key in CURRENT_KEYS),
+    *(f"today_{key}" for key in TODAY_KEYS),
+    "updated_at",
+    "error",
+)
+
+UNAVAILABLE = "Hava durumu verileri şu anda alınamıyor"
+
+# İş durumları
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+INTERRUPTED = "interrupted"
+
+# İş kimlikleri dosya adı olarak kullanıldığından yalnızca uuid4 hex kabul edilir
+_JOB_ID = re.compile(r"^[0-9a-f]{32}$")
+
+# Bu sürecin çalıştırma kimliği. PID'ler yeniden başlatmalar arasında (ör.
+# konteynerde PID 1) tekrar kullanıldığından işin sahibi bununla belirlenir.
+_RUNNER = uuid.uuid4().hex
+
+# Bu süre boyunca yaşam sinyali yazılmamış başka süreçteki iş kesintiye uğramıştır
+HEARTBEAT_TIMEOUT = EXPORT_HEARTBEAT_SECONDS * 3
+
+
+class ExportLimitError(ValueError):
+    """Dışa aktarılacak nokta sayısı EXPORT_MAX_POINTS sınırını aşıyor"""
+
+
+def lattice_shape(bbox: Dict[str, float], resolution: float) -> Tuple[int, int]:
+    """Sınır kutusu ızgarasının (satır, sütun) sayısı; köşeler dahildir"""
+    if bbox["south"] > bbox["north"] or bbox["west"] > bbox["east"]:
+        raise ValueError("Geçersiz sınır kutusu (güney <= kuzey ve batı <= doğu olmalı)")
+    # Kayan nokta hatası son satırı/sütunu düşürmesin
+    rows = math.floor((bbox["north"] - bbox["south"]) / resolution + 1e-9) + 1
+    cols = math.floor((bbox["east"] - bbox["west"]) / resolution + 1e-9) + 1
+    return rows, cols
+
+
+def lattice_points(bbox: Dict[str, float], resolution: float) -> Iterator[Point]:
+    """Sınır kutusundaki ızgara noktalarını güneyden kuzeye, batıdan doğuya üretir"""
+    rows, cols = lattice_shape(bbox, resolution)
+    for row in range(rows):
+        lat = round(bbox["south"] + row * resolution, 6)
+        for col in range(cols):
+            yield lat, round(bbox["west"] + col * resolution, 6)
+
+
+def parse_point(line: str) -> Optional[Point]:
+    """
+    "enlem,boylam[,...]" satırını ayrıştırır
+
+    Boş satırlar, `#` ile başlayan satırlar ve sayısal olmayan başlık satırı için
+    None döner; aralık dışı veya eksik değerlerde ValueError yükselir.
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    fields = line.replace(";", ",").replace("\t", ",").split(",")
+    if len(fields) < 2:
+        raise ValueError(f"Geçersiz nokta satırı: {line[:80]}")
+    try:
+        lat, lon = float(fields[0]), float(fields[1])
+    except ValueError:
+        if fields[0].strip().lower() in ("lat", "latitude", "enlem"):
+            return None
+        raise ValueError(f"Geçersiz nokta satırı: {line[:80]}")
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError(f"Koordinat aralık dışında: {line[:80]}")
+    return lat, lon
+
+
+def validate_points(points: Iterable[Iterable[float]]) -> List[Point]:
+    """JSON nokta listesini doğrular ([enlem, boylam] çiftleri)"""
+    result = []
+    for point in points:
+        values = list(point)
+        if len(values) != 2:
+            raise ValueError("Her nokta [enlem, boylam] biçiminde olmalı")
+        lat, lon = values
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            raise ValueError(f"Koordinat aralık dışında: {lat}, {lon}")
+        result.append((lat, lon))
+        if len(result) > EXPORT_MAX_POINTS:
+            raise ExportLimitError(f"Dışa aktarım en fazla {EXPORT_MAX_POINTS} nokta içerebilir")
+    return result
+
+
+def read_points(path: str) -> Iterator[Point]:
+    """Nokta dosyasını satır satır okur; dosya belleğe alınmaz"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            point = parse_point(line)
+            if point is not None:
+                yield point
+
+
+def encode_ndjson(records: Iterable[Record]) -> bytes:
+    """Her nokta için bir JSON satırı üretir (`data` veya `error` dolu)"""
+    return b"".join(
+        json_backend.dumps({
+            "latitude": lat,
+            "longitude": lon,
+            "data": weather_data,
+            "error": None if weather_data else UNAVAILABLE,
+        }) + b"\n"
+        for (lat, lon), weather_data in records
+    )
+
+
+def encode_csv(records: Iterable[Record], header: bool = False) -> bytes:
+    """Kayıtları CSV satırlarına dönüştürür; None değerler boş hücre olur"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(CSV_COLUMNS)
+    for (lat, lon), weather_data in records:
+        if not weather_data:
+            writer.writerow((lat, lon, *([None] * (len(CSV_COLUMNS) - 3)), UNAVAILABLE))
+            continue
+        current = weather_data["current"]
+        today = weather_data["today"]
+        writer.writerow((
+            lat,
+            lon,
+            *map(current.get, CURRENT_KEYS),
+            *map(today.get, TODAY_KEYS),
+            weather_data["updated_at"],
+            None,
+        ))
+    return buffer.getvalue().encode()
+
+
+def encode(records: Iterable[Record], format: str, header: bool = False) -> bytes:
+    return encode_csv(records, header) if format == "csv" else encode_ndjson(records)
+
+
+def _chunks(points: Iterable[Point], size: int) -> Iterator[List[Point]]:
+    iterator = iter(points)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+async def fetch_points(points: Iterable[Point], units: str = "metric",
+                       chunk_size: int = BATCH_CHUNK_SIZE,
+                       concurrency: int = EXPORT_CONCURRENCY) -> AsyncIterator[List[Record]]:
+    """
+    Noktaları parçalar halinde WeatherService.get_weather_batch ile çeker
+
+    Aynı anda en fazla `concurrency` parça işlenir; sonuçlar girdi sırasıyla
+    parça parça döner. Nokta akışı tembel okunduğundan bellekte en fazla
+    `concurrency * chunk_size` nokta bulunur. Toplu çekimler popüler hücre
+    sayaçlarını etkilemez ve bellek önbelleğine yazılmaz (yalnızca diske).
+    """
+    window: "deque[Tuple[List[Point], asyncio.Task]]" = deque()
+
+    def submit(chunk: List[Point]) -> None:
+        task = asyncio.ensure_future(
+            WeatherService.get_weather_batch([(lat, lon, units) for lat, lon in chunk], WEATHER,
+                                             track=False, remember=False)
+        )
+        window.append((chunk, task))
+
+    try:
+        for chunk in _chunks(points, chunk_size):
+            submit(chunk)
+            if len(window) >= concurrency:
+                done_chunk, task = window.popleft()
+                yield list(zip(done_chunk, await task))
+        while window:
+            done_chunk, task = window.popleft()
+            yield list(zip(done_chunk, await task))
+    finally:
+        for _, task in window:
+            task.cancel()
+
+
+async def stream_export(points: Iterable[Point], units: str, format: str) -> AsyncIterator[bytes]:
+    """Dışa aktarımı NDJSON veya CSV bayt parçaları olarak akıtır"""
+    header = format == "csv"
+    async for records in fetch_points(points, units):
+        yield encode(records, format, header)
+        header = False
+    if header:
+        yield encode((), format, header)
+
+
+class ExportJobs:
+    """
+    Diske ilerleme kaydeden, kesintiden sonra kaldığı yerden sürdürülebilen
+    dışa aktarma işleri
+
+    Her iş EXPORT_DIR altında `<id>.json` (durum), `<id>.<biçim>` (çıktı) ve
+    yüklenen noktalar için `<id>.points.csv` dosyalarından oluşur. Çıktıya her
+    parça eklendikten sonra yazılan nokta sayısı ve dosya uzunluğu durum
+    dosyasına kaydedilir. Sürdürürken çıktı kayıtlı uzunluğa kısaltılır (yarım
+    kalmış parça atılır) ve işlenmiş noktalar atlanır.
+
+    Çalışan iş, sahibi olan sürecin kimliğini (`runner`) ve her
+    EXPORT_HEARTBEAT_SECONDS saniyede güncellenen yaşam sinyalini (`heartbeat`)
+    yazar. Başka bir süreçte sinyali HEARTBEAT_TIMEOUT süresince yenilenmemiş
+    iş, süreç çökmüş veya öldürülmüş sayılır.
+    """
+
+    # Bu süreçte çalışan işler: kimlik -> güncel durum ve görev
+    _states: Dict[str, Dict[str, Any]] = {}
+    _tasks: Dict[str, "asyncio.Task[None]"] = {}
+    # Çalışma başına (başlangıç anı, başlangıçtaki nokta sayısı); hız ve kalan süre için
+    _runs: Dict[str, Tuple[float, int]] = {}
+
+    @staticmethod
+    def _path(job_id: str, suffix: str) -> str:
+        return os.path.join(EXPORT_DIR, f"{job_id}{suffix}")
+
+    @staticmethod
+    def output_path(state: Dict[str, Any]) -> str:
+        return ExportJobs._path(state["id"], f".{state['format']}")
+
+    @staticmethod
+    def points_path(job_id: str) -> str:
+        return ExportJobs._path(job_id, ".points.csv")
+
+    @staticmethod
+    def new_id() -> str:
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        return uuid.uuid4().hex
+
+    @staticmethod
+    def _save(state: Dict[str, Any]) -> None:
+        """Durum dosyasını atomik olarak yazar (yarım yazılmış JSON kalmaz)"""
+        state["updated_at"] = time.time()
+        path = ExportJobs._path(state["id"], ".json")
+        with open(path + ".tmp", "wb") as f:
+            f.write(json_backend.dumps(state))
+        os.replace(path + ".tmp", path)
+
+    @staticmethod
+    def _append(path: str, data: bytes) -> int:
+        """Çıktıya ekler, diske yazar ve yeni dosya uzunluğunu döndürür"""
+        with open(path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            return f.tell()
+
+    @staticmethod
+    def _truncate(path: str, offset: int) -> None:
+        with open(path, "ab") as f:
+            f.truncate(offset)
+
+    @staticmethod
+    def save_points(job_id: str, points: Iterable[Point]) -> int:
+        """JSON ile gelen nokta listesini iş dosyasına yazar; nokta sayısını döndürür"""
+        count = 0
+        with open(ExportJobs.points_path(job_id), "w", encoding="utf-8") as f:
+            for lat, lon in points:
+                f.write(f"{lat},{lon}\n")
+                count += 1
+        return count
+
+    @staticmethod
+    async def save_upload(job_id: str, chunks: AsyncIterator[bytes]) -> int:
+        """
+        Yüklenen "enlem,boylam" satırlarını akış halinde doğrulayıp iş dosyasına yazar
+
+        Gövde belleğe alınmaz. Geçersiz satırda ValueError, sınır aşılırsa
+        ExportLimitError yükselir ve dosya silinir.
+
+        Returns:
+            Nokta sayısı
+        """
+        path = ExportJobs.points_path(job_id)
+        count = 0
+        rest = b""
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                async for chunk in chunks:
+                    lines = (rest + chunk).split(b"\n")
+                    rest = lines.pop()
+                    for line in lines:
+                        point = parse_point(line.decode("utf-8-sig"))
+                        if point is None:
+                            continue
+                        count += 1
+                        if count > EXPORT_MAX_POINTS:
+                            raise ExportLimitError(f"Dışa aktarım en fazla {EXPORT_MAX_POINTS} nokta içerebilir")
+                        f.write(f"{point[0]},{point[1]}\n")
+                point = parse_point(rest.decode("utf-8-sig"))
+                if point is not None:
+                    count += 1
+                    f.write(f"{point[0]},{point[1]}\n")
+        except (ValueError, UnicodeDecodeError):
+            os.remove(path)
+            raise
+        if not count:
+            os.remove(path)
+            raise ValueError("Nokta listesi boş")
+        return count
+
+    @classmethod
+    def create(cls, job_id: str, source: Dict[str, Any], total: int, units: str, format: str) -> Dict[str, Any]:
+        """
+        İşi kaydeder ve arka planda başlatır
+
+        Args:
+            job_id: new_id ile alınan kimlik
+            source: {"bbox": ..., "resolution": ...} veya {"points": True} (nokta dosyası)
+            total: Toplam nokta sayısı
+            units: Birim sistemi
+            format: Çıktı biçimi (ndjson veya csv)
+        """
+        state = {
+            "id": job_id,
+            "status": RUNNING,
+            "format": format,
+            "units": units,
+            "source": source,
+            "total": total,
+            "done": 0,
+            "failed": 0,
+            "offset": 0,
+            "error": None,
+            "created_at": time.time(),
+        }
+        cls._start(state)
+        return cls.progress(job_id)
+
+    @classmethod
+    def load(cls, job_id: str) -> Optional[Dict[str, Any]]:
+        """İşin güncel durumunu döndürür; bilinmeyen kimlik için None"""
+        if not _JOB_ID.match(job_id):
+            return None
+        if job_id in cls._states:
+            return cls._states[job_id]
+        try:
+            with open(cls._path(job_id, ".json"), "rb") as f:
+                state = json_backend.loads(f.read())
+        except FileNotFoundError:
+            return None
+        # Bu süreçte kayıtlı olmayan ya da yaşam sinyali kesilmiş çalışan iş,
+        # kapanan (veya çöken) bir süreçte kalmıştır
+        if state["status"] == RUNNING and (
+            state.get("runner") == _RUNNER
+            or time.time() - (state.get("heartbeat") or 0) > HEARTBEAT_TIMEOUT
+        ):
+            state["status"] = INTERRUPTED
+        return state
+
+    @classmethod
+    def progress(cls, job_id: str) -> Optional[Dict[str, Any]]:
+        """İlerleme özeti: tamamlanan/başarısız nokta, yüzde, hız ve tahmini kalan süre"""
+        state = cls.load(job_id)
+        if state is None:
+            return None
+        total, done = state["total"], state["done"]
+        progress = {
+            "id": state["id"],
+            "status": state["status"],
+            "format": state["format"],
+            "units": state["units"],
+            "total": total,
+            "done": done,
+            "failed": state["failed"],
+            "percent": round(done / total * 100, 1) if total else 100.0,
+            "rate": None,
+            "eta_seconds": None,
+            "error": state["error"],
+        }
+        run = cls._runs.get(job_id)
+        if run is not None and state["status"] == RUNNING:
+            started, done_at_start = run
+            elapsed = time.time() - started
+            if elapsed > 0 and done > done_at_start:
+                rate = (done - done_at_start) / elapsed
+                progress["rate"] = round(rate, 1)
+                progress["eta_seconds"] = round((total - done) / rate, 1)
+        return progress
+
+    @classmethod
+    def resume(cls, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Kesintiye uğramış veya başarısız işi kaldığı yerden sürdürür
+
+        Raises:
+            ValueError: İş çalışıyor veya tamamlanmış
+        """
+        state = cls.load(job_id)
+        if state is None:
+            return None
+        if state["status"] not in (INTERRUPTED, FAILED):
+            raise ValueError(f"İş sürdürülemez (durum: {state['status']})")
+        state["status"] = RUNNING
+        state["error"] = None
+        cls._start(state)
+        return cls.progress(job_id)
+
+    @classmethod
+    def _start(cls, state: Dict[str, Any]) -> None:
+        state["runner"] = _RUNNER
+        state["heartbeat"] = time.time()
+        cls._save(state)
+        cls._states[state["id"]] = state
+        cls._runs[state["id"]] = (time.time(), state["done"])
+        cls._tasks[state["id"]] = asyncio.create_task(cls._run(state))
+
+    @classmethod
+    def _points(cls, state: Dict[str, Any]) -> Iterator[Point]:
+        source = state["source"]
+        if "bbox" in source:
+            return lattice_points(source["bbox"], source["resolution"])
+        return read_points(cls.points_path(state["id"]))
+
+    @classmethod
+    async def _run(cls, state: Dict[str, Any]) -> None:
+        """İşi kayıtlı ilerlemeden sürdürür; her parçadan sonra ilerlemeyi kaydeder"""
+        job_id = state["id"]
+        output = cls.output_path(state)
+        heartbeat = asyncio.create_task(cls._beat(state))
+        try:
+            await asyncio.to_thread(cls._truncate, output, state["offset"])
+            if state["offset"] == 0 and state["format"] == "csv":
+                state["offset"] = await asyncio.to_thread(cls._append, output, encode((), "csv", header=True))
+
+            points = islice(cls._points(state), state["done"], None)
+            async for records in fetch_points(points, state["units"]):
+                offset = await asyncio.to_thread(cls._append, output, encode(records, state["format"]))
+                # Sayaçlar yalnızca parça diske yazıldıktan sonra ilerler
+                state["done"] += len(records)
+                state["failed"] += sum(1 for _, weather_data in records if not weather_data)
+                state["offset"] = offset
+                state["heartbeat"] = time.time()
+                cls._save(state)
+            state["status"] = COMPLETED
+
+        except asyncio.CancelledError:
+            state["status"] = INTERRUPTED
+            raise
+        except Exception as e:
+            logger.error(f"Dışa aktarma işi başarısız ({job_id}): {e}")
+            state["status"] = FAILED
+            state["error"] = str(e)
+        finally:
+            heartbeat.cancel()
+            state["runner"] = None
+            cls._save(state)
+            cls._states.pop(job_id, None)
+            cls._tasks.pop(job_id, None)
+            cls._runs.pop(job_id, None)
+
+    @classmethod
+    async def _beat(cls, state: Dict[str, Any]) -> None:
+        """Upstream yavaşken de işin canlı görünmesi için yaşam sinyalini düzenli yazar"""
+        while True:
+            await asyncio.sleep(EXPORT_HEARTBEAT_SECONDS)
+            state["heartbeat"] = time.time()
+            cls._save(state)
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """Çalışan işleri durdurur; ilerlemeleri kaydedilir ve sonra sürdürülebilir"""
+        for task in list(cls._tasks.values()):
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
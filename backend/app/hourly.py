@@ -0,0 +1,106 @@
+import struct
+import sys
+from array import array
+from typing import Optional, Dict, Any, List, Sequence
+
+import json_backend
+from normalize import HOURLY_KEYS
+
+# İkili saatlik tahmin biçimi:
+#   "WXH1" | başlık uzunluğu (uint32, little-endian) | JSON başlık | float32 sütunlar
+# Başlık boşlukla 4 baytın katına tamamlanır; tarayıcı her sütunu kopyalamadan
+# `new Float32Array(buffer, offset, hours)` ile okuyabilir. Eksik değerler NaN'dır.
+BINARY_MAGIC = b"WXH1"
+BINARY_MEDIA_TYPE = "application/octet-stream"
+
+# Open-Meteo saatlik verisinin adımı (saniye)
+HOURLY_INTERVAL = 3600
+
+_NAN = float("nan")
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def select_hourly(weather_data: Dict[str, Any], days: int,
+                  variables: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Önbellekteki saatlik sütunları istenen gün sayısına ve değişkenlere indirger
+
+    Args:
+        weather_data: Saatlik profil ile alınmış normalize veri
+        days: Döndürülecek gün sayısı (gün başına 24 saat)
+        variables: Servis alanı adları; None ise tüm saatlik değişkenler
+    """
+    hourly = weather_data.get("hourly") or {}
+    hours = days * 24
+    times = (hourly.get("time") or [])[:hours]
+    columns: Dict[str, List[Any]] = {"time": times}
+    for key in (HOURLY_KEYS if variables is None else variables):
+        values = hourly.get(key)
+        if values is not None:
+            columns[key] = values[:hours]
+
+    return {
+        "location": weather_data["location"],
+        "units": weather_data["units"],
+        "updated_at": weather_data["updated_at"],
+        "interval": HOURLY_INTERVAL,
+        "hours": len(times),
+        "hourly": columns,
+    }
+
+
+def _float32(values: Sequence[Any]) -> bytes:
+    try:
+        column = array("f", values)
+    except TypeError:
+        # Eksik değer içeren sütunlar nadirdir; yalnızca onlarda None -> NaN çevrilir
+        column = array("f", [_NAN if value is None else value for value in values])
+    if _BIG_ENDIAN:
+        column.byteswap()
+    return column.tobytes()
+
+
+def encode_binary(forecast: Dict[str, Any]) -> bytes:
+    """
+    `select_hourly` çıktısını ikili biçime çevirir
+
+    Zaman sütunu gönderilmez; başlıktaki `start` ve `interval` ile yeniden
+    oluşturulur. Sütunlar başlıktaki `variables` sırasıyla art arda yazılır.
+    """
+    columns = forecast["hourly"]
+    times = columns["time"]
+    variables = [key for key in columns if key != "time"]
+    header = json_backend.dumps({
+        "location": forecast["location"],
+        "units": forecast["units"],
+        "updated_at": forecast["updated_at"],
+        "start": times[0] if times else None,
+        "interval": forecast["interval"],
+        "hours": forecast["hours"],
+        "variables": variables,
+    })
+    header += b" " * (-(len(BINARY_MAGIC) + 4 + len(header)) % 4)
+
+    parts = [BINARY_MAGIC, struct.pack("<I", len(header)), header]
+    parts.extend(_float32(columns[key]) for key in variables)
+    return b"".join(parts)
+
+
+def decode_binary(data: bytes) -> Dict[str, Any]:
+    """İkili biçimi `select_hourly` düzenine geri çevirir (istemci örneği ve doğrulama için)"""
+    if data[:4] != BINARY_MAGIC:
+        raise ValueError("Geçersiz saatlik tahmin verisi")
+    (length,) = struct.unpack_from("<I", data, 4)
+    offset = 8 + length
+    header = json_backend.loads(data[8:offset])
+
+    hours = header["hourly"] = {}
+    count = header["hours"]
+    for key in header.pop("variables"):
+        column = array("f")
+        column.frombytes(data[offset:offset + count * 4])
+        if _BIG_ENDIAN:
+            column.byteswap()
+        hours[key] = column.tolist()
+        offset += count * 4
+    return header
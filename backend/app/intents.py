@@ -0,0 +1,142 @@
+import re
+from functools import lru_cache
+from typing import Optional, Dict, Iterable, Tuple
+
+from config import CHAT_INTENT_CACHE_SIZE
+from profiles import VariableProfile, WEATHER, WEEKLY as WEEKLY_PROFILE, TOMORROW as TOMORROW_PROFILE
+
+# Sohbet niyetleri
+TODAY = "today"
+TOMORROW = "tomorrow"
+WEEKLY = "weekly"
+
+# Niyet başına anahtar kelimeler (Türkçe ve İngilizce). Eşleşme kelime başında
+# yapılır; "yağmurlu", "rüzgarlı", "forecasts" gibi ekli biçimler de yakalanır.
+# Öncelik sırası: haftalık > yarın > bugün (ör. "yarın ve hafta sonu" haftalıktır).
+KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (WEEKLY, (
+        "hafta", "haftalık", "7 gün", "yedi gün", "önümüzdeki günler", "günlerde",
+        "week", "weekly", "7 day", "7-day", "seven day", "next days", "coming days",
+    )),
+    (TOMORROW, (
+        "yarın", "ertesi gün",
+        "tomorrow",
+    )),
+    (TODAY, (
+        "hava", "sıcaklık", "yağmur", "kar", "karlı", "rüzgar", "bugün", "derece", "soğuk",
+        "sıcak", "nasıl", "durum", "tahmin", "nem", "nemli", "güneş", "bulut", "şemsiye",
+        "weather", "temperature", "rain", "snow", "wind", "today", "degree", "cold",
+        "hot", "forecast", "humid", "sunny", "cloud", "umbrella",
+    )),
+)
+
+# Başka kelimelerin öneki olan kısa kökler ("karar", "hotel", "nemo") yalnızca
+# tam kelime olarak eşleşir
+WHOLE_WORDS = frozenset({"kar", "hot", "nem"})
+
+# Trie'de kelime sonu sınırı gerektiren uç düğüm
+_BOUNDARY = r"\b"
+
+# Türkçe harfler ve büyük/küçük harf farkı eşleşmeyi etkilemesin: "YARIN",
+# "yarin" ve "yarın" aynı anahtar kelimeyle eşleşir. Metni harf harf
+# dönüştürmek yerine, anahtar kelimedeki Türkçe harf desende ASCII karşılığıyla
+# birlikte karakter sınıfı olur ("yarın" -> "yar[iı]n").
+_TURKISH: Dict[str, str] = {"ı": "i", "ş": "s", "ğ": "g", "ü": "u", "ö": "o", "ç": "c"}
+
+# Anahtar kelime içindeki ayraç ("7 gün", "7-day"): metinde herhangi bir
+# ayraç dizisiyle eşleşir ("7-gün", "seven\nday")
+_SEPARATOR = r"\W+"
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Kelimelerden ortak önekleri paylaşan bir regex üretir
+
+    "hava|hafta|haftalık" yerine "ha(?:va|fta(?:l[iı]k)?)" gibi bir desen, regex
+    motorunun her konumda tüm alternatifleri tek tek denemesini önler.
+    WHOLE_WORDS içindeki kelimelerin sonuna kelime sınırı eklenir; kelime
+    içindeki boşluk ve tireler _SEPARATOR olur.
+    """
+    trie: Dict[str, Tuple[set, dict]] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            key = _TURKISH.get(char, char) if char.isalnum() else _SEPARATOR
+            variants, node = node.setdefault(key, (set(), {}))
+            variants.add(char)
+        node[_BOUNDARY if word in WHOLE_WORDS else ""] = (set(), {})
+
+    def build(node: Dict[str, Tuple[set, dict]]) -> str:
+        optional = "" in node
+        branches = []
+        for char, (variants, child) in sorted(node.items()):
+            if not char:
+                continue
+            variants = variants | {char}
+            if char in (_BOUNDARY, _SEPARATOR):
+                head = char
+            elif len(variants) > 1:
+                head = "[" + "".join(sorted(variants)) + "]"
+            else:
+                head = re.escape(char)
+            branches.append(head + build(child))
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if optional:
+            return ("(?:" + body + ")?") if len(branches) > 1 or len(body) > 1 else body + "?"
+        return body
+
+    return build(trie)
+
+
+def _compile(intents: Iterable[str]) -> "re.Pattern[str]":
+    """Verilen niyetlerin anahtar kelimelerini kelime başında arayan desen"""
+    words = [word for intent, group in KEYWORDS if intent in intents for word in group]
+    # Kelime başı: önünde harf/rakam olmayan herhangi bir karakter ("yarın",
+    # ",yarın", "(yarın"). Metnin başına bir boşluk eklendiğinden ilk kelime de
+    # eşleşir. Uzun metinlerde her karakterde `(?<!\w)` ile geriye bakmaktan hızlıdır.
+    return re.compile(r"\W(?:" + _trie_pattern(words) + ")")
+
+
+_INTENTS: Tuple[str, ...] = tuple(intent for intent, _ in KEYWORDS)
+
+# İçe aktarımda bir kez derlenen desenler. Eşleşen metin anahtar kelimenin
+# kendisidir (ekler tüketilmez).
+_ANY = _compile(_INTENTS)
+_PRIORITY = _compile((WEEKLY, TOMORROW))
+_WEEKLY = _compile((WEEKLY,))
+
+# Niyet -> Open-Meteo'dan istenecek değişken kümesi
+PROFILES: Dict[str, VariableProfile] = {
+    TODAY: WEATHER,
+    TOMORROW: TOMORROW_PROFILE,
+    WEEKLY: WEEKLY_PROFILE,
+}
+
+
+@lru_cache(maxsize=CHAT_INTENT_CACHE_SIZE)
+def classify(message: str) -> Optional[str]:
+    """
+    Mesajın sohbet niyetini döndürür; hava durumu ile ilgili değilse None
+
+    Birden fazla niyet geçerse en yüksek öncelikli olan seçilir. Metin bir kez
+    taranır; ilk eşleşme bugün niyetiyse yalnızca geri kalanında haftalık/yarın
+    aranır. Arayüzdeki hazır sorular gibi tekrar eden mesajlar için sonuç
+    önbellekten döner (mesaj uzunluğu ChatRequest'te sınırlıdır).
+    """
+    text = " " + message.lower()
+    # `str.lower()` "İ" harfini "i" + birleşik nokta (U+0307) yapar
+    if not text.isascii() and "\u0307" in text:
+        text = text.replace("\u0307", "")
+
+    match = _ANY.search(text)
+    if match is None:
+        return None
+    start = match.start()
+    if _PRIORITY.match(text, start) is None:
+        match = _PRIORITY.search(text, match.end())
+        if match is None:
+            return TODAY
+        start = match.start()
+    return WEEKLY if _WEEKLY.search(text, start) else TOMORROW
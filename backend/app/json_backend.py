@@ -0,0 +1,39 @@
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+# orjson kuruluysa hızlı yol kullanılır; değilse standart `json` modülüne düşülür
+try:
+    import orjson
+except ImportError:  # pragma: no cover - isteğe bağlı bağımlılık
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Any) -> Any:
+    """JSON gövdesini (bytes veya str) çözümler"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(content: Any) -> bytes:
+    """İçeriği sıkıştırılmış UTF-8 JSON baytlarına dönüştürür"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """Seçili JSON arka ucuyla (orjson veya json) render eden yanıt sınıfı"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
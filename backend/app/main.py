@@ -1,17 +1,55 @@
 import os
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 from datetime import datetime
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Iterator, List, Optional, Tuple, Union
 
 from weather_service import WeatherService
-from models import WeatherRequest, WeatherResponse, ChatRequest, ChatResponse
+from tiles import TileService
+from profiles import VariableProfile, WEATHER, WEEKLY, TOMORROW, hourly_profile
+import conditional
+import export
+import intents
+import summaries
+from models import (
+    WeatherRequest, WeatherResponse, BatchWeatherItem, ChatRequest, ChatResponse, HourlyForecastRequest, ExportRequest,
+    CompactWeatherResponse, CompactBatchWeatherResponse
+)
+from config import (
+    BATCH_MAX_ITEMS,
+    EXPORT_MAX_POINTS,
+    METRICS_ENABLED,
+    COMPRESSION_ENABLED,
+    COMPRESSION_MIN_SIZE,
+    COMPRESSION_GZIP_LEVEL,
+    COMPRESSION_BROTLI_QUALITY,
+)
+from json_backend import FastJSONResponse, dumps
+from metrics import REGISTRY, CONTENT_TYPE, MetricsMiddleware
+from compression import CompressionMiddleware
+from normalize import COMPACT_KEYS, HOURLY_KEYS, compact_weather
+from hourly import BINARY_MEDIA_TYPE, encode_binary, select_hourly
 
 load_dotenv()
 
 ALLOWED_ORIGINS = [o.strip() for o in os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")]
 
-app = FastAPI(title="Weather API")
+# Proxy'lerin (ör. nginx) akışı tamponlamaması için
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Paylaşılan HTTP bağlantı havuzunu uygulama ömrü boyunca açık tutar"""
+    await WeatherService.startup()
+    yield
+    # Dışa aktarma işleri bağlantı havuzu kapanmadan durdurulur; ilerlemeleri kaydedilir
+    await export.ExportJobs.shutdown()
+    await WeatherService.shutdown()
+
+app = FastAPI(title="Weather API", lifespan=lifespan, default_response_class=FastJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,22 +59,182 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=COMPRESSION_MIN_SIZE,
+        gzip_level=COMPRESSION_GZIP_LEVEL,
+        brotli_quality=COMPRESSION_BROTLI_QUALITY,
+    )
+
+if METRICS_ENABLED:
+    # En dışta çalışsın diye en son eklenir; CORS dahil tüm süre ölçülür
+    app.add_middleware(MetricsMiddleware)
+
+def collect_service_metrics():
+    """Önbellek ve upstream sayaçlarını /metrics için servislerden okur"""
+    caches = {"tiles": TileService.cache_stats()}
+    forecast = WeatherService.cache_stats()
+    if forecast.get("enabled"):
+        caches["forecast"] = forecast
+    caches["summaries"] = forecast["summaries"]
+    
+    yield "weather_cache_hit_ratio", "gauge", "Önbellek isabet oranı", [
+        ({"cache": name}, stats["hit_ratio"]) for name, stats in caches.items()
+    ]
+    yield "weather_cache_entries", "gauge", "Önbellekteki kayıt sayısı", [
+        ({"cache": name}, stats["entries"]) for name, stats in caches.items()
+    ]
+    yield "weather_cache_lookups_total", "counter", "Önbellek aramaları (sonuca göre)", [
+        ({"cache": name, "result": result}, stats.get(key))
+        for name, stats in caches.items()
+        for result, key in (("hit", "hits"), ("stale", "stale_hits"), ("miss", "misses"))
+    ]
+    if "disk" in forecast:
+        disk = forecast["disk"]
+        yield "weather_disk_cache_lookups_total", "counter", "Disk önbelleği aramaları", [
+            ({"result": "hit"}, disk["hits"]),
+            ({"result": "miss"}, disk["misses"]),
+        ]
+    
+    upstream = WeatherService.upstream_stats()
+    concurrency = upstream["concurrency"]
+    yield "weather_upstream_in_flight", "gauge", "Devam eden Open-Meteo istekleri", [({}, concurrency["in_flight"])]
+    yield "weather_upstream_queue_depth", "gauge", "Eşzamanlılık kuyruğunda bekleyen istekler", [({}, concurrency["queue_depth"])]
+    yield "weather_upstream_queue_timeouts_total", "counter", "Kuyrukta zaman aşımına uğrayan istekler", [({}, concurrency["queue_timeouts"])]
+    breaker = upstream["breaker"]
+    yield "weather_upstream_breaker_open", "gauge", "Devre kesici açık mı (1) / yarı açık (0.5) / kapalı (0)", [
+        ({}, {"open": 1, "half_open": 0.5}.get(breaker["state"], 0))
+    ]
+    yield "weather_upstream_breaker_rejected_total", "counter", "Devre kesicinin reddettiği istekler", [({}, breaker["rejected"])]
+    budget = upstream["retry_budget"]
+    yield "weather_upstream_retries_total", "counter", "Yapılan yeniden denemeler", [({}, budget["spent"])]
+    yield "weather_upstream_retry_budget_tokens", "gauge", "Kalan yeniden deneme jetonu", [({}, budget["tokens"])]
+
+REGISTRY.add_collector(collect_service_metrics)
+
+def trusted_response(content: Any) -> FastJSONResponse:
+    """
+    WeatherService'in ürettiği veriyi yeniden doğrulamadan tek seferde serileştirir
+    
+    Servis çıktısı models içindeki yanıt modelleriyle birebir uyumludur; uç noktalardaki
+    response_model yalnızca OpenAPI şeması için kullanılır. FastAPI, Response nesnesi
+    döndürüldüğünde ikinci bir doğrulama ve serileştirme yapmaz.
+    """
+    return FastJSONResponse(content=content)
+
+def conditional_response(if_none_match: Optional[str], etag: str, expires_at: Optional[float],
+                         build: Callable[[], Response]) -> Response:
+    """
+    ETag ve Cache-Control başlıklı yanıt döndürür
+    
+    İstemcinin `If-None-Match` başlığı ETag ile eşleşirse `build` çağrılmaz;
+    gövde oluşturulmadan ve serileştirilmeden 304 Not Modified döner.
+    """
+    headers = conditional.cache_headers(etag, expires_at)
+    if conditional.etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response = build()
+    response.headers.update(headers)
+    return response
+
+def validate_weather_format(format: str) -> None:
+    """Hava durumu yanıt biçimini doğrular (geçersizse 400)"""
+    if format not in ("json", "compact"):
+        raise HTTPException(status_code=400, detail="Geçersiz biçim (json veya compact olmalı)")
+
+def for_profile(weather_data: dict, profile: VariableProfile) -> dict:
+    """
+    Profil günlük tahmin istemiyorsa yanıtta `forecast` null döner
+    
+    Veri daha geniş bir profilin önbellek kaydından gelse de yanıt biçimi aynı kalır;
+    eksik sütunlu (yarısı null) tahmin satırları gönderilmez.
+    """
+    if profile.has_forecast:
+        return weather_data
+    return {**weather_data, "forecast": None}
+
+def weather_payload(weather_data: dict, format: str) -> dict:
+    """`format=compact` ise alan adları tek başlıkta, değerler dizilerde döner"""
+    return compact_weather(weather_data) if format == "compact" else weather_data
+
+def validate_hourly_request(format: str, variables: Optional[List[str]]) -> None:
+    """Saatlik tahmin biçimini ve değişken adlarını doğrular (geçersizse 400)"""
+    if format not in ("json", "binary"):
+        raise HTTPException(status_code=400, detail="Geçersiz biçim (json veya binary olmalı)")
+    if variables is not None:
+        unknown = [key for key in variables if key not in HOURLY_KEYS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Bilinmeyen saatlik değişken: {', '.join(unknown)}")
+
+async def fetch_for_intent(request: ChatRequest, intent: str) -> Optional[dict]:
+    """Niyetin ihtiyaç duyduğu değişken kümesini tek istekle (önbellek/single-flight) alır"""
+    return await WeatherService.get_weather_by_coordinates(
+        request.latitude,
+        request.longitude,
+        request.units,
+        intents.PROFILES[intent]
+    )
+
+def iter_chat_reply(request: ChatRequest, intent: str, weather_data: Optional[dict]) -> Iterator[str]:
+    """Niyete göre bugünün özeti, yarın tahmini veya haftalık tahmin metnini üretir"""
+    if intent == intents.WEEKLY:
+        return WeatherService.iter_weekly_forecast(weather_data, request.units, request.language)
+    if intent == intents.TOMORROW:
+        return WeatherService.iter_tomorrow_forecast(weather_data, request.units, request.language)
+    return WeatherService.iter_weather_summary(
+        weather_data, request.latitude, request.longitude, request.units, request.language
+    )
+
+def sse_event(event: str, data: Any) -> bytes:
+    """Tek bir Server-Sent Events kaydı üretir; veri JSON olarak tek satıra yazılır"""
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+def sse_response(events: AsyncIterator[bytes]) -> StreamingResponse:
+    return StreamingResponse(events, media_type="text/event-stream", headers=SSE_HEADERS)
+
 @app.get("/health")
 async def health():
     return {"status": "ok", "message": "Weather API is running"}
 
+@app.get("/cache/stats")
+async def cache_stats():
+    """Tahmin önbelleğinin isabet/ıskalama/tahliye sayaçlarını döndürür"""
+    return {**WeatherService.cache_stats(), "tiles": TileService.cache_stats()}
+
+@app.get("/upstream/stats")
+async def upstream_stats():
+    """Open-Meteo devre kesici durumu, kuyruk derinliği ve yeniden deneme bütçesini döndürür"""
+    return WeatherService.upstream_stats()
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metin biçiminde metrikleri döndürür"""
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrikler kapalı")
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
 @app.get("/")
 async def root():
     return {"message": "Hava Durumu API - Weather data is provided via external APIs (Open-Meteo)"}
 
-@app.post("/weather", response_model=WeatherResponse)
-async def get_weather(request: WeatherRequest):
-    """Koordinatlara göre hava durumu verilerini döndürür"""
+@app.post("/weather", response_model=Union[WeatherResponse, CompactWeatherResponse])
+async def get_weather(request: WeatherRequest,
+                      format: str = Query("json", description="Yanıt biçimi (json veya compact)")):
+    """
+    Koordinatlara göre hava durumu verilerini döndürür
+    
+    `format=compact` ile `current`, `today` ve `forecast` alan adları yerine
+    değer dizileri ve tek bir `keys` başlığı döner.
+    """
+    validate_weather_format(format)
+    
     try:
         weather_data = await WeatherService.get_weather_by_coordinates(
             request.latitude, 
             request.longitude, 
-            request.units
+            request.units,
+            WEATHER
         )
         
         if not weather_data:
@@ -45,64 +243,178 @@ async def get_weather(request: WeatherRequest):
                 detail="Hava durumu verileri şu anda alınamıyor"
             )
         
-        return WeatherResponse(**weather_data)
+        return trusted_response(weather_payload(for_profile(weather_data, WEATHER), format))
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Hava durumu verileri alınırken hata oluştu: {str(e)}"
         )
 
-@app.post("/chat/weather", response_model=ChatResponse)
-async def chat_weather(request: ChatRequest):
-    """Sohbet için hava durumu bilgisi döndürür"""
+@app.get("/weather", response_model=Union[WeatherResponse, CompactWeatherResponse])
+async def get_weather_conditional(
+    lat: float = Query(..., ge=-90, le=90, description="Enlem (-90 ile 90 arası)"),
+    lon: float = Query(..., ge=-180, le=180, description="Boylam (-180 ile 180 arası)"),
+    units: str = Query("metric", description="Birim sistemi (metric veya imperial)"),
+    format: str = Query("json", description="Yanıt biçimi (json veya compact)"),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """
+    POST /weather'ın önbelleklenebilir GET karşılığı
+    
+    Yanıt ETag (upstream `current.time` + ızgara hücresi) ve bir sonraki veri
+    güncellemesine kadar geçerli `Cache-Control: max-age` taşır. ETag eşleşirse
+    gövdesiz 304 döner.
+    """
+    validate_weather_format(format)
+    
     try:
-        # Kullanıcının mesajını analiz et
-        message = request.message.lower()
+        weather_data = await WeatherService.get_weather_by_coordinates(lat, lon, units, WEATHER)
         
-        # Hava durumu ile ilgili anahtar kelimeler
-        weather_keywords = [
-            "hava", "sıcaklık", "yağmur", "kar", "rüzgar", "bugün", "weather", 
-            "derece", "soğuk", "sıcak", "nasıl", "durum"
-        ]
+        if not weather_data:
+            raise HTTPException(
+                status_code=503,
+                detail="Hava durumu verileri şu anda alınamıyor"
+            )
         
-        is_weather_request = any(keyword in message for keyword in weather_keywords)
+        return conditional_response(
+            if_none_match,
+            conditional.forecast_etag(weather_data, "weather", format),
+            WeatherService.expires_at(weather_data, WEATHER),
+            lambda: trusted_response(weather_payload(for_profile(weather_data, WEATHER), format))
+        )
         
-        if is_weather_request:
-            # Hava durumu verilerini al
-            weather_summary = await WeatherService.get_weather_summary(
-                request.latitude,
-                request.longitude,
-                request.units
-            )
-            
-            # Ayrıntılı veri de al
-            weather_data = await WeatherService.get_weather_by_coordinates(
-                request.latitude,
-                request.longitude,
-                request.units
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Hava durumu verileri alınırken hata oluştu: {str(e)}"
+        )
+
+@app.post("/weather/batch", response_model=Union[List[BatchWeatherItem], CompactBatchWeatherResponse])
+async def get_weather_batch(items: List[WeatherRequest],
+                            format: str = Query("json", description="Yanıt biçimi (json veya compact)")):
+    """
+    Birden çok konum için hava durumu verilerini girdi sırasıyla döndürür
+    
+    `format=compact` ile yanıt `{"keys": ..., "items": [...]}` olur; alan adları
+    konum başına değil, yanıtta bir kez yazılır.
+    """
+    validate_weather_format(format)
+    if len(items) > BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Toplu istek en fazla {BATCH_MAX_ITEMS} konum içerebilir"
+        )
+    
+    try:
+        results = [
+            for_profile(weather_data, WEATHER) if weather_data else None
+            for weather_data in await WeatherService.get_weather_batch(
+                [(item.latitude, item.longitude, item.units) for item in items],
+                WEATHER
             )
-            
-            response_text = weather_summary or "Hava durumu verileri şu anda mevcut değil."
-            weather_response = WeatherResponse(**weather_data) if weather_data else None
+        ]
+        
+        if format == "compact":
+            return trusted_response({
+                "keys": COMPACT_KEYS,
+                "items": [
+                    {"data": compact_weather(weather_data, header=False), "error": None}
+                    if weather_data else
+                    {"data": None, "error": "Hava durumu verileri şu anda alınamıyor"}
+                    for weather_data in results
+                ]
+            })
+        
+        return trusted_response([
+            {"data": weather_data, "error": None}
+            if weather_data else
+            {"data": None, "error": "Hava durumu verileri şu anda alınamıyor"}
+            for weather_data in results
+        ])
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Toplu hava durumu verileri alınırken hata oluştu: {str(e)}"
+        )
+
+@app.post("/chat/weather", response_model=ChatResponse)
+async def chat_weather(request: ChatRequest):
+    """
+    Sohbet için hava durumu bilgisi döndürür
+    
+    Mesajın niyeti (bugün, yarın, haftalık) belirlenir; niyetin değişken kümesi
+    tek seferde alınır ve metin aynı veriden üretilir. Hava durumu ile ilgili
+    olmayan mesajlar WeatherService'e uğramadan yanıtlanır.
+    """
+    try:
+        intent = intents.classify(request.message)
+        
+        if intent is not None:
+            weather_data = await fetch_for_intent(request, intent)
+            response_text = "".join(iter_chat_reply(request, intent, weather_data))
+            weather_response = for_profile(weather_data, intents.PROFILES[intent]) if weather_data else None
             
         else:
             # Hava durumu ile ilgili değilse genel yanıt ver
-            response_text = "Merhaba! Ben bir hava durumu asistanıyım. 🌤️ Bugünün hava durumu hakkında bilgi almak için 'bugün hava nasıl?' gibi sorular sorabilirsiniz."
+            response_text = summaries.general_reply(request.language)
             weather_response = None
         
-        return ChatResponse(
-            response=response_text,
-            weather_data=weather_response,
-            timestamp=datetime.now().isoformat()
-        )
+        return trusted_response({
+            "response": response_text,
+            "weather_data": weather_response,
+            "timestamp": datetime.now().isoformat()
+        })
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Sohbet işlemi sırasında hata oluştu: {str(e)}"
         )
 
+@app.post("/chat/weather/stream")
+async def chat_weather_stream(request: ChatRequest):
+    """
+    Sohbet yanıtını Server-Sent Events olarak akıtır
+    
+    Olaylar: `meta` (hemen), metnin her bölümü için `chunk`, ardından `weather_data`
+    ve `done`. `chunk` metinlerinin birleşimi /chat/weather yanıtıyla aynıdır.
+    `meta` içindeki `intent` mesajın niyetidir (today, tomorrow, weekly veya null).
+    """
+    intent = intents.classify(request.message)
+    meta = {
+        "location": {"latitude": request.latitude, "longitude": request.longitude},
+        "units": request.units,
+        "intent": intent,
+    }
+    
+    async def events() -> AsyncIterator[bytes]:
+        try:
+            yield sse_event("meta", meta)
+            if intent is None:
+                yield sse_event("chunk", {"text": summaries.general_reply(request.language)})
+                yield sse_event("done", {"timestamp": datetime.now().isoformat()})
+                return
+            
+            weather_data = await fetch_for_intent(request, intent)
+            for chunk in iter_chat_reply(request, intent, weather_data):
+                yield sse_event("chunk", {"text": chunk})
+            yield sse_event("weather_data", for_profile(weather_data, intents.PROFILES[intent]) if weather_data else None)
+            yield sse_event("done", {"timestamp": datetime.now().isoformat()})
+        except Exception as e:
+            yield sse_event("error", {"detail": f"Sohbet işlemi sırasında hata oluştu: {str(e)}"})
+    
+    return sse_response(events())
+
 @app.post("/forecast/weekly")
 async def get_weekly_forecast(request: WeatherRequest):
     """7 günlük hava tahmini döndürür"""
@@ -110,7 +422,8 @@ async def get_weekly_forecast(request: WeatherRequest):
         forecast_text = await WeatherService.get_weekly_forecast(
             request.latitude, 
             request.longitude, 
-            request.units
+            request.units,
+            language=request.language
         )
         
         if not forecast_text:
@@ -129,12 +442,93 @@ async def get_weekly_forecast(request: WeatherRequest):
             "timestamp": datetime.now().isoformat()
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Haftalık tahmin alınırken hata oluştu: {str(e)}"
         )
 
+@app.get("/forecast/weekly")
+async def get_weekly_forecast_conditional(
+    lat: float = Query(..., ge=-90, le=90, description="Enlem (-90 ile 90 arası)"),
+    lon: float = Query(..., ge=-180, le=180, description="Boylam (-180 ile 180 arası)"),
+    units: str = Query("metric", description="Birim sistemi (metric veya imperial)"),
+    language: str = Query("tr", description="Metin yanıtlarının dili (tr veya en)"),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """
+    POST /forecast/weekly'nin önbelleklenebilir GET karşılığı
+    
+    `timestamp` isteğin değil verinin güncellenme zamanıdır; aynı veri için
+    gövde değişmez. ETag eşleşirse metin hiç oluşturulmadan 304 döner.
+    """
+    try:
+        weather_data = await WeatherService.get_weather_by_coordinates(lat, lon, units, WEEKLY)
+        
+        if not weather_data:
+            raise HTTPException(
+                status_code=503,
+                detail="Haftalık tahmin verileri şu anda alınamıyor"
+            )
+        
+        def build() -> Response:
+            return trusted_response({
+                "forecast": "".join(WeatherService.iter_weekly_forecast(weather_data, units, language)),
+                "location": {
+                    "latitude": lat,
+                    "longitude": lon
+                },
+                "units": units,
+                "timestamp": weather_data["updated_at"]
+            })
+        
+        return conditional_response(
+            if_none_match,
+            conditional.forecast_etag(weather_data, "weekly", language),
+            WeatherService.expires_at(weather_data, WEEKLY),
+            build
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Haftalık tahmin alınırken hata oluştu: {str(e)}"
+        )
+
+@app.post("/forecast/weekly/stream")
+async def stream_weekly_forecast(request: WeatherRequest):
+    """
+    7 günlük tahmini Server-Sent Events olarak akıtır
+    
+    Önce `meta`, veri geldikten sonra başlık ve her gün için bir `chunk`, en son
+    `done` gönderilir. Veri alınamazsa `error` olayı gönderilir.
+    """
+    meta = {"location": {"latitude": request.latitude, "longitude": request.longitude}, "units": request.units}
+    
+    async def events() -> AsyncIterator[bytes]:
+        try:
+            yield sse_event("meta", meta)
+            weather_data = await WeatherService.get_weather_by_coordinates(
+                request.latitude,
+                request.longitude,
+                request.units,
+                WEEKLY
+            )
+            if not weather_data:
+                yield sse_event("error", {"detail": "Haftalık tahmin verileri şu anda alınamıyor"})
+                return
+            for chunk in WeatherService.iter_weekly_forecast(weather_data, request.units, request.language):
+                yield sse_event("chunk", {"text": chunk})
+            yield sse_event("done", {"timestamp": datetime.now().isoformat()})
+        except Exception as e:
+            yield sse_event("error", {"detail": f"Haftalık tahmin alınırken hata oluştu: {str(e)}"})
+    
+    return sse_response(events())
+
 @app.post("/forecast/tomorrow")
 async def get_tomorrow_forecast(request: WeatherRequest):
     """Yarın için hava durumu tahmini"""
@@ -142,7 +536,8 @@ async def get_tomorrow_forecast(request: WeatherRequest):
         tomorrow_forecast = await WeatherService.get_tomorrow_forecast(
             request.latitude,
             request.longitude,
-            request.units
+            request.units,
+            language=request.language
         )
         
         if not tomorrow_forecast:
@@ -161,8 +556,284 @@ async def get_tomorrow_forecast(request: WeatherRequest):
             "timestamp": datetime.now().isoformat()
         }
         
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Yarın tahmini alınırken hata oluştu: {str(e)}"
+        )
+
+@app.get("/forecast/tomorrow")
+async def get_tomorrow_forecast_conditional(
+    lat: float = Query(..., ge=-90, le=90, description="Enlem (-90 ile 90 arası)"),
+    lon: float = Query(..., ge=-180, le=180, description="Boylam (-180 ile 180 arası)"),
+    units: str = Query("metric", description="Birim sistemi (metric veya imperial)"),
+    language: str = Query("tr", description="Metin yanıtlarının dili (tr veya en)"),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """POST /forecast/tomorrow'un önbelleklenebilir GET karşılığı (bkz. GET /forecast/weekly)"""
+    try:
+        weather_data = await WeatherService.get_weather_by_coordinates(lat, lon, units, TOMORROW)
+        
+        if not weather_data:
+            raise HTTPException(
+                status_code=404,
+                detail="Yarın hava tahmini alınamadı"
+            )
+        
+        def build() -> Response:
+            return trusted_response({
+                "forecast": "".join(WeatherService.iter_tomorrow_forecast(weather_data, units, language)),
+                "location": {
+                    "latitude": lat,
+                    "longitude": lon
+                },
+                "units": units,
+                "timestamp": weather_data["updated_at"]
+            })
+        
+        return conditional_response(
+            if_none_match,
+            conditional.forecast_etag(weather_data, "tomorrow", language),
+            WeatherService.expires_at(weather_data, TOMORROW),
+            build
+        )
+        
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Yarın tahmini alınırken hata oluştu: {str(e)}"
         )
+
+@app.post("/forecast/hourly")
+async def get_hourly_forecast(request: HourlyForecastRequest):
+    """
+    En fazla 16 günlük saatlik tahmini sütun dizileri olarak döndürür
+    
+    `format=binary` ile JSON başlık ve float32 sütunlardan oluşan ikili biçim
+    döner (bkz. hourly.encode_binary).
+    """
+    validate_hourly_request(request.format, request.variables)
+    
+    try:
+        forecast = await WeatherService.get_hourly_forecast(
+            request.latitude,
+            request.longitude,
+            request.units,
+            request.days,
+            request.variables
+        )
+        
+        if forecast is None:
+            raise HTTPException(
+                status_code=404,
+                detail="Saatlik hava tahmini alınamadı"
+            )
+        
+        if request.format == "binary":
+            return Response(content=encode_binary(forecast), media_type=BINARY_MEDIA_TYPE)
+        return trusted_response(forecast)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Saatlik tahmin alınırken hata oluştu: {str(e)}"
+        )
+
+@app.get("/forecast/hourly")
+async def get_hourly_forecast_conditional(
+    lat: float = Query(..., ge=-90, le=90, description="Enlem (-90 ile 90 arası)"),
+    lon: float = Query(..., ge=-180, le=180, description="Boylam (-180 ile 180 arası)"),
+    units: str = Query("metric", description="Birim sistemi (metric veya imperial)"),
+    days: int = Query(7, ge=1, le=16, description="Gün sayısı (1-16)"),
+    variables: Optional[str] = Query(None, description="Virgülle ayrılmış saatlik değişkenler (boşsa tümü)"),
+    format: str = Query("json", description="Yanıt biçimi (json veya binary)"),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """POST /forecast/hourly'nin önbelleklenebilir GET karşılığı (bkz. GET /weather)"""
+    selected = [key.strip() for key in variables.split(",") if key.strip()] if variables else None
+    validate_hourly_request(format, selected)
+    profile = hourly_profile(days)
+    
+    try:
+        weather_data = await WeatherService.get_weather_by_coordinates(lat, lon, units, profile)
+        
+        if not weather_data:
+            raise HTTPException(
+                status_code=404,
+                detail="Saatlik hava tahmini alınamadı"
+            )
+        
+        def build() -> Response:
+            forecast = select_hourly(weather_data, days, selected)
+            if format == "binary":
+                return Response(content=encode_binary(forecast), media_type=BINARY_MEDIA_TYPE)
+            return trusted_response(forecast)
+        
+        return conditional_response(
+            if_none_match,
+            conditional.forecast_etag(weather_data, "hourly", days, tuple(selected or ()), format),
+            WeatherService.expires_at(weather_data, profile),
+            build
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Saatlik tahmin alınırken hata oluştu: {str(e)}"
+        )
+
+@app.get("/tiles/{z}/{x}/{y}")
+async def get_weather_tile(z: int, x: int, y: int, units: str = "metric",
+                           if_none_match: Optional[str] = Header(default=None)):
+    """
+    Slippy-map karosu için mevcut hava durumu ızgarasını döndürür
+    
+    Yanıt ETag ve karo önbelleğinin süresine göre `Cache-Control` taşır; harita
+    yeniden sorgulandığında ETag eşleşirse gövdesiz 304 döner.
+    """
+    if not TileService.is_valid_tile(z, x, y):
+        raise HTTPException(status_code=404, detail="Geçersiz karo koordinatları")
+    
+    try:
+        tile = await TileService.get_weather_tile(z, x, y, units)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Karo verileri alınırken hata oluştu: {str(e)}"
+        )
+    
+    if not tile:
+        raise HTTPException(
+            status_code=503,
+            detail="Karo verileri şu anda alınamıyor"
+        )
+    
+    return conditional_response(
+        if_none_match,
+        conditional.make_etag("tile", z, x, y, units, tile["time"], tile["updated_at"]),
+        TileService.expires_at(z, x, y, units),
+        lambda: trusted_response(tile)
+    )
+
+def validate_export_format(format: str) -> None:
+    """Dışa aktarma biçimini doğrular (geçersizse 400)"""
+    if format not in export.EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Geçersiz biçim (ndjson veya csv olmalı)")
+
+def export_source(request: ExportRequest) -> Tuple[Any, int]:
+    """
+    Talebi nokta kaynağına dönüştürür: ({"bbox", "resolution"}, nokta sayısı) veya
+    (doğrulanmış nokta listesi, nokta sayısı)
+    """
+    validate_export_format(request.format)
+    if (request.bbox is None) == (request.points is None):
+        raise HTTPException(status_code=400, detail="bbox + resolution veya points alanlarından biri verilmeli")
+    
+    try:
+        if request.bbox is not None:
+            if request.resolution is None:
+                raise HTTPException(status_code=400, detail="bbox ile birlikte resolution verilmeli")
+            bbox = request.bbox.model_dump()
+            rows, cols = export.lattice_shape(bbox, request.resolution)
+            total = rows * cols
+            if total > EXPORT_MAX_POINTS:
+                raise export.ExportLimitError(f"Dışa aktarım en fazla {EXPORT_MAX_POINTS} nokta içerebilir")
+            return {"bbox": bbox, "resolution": request.resolution}, total
+        
+        points = export.validate_points(request.points)
+        return points, len(points)
+    
+    except export.ExportLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/export")
+async def export_region(request: ExportRequest):
+    """
+    Sınır kutusu ızgarası veya nokta listesi için tahminleri NDJSON/CSV olarak akıtır
+    
+    Noktalar BATCH_CHUNK_SIZE büyüklüğünde parçalarla, aynı anda en fazla
+    EXPORT_CONCURRENCY parça çekilir; bellek kullanımı nokta sayısından bağımsızdır.
+    Kesintiye dayanıklı uzun dışa aktarımlar için /export/jobs kullanılmalıdır.
+    """
+    source, total = export_source(request)
+    points = export.lattice_points(source["bbox"], source["resolution"]) if isinstance(source, dict) else source
+    
+    return StreamingResponse(
+        export.stream_export(points, request.units, request.format),
+        media_type=export.MEDIA_TYPES[request.format],
+        headers={
+            "Content-Disposition": f'attachment; filename="export.{request.format}"',
+            "X-Export-Points": str(total),
+        }
+    )
+
+@app.post("/export/jobs", status_code=202)
+async def create_export_job(request: ExportRequest):
+    """Dışa aktarmayı sürdürülebilir bir arka plan işi olarak başlatır ve ilerlemesini döndürür"""
+    source, total = export_source(request)
+    job_id = export.ExportJobs.new_id()
+    if not isinstance(source, dict):
+        export.ExportJobs.save_points(job_id, source)
+        source = {"points": True}
+    return export.ExportJobs.create(job_id, source, total, request.units, request.format)
+
+@app.post("/export/jobs/upload", status_code=202)
+async def upload_export_job(request: Request, units: str = "metric", format: str = "ndjson"):
+    """
+    Gövdede yüklenen nokta listesi için dışa aktarma işi başlatır
+    
+    Gövde her satırda "enlem,boylam" içeren düz metin/CSV'dir; başlık satırı ve
+    `#` ile başlayan satırlar atlanır. Gövde belleğe alınmadan diske yazılır.
+    """
+    validate_export_format(format)
+    job_id = export.ExportJobs.new_id()
+    try:
+        total = await export.ExportJobs.save_upload(job_id, request.stream())
+    except export.ExportLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return export.ExportJobs.create(job_id, {"points": True}, total, units, format)
+
+@app.get("/export/jobs/{job_id}")
+async def get_export_job(job_id: str):
+    """İşin durumunu ve ilerlemesini (yüzde, hız, tahmini kalan süre) döndürür"""
+    progress = export.ExportJobs.progress(job_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Dışa aktarma işi bulunamadı")
+    return progress
+
+@app.post("/export/jobs/{job_id}/resume", status_code=202)
+async def resume_export_job(job_id: str):
+    """Kesintiye uğramış veya başarısız işi kaldığı yerden sürdürür"""
+    try:
+        progress = export.ExportJobs.resume(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Dışa aktarma işi bulunamadı")
+    return progress
+
+@app.get("/export/jobs/{job_id}/download")
+async def download_export_job(job_id: str):
+    """Tamamlanmış işin çıktı dosyasını döndürür"""
+    state = export.ExportJobs.load(job_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="Dışa aktarma işi bulunamadı")
+    if state["status"] != export.COMPLETED:
+        raise HTTPException(status_code=409, detail=f"İş henüz tamamlanmadı (durum: {state['status']})")
+    return FileResponse(
+        export.ExportJobs.output_path(state),
+        media_type=export.MEDIA_TYPES[state["format"]],
+        filename=f"export-{job_id}.{state['format']}"
+    )
@@ -1,12 +1,39 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Any, Optional, List
 from datetime import datetime
 
+from config import CHAT_MESSAGE_MAX_LENGTH
+
 class WeatherRequest(BaseModel):
     """Hava durumu talebi modeli"""
     latitude: float = Field(..., ge=-90, le=90, description="Enlem (-90 ile 90 arası)")
     longitude: float = Field(..., ge=-180, le=180, description="Boylam (-180 ile 180 arası)")
     units: str = Field(default="metric", description="Birim sistemi (metric veya imperial)")
+    language: str = Field(default="tr", description="Metin yanıtlarının dili (tr veya en)")
+
+class HourlyForecastRequest(BaseModel):
+    """Saatlik tahmin talebi modeli"""
+    latitude: float = Field(..., ge=-90, le=90, description="Enlem (-90 ile 90 arası)")
+    longitude: float = Field(..., ge=-180, le=180, description="Boylam (-180 ile 180 arası)")
+    units: str = Field(default="metric", description="Birim sistemi (metric veya imperial)")
+    days: int = Field(default=7, ge=1, le=16, description="Gün sayısı (1-16)")
+    variables: Optional[List[str]] = Field(default=None, description="Saatlik değişkenler (boşsa tümü)")
+    format: str = Field(default="json", description="Yanıt biçimi (json veya binary)")
+
+class BoundingBox(BaseModel):
+    """Coğrafi sınır kutusu (derece)"""
+    south: float = Field(..., ge=-90, le=90, description="Güney enlemi")
+    west: float = Field(..., ge=-180, le=180, description="Batı boylamı")
+    north: float = Field(..., ge=-90, le=90, description="Kuzey enlemi")
+    east: float = Field(..., ge=-180, le=180, description="Doğu boylamı")
+
+class ExportRequest(BaseModel):
+    """Toplu bölge dışa aktarma talebi modeli (bbox + çözünürlük veya nokta listesi)"""
+    bbox: Optional[BoundingBox] = Field(default=None, description="Izgarası çıkarılacak sınır kutusu")
+    resolution: Optional[float] = Field(default=None, gt=0, description="Izgara aralığı (derece)")
+    points: Optional[List[List[float]]] = Field(default=None, description="[enlem, boylam] listesi")
+    units: str = Field(default="metric", description="Birim sistemi (metric veya imperial)")
+    format: str = Field(default="ndjson", description="Çıktı biçimi (ndjson veya csv)")
 
 class LocationInfo(BaseModel):
     """Konum bilgileri"""
@@ -16,9 +43,18 @@ class LocationInfo(BaseModel):
 class CurrentWeather(BaseModel):
     """Mevcut hava durumu"""
     temperature: Optional[float]
+    apparent_temperature: Optional[float] = None
+    humidity: Optional[float] = None
+    pressure: Optional[float] = None
+    surface_pressure: Optional[float] = None
     wind_speed: Optional[float]
     wind_direction: Optional[float]
+    wind_gusts: Optional[float] = None
     precipitation: Optional[float]
+    uv_index: Optional[float] = None
+    cloud_cover: Optional[float] = None
+    visibility: Optional[float] = None
+    weather_code: Optional[int] = None
     time: Optional[str]
 
 class DailyWeather(BaseModel):
@@ -26,21 +62,86 @@ class DailyWeather(BaseModel):
     max_temp: Optional[float]
     min_temp: Optional[float]
     weather_code: Optional[int]
+    sunrise: Optional[str] = None
+    sunset: Optional[str] = None
+    uv_index_max: Optional[float] = None
+    precipitation_sum: Optional[float] = None
+
+class ForecastDay(BaseModel):
+    """Tahmin listesindeki tek bir gün"""
+    date: Optional[str]
+    max_temp: Optional[float] = None
+    min_temp: Optional[float] = None
+    weather_code: Optional[int] = None
+    precipitation: Optional[float] = None
+    wind_speed: Optional[float] = None
+    wind_direction: Optional[float] = None
+
+class Forecast(BaseModel):
+    """Günlük tahminler"""
+    daily: List[ForecastDay] = []
 
 class WeatherResponse(BaseModel):
     """Hava durumu yanıt modeli"""
     location: LocationInfo
     current: CurrentWeather
     today: DailyWeather
+    forecast: Optional[Forecast] = Field(
+        default=None,
+        description="Günlük tahmin; /weather, /weather/batch ve bugün niyetli sohbette null"
+    )
     units: str
     updated_at: str
+    interpolated: bool = Field(
+        default=False,
+        description="Çevreleyen dört ızgara hücresinden enterpole edildiyse true; her yanıtta bulunur"
+    )
+
+class BatchWeatherItem(BaseModel):
+    """Toplu istekte tek bir konumun sonucu"""
+    data: Optional[WeatherResponse] = None
+    error: Optional[str] = None
+
+class CompactKeys(BaseModel):
+    """`format=compact` dizilerinin alan adı başlığı"""
+    current: List[str]
+    today: List[str]
+    forecast: List[str]
+
+class CompactWeatherData(BaseModel):
+    """Alan adları olmadan değer dizileri: `current[i]` alanı `keys.current[i]`"""
+    location: LocationInfo
+    current: List[Any]
+    today: List[Any]
+    forecast: Optional[List[List[Any]]] = Field(
+        default=None,
+        description="`forecast[i]`, `keys.forecast[i]` alanının günlere göre dizisi; tahmin yoksa null"
+    )
+    units: str
+    updated_at: str
+    interpolated: bool = False
+
+class CompactWeatherResponse(CompactWeatherData):
+    """`format=compact` hava durumu yanıtı"""
+    keys: CompactKeys
+
+class CompactBatchWeatherItem(BaseModel):
+    """Kompakt toplu yanıtta tek bir konumun sonucu"""
+    data: Optional[CompactWeatherData] = None
+    error: Optional[str] = None
+
+class CompactBatchWeatherResponse(BaseModel):
+    """`format=compact` toplu yanıt: başlık bir kez, konumlar girdi sırasıyla"""
+    keys: CompactKeys
+    items: List[CompactBatchWeatherItem]
 
 class ChatRequest(BaseModel):
     """Sohbet talebi modeli"""
     latitude: float = Field(..., ge=-90, le=90)
     longitude: float = Field(..., ge=-180, le=180)
     units: str = Field(default="metric")
-    message: str = Field(..., min_length=1, description="Kullanıcı mesajı")
+    language: str = Field(default="tr", description="Yanıt dili (tr veya en)")
+    message: str = Field(..., min_length=1, max_length=CHAT_MESSAGE_MAX_LENGTH, description="Kullanıcı mesajı")
 
 class ChatResponse(BaseModel):
     """Sohbet yanıt modeli"""
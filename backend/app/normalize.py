@@ -0,0 +1,224 @@
+from typing import Optional, Dict, Any, List, Tuple, Sequence
+from datetime import datetime
+
+# Servis alanı -> Open-Meteo `current` değişkeni
+CURRENT_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("temperature", "temperature_2m"),
+    ("apparent_temperature", "apparent_temperature"),
+    ("humidity", "relative_humidity_2m"),
+    ("pressure", "pressure_msl"),
+    ("surface_pressure", "surface_pressure"),
+    ("wind_speed", "wind_speed_10m"),
+    ("wind_direction", "wind_direction_10m"),
+    ("wind_gusts", "wind_gusts_10m"),
+    ("precipitation", "precipitation"),
+    ("uv_index", "uv_index"),
+    ("cloud_cover", "cloud_cover"),
+    ("visibility", "visibility"),
+    ("weather_code", "weather_code"),
+    ("time", "time"),
+)
+
+# Servis alanı -> Open-Meteo `daily` değişkeni (bugünün özeti)
+TODAY_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("max_temp", "temperature_2m_max"),
+    ("min_temp", "temperature_2m_min"),
+    ("weather_code", "weathercode"),
+    ("sunrise", "sunrise"),
+    ("sunset", "sunset"),
+    ("uv_index_max", "uv_index_max"),
+    ("precipitation_sum", "precipitation_sum"),
+)
+
+CURRENT_KEYS: Tuple[str, ...] = tuple(key for key, _ in CURRENT_FIELDS)
+TODAY_KEYS: Tuple[str, ...] = tuple(key for key, _ in TODAY_FIELDS)
+TODAY_SOURCES: Tuple[str, ...] = tuple(source for _, source in TODAY_FIELDS)
+
+# Günlük tahmin listesinin sütun sırası; `normalize_daily` satırları bu sırayla
+# (date, max_temp, min_temp, weather_code, precipitation, wind_speed,
+# wind_direction) oluşturur
+FORECAST_SOURCES: Tuple[str, ...] = (
+    "time",
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "weathercode",
+    "precipitation_sum",
+    "wind_speed_10m_max",
+    "wind_direction_10m_dominant",
+)
+
+# `normalize_daily` kayıtlarının alan sırası (FORECAST_SOURCES ile aynı)
+FORECAST_KEYS: Tuple[str, ...] = (
+    "date", "max_temp", "min_temp", "weather_code", "precipitation", "wind_speed", "wind_direction",
+)
+
+MAX_FORECAST_DAYS = 7
+
+# `format=compact` yanıtlarının alan adı başlığı
+COMPACT_KEYS: Dict[str, Tuple[str, ...]] = {
+    "current": CURRENT_KEYS,
+    "today": TODAY_KEYS,
+    "forecast": FORECAST_KEYS,
+}
+
+# Servis alanı -> Open-Meteo `hourly` değişkeni (saatlik tahmin sütunları)
+HOURLY_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("temperature", "temperature_2m"),
+    ("apparent_temperature", "apparent_temperature"),
+    ("humidity", "relative_humidity_2m"),
+    ("precipitation", "precipitation"),
+    ("precipitation_probability", "precipitation_probability"),
+    ("pressure", "pressure_msl"),
+    ("wind_speed", "wind_speed_10m"),
+    ("wind_direction", "wind_direction_10m"),
+    ("wind_gusts", "wind_gusts_10m"),
+    ("cloud_cover", "cloud_cover"),
+    ("uv_index", "uv_index"),
+    ("weather_code", "weather_code"),
+)
+
+HOURLY_KEYS: Tuple[str, ...] = tuple(key for key, _ in HOURLY_FIELDS)
+HOURLY_SOURCES: Tuple[str, ...] = tuple(source for _, source in HOURLY_FIELDS)
+
+# Open-Meteo'nun saatlik tahminde desteklediği en uzun süre
+MAX_HOURLY_DAYS = 16
+
+
+def _column(values: Optional[Sequence[Any]], length: int) -> Sequence[Any]:
+    """Sütunu istenen uzunluğa kırpar; eksik sütun veya değerleri None ile doldurur"""
+    if not values:
+        return (None,) * length
+    if len(values) >= length:
+        return values[:length]
+    return list(values) + [None] * (length - len(values))
+
+
+def normalize_daily(daily: Dict[str, Any], days: int = MAX_FORECAST_DAYS) -> List[Dict[str, Any]]:
+    """
+    Open-Meteo `daily` bloğunu sütun bazında tek geçişte günlük kayıtlara dönüştürür
+
+    Her sütun bir kez okunup kırpılır; satırlar `zip` ile sözlük literal'lerine
+    dönüştürülür (indeks başına `get`/`len` çağrısı yapılmaz).
+    """
+    length = min(days, len(daily.get("time") or ()))
+    if not length:
+        return []
+
+    return [
+        {
+            "date": date,
+            "max_temp": max_temp,
+            "min_temp": min_temp,
+            "weather_code": weather_code,
+            "precipitation": precipitation,
+            "wind_speed": wind_speed,
+            "wind_direction": wind_direction,
+        }
+        for date, max_temp, min_temp, weather_code, precipitation, wind_speed, wind_direction in zip(
+            *[_column(daily.get(source), length) for source in FORECAST_SOURCES]
+        )
+    ]
+
+
+def compact_weather(weather_data: Dict[str, Any], header: bool = True) -> Dict[str, Any]:
+    """
+    `current`, `today` ve `forecast` bloklarını alan adları olmadan değer dizilerine çevirir
+
+    Alan adları yanıtta bir kez, `keys` başlığında yer alır (COMPACT_KEYS).
+    `forecast` paralel dizilerdir: `forecast[i]`, `keys.forecast[i]` alanının
+    günlere göre dizisidir; tahmin yoksa null kalır. Diğer alanlar değişmez.
+
+    Args:
+        weather_data: Normalize veri
+        header: `keys` başlığı eklensin mi (toplu yanıtta başlık bir kez yazılır)
+    """
+    current = weather_data["current"]
+    today = weather_data["today"]
+    forecast = weather_data.get("forecast")
+    compact = {
+        **weather_data,
+        "current": list(map(current.get, CURRENT_KEYS)),
+        "today": list(map(today.get, TODAY_KEYS)),
+        "forecast": (
+            [[day.get(key) for day in forecast["daily"]] for key in FORECAST_KEYS] if forecast else None
+        ),
+    }
+    if header:
+        compact = {"keys": COMPACT_KEYS, **compact}
+    return compact
+
+
+def normalize_hourly(hourly: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """
+    Open-Meteo `hourly` bloğunu sütun düzeninde servis alanlarına çevirir
+
+    Satırlara dönüştürülmez; her değişken `time` ile aynı uzunlukta bir listedir.
+    Yanıtta bulunmayan değişkenler atlanır.
+    """
+    times = hourly.get("time") or []
+    columns = {"time": times}
+    for key, source in HOURLY_FIELDS:
+        values = hourly.get(source)
+        if values is not None:
+            columns[key] = _column(values, len(times))
+    return columns
+
+
+def normalize_location(data: Dict[str, Any], lat: float, lon: float, units: str,
+                       updated_at: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Tek bir konumun Open-Meteo yanıtını servis biçimine dönüştürür
+
+    Args:
+        data: Tek konumun çözümlenmiş Open-Meteo yanıtı
+        lat: Enlem
+        lon: Boylam
+        units: Birim sistemi
+        updated_at: Güncelleme zamanı (çoklu konumda bir kez hesaplanıp paylaşılır)
+    """
+    current = data.get("current") or {}
+    daily = data.get("daily") or {}
+    hourly = data.get("hourly")
+
+    weather_data = {
+        "location": {
+            "latitude": lat,
+            "longitude": lon
+        },
+        "current": {key: current.get(source) for key, source in CURRENT_FIELDS},
+        "today": {key: values[0] if values else None
+                  for key, values in zip(TODAY_KEYS, map(daily.get, TODAY_SOURCES))},
+        "forecast": {
+            "daily": normalize_daily(daily)
+        },
+        "units": units,
+        "updated_at": updated_at or datetime.now().isoformat(),
+        # Komşu hücrelerden enterpole edilen yanıtlarda True (spatial.interpolate_bilinear)
+        "interpolated": False
+    }
+    # Saatlik blok yalnızca saatlik profillerde istenir; diğer yanıtların biçimi değişmez
+    if hourly:
+        weather_data["hourly"] = normalize_hourly(hourly)
+    return weather_data
+
+
+def normalize_locations(data: Any, points: Sequence[Tuple[float, float]], units: str) -> List[Dict[str, Any]]:
+    """
+    Tek veya çoklu konum Open-Meteo yanıtını servis biçimine dönüştürür
+
+    Open-Meteo tek konum için nesne, çoklu konum için istek sırasıyla liste döndürür.
+
+    Args:
+        data: Çözümlenmiş Open-Meteo yanıtı (dict veya list)
+        points: İstek sırasıyla (enlem, boylam) listesi
+        units: Birim sistemi
+    """
+    locations = data if isinstance(data, list) else [data]
+    if len(locations) != len(points):
+        raise ValueError(f"Beklenen {len(points)} konum, gelen {len(locations)}")
+
+    updated_at = datetime.now().isoformat()
+    return [
+        normalize_location(location, lat, lon, units, updated_at)
+        for location, (lat, lon) in zip(locations, points)
+    ]
@@ -0,0 +1,117 @@
+import hashlib
+from typing import Dict, NamedTuple, Tuple
+
+from normalize import FORECAST_SOURCES, HOURLY_SOURCES, TODAY_SOURCES, MAX_FORECAST_DAYS, MAX_HOURLY_DAYS
+
+
+class VariableProfile(NamedTuple):
+    """
+    Bir uç noktanın Open-Meteo'dan istediği en küçük değişken kümesi
+
+    Önbellek anahtarının parçasıdır; dar bir profil, onu kapsayan daha geniş bir
+    profilin önbellekteki kaydıyla da karşılanabilir.
+    """
+    name: str
+    current: Tuple[str, ...]
+    daily: Tuple[str, ...]
+    forecast_days: int
+    hourly: Tuple[str, ...] = ()
+
+    def covers(self, other: "VariableProfile") -> bool:
+        """Bu profilin yanıtı `other` profilinin ihtiyacını karşılıyor mu"""
+        return (
+            self.forecast_days >= other.forecast_days
+            and set(other.current) <= set(self.current)
+            and set(other.daily) <= set(self.daily)
+            and set(other.hourly) <= set(self.hourly)
+        )
+
+    @property
+    def has_forecast(self) -> bool:
+        """Günlük tahmin satırlarının (`forecast.daily`) tüm sütunları isteniyor mu"""
+        return set(FORECAST_DAILY) <= set(self.daily)
+
+    @property
+    def signature(self) -> str:
+        """Disk önbelleğinde farklı değişken kümelerinin karışmaması için imza"""
+        return SIGNATURES.get(self) or _signature(self)
+
+
+def _signature(profile: VariableProfile) -> str:
+    text = ",".join(profile.current) + "|" + ",".join(profile.daily) + "|" + str(profile.forecast_days)
+    # Saatlik değişkeni olmayan profillerin imzası (ve disk kayıtları) değişmesin
+    if profile.hourly:
+        text += "|" + ",".join(profile.hourly)
+    return hashlib.sha1(text.encode()).hexdigest()[:12]
+
+
+# Günlük tahmin satırlarının kaynak sütunları (tarih `time` her zaman gelir)
+FORECAST_DAILY = tuple(source for source in FORECAST_SOURCES if source != "time")
+
+# `current` bloğu istendiğinde Open-Meteo `time` ve `interval` alanlarını da
+# döndürür; önbellek süresi bir sonraki güncelleme sınırına bu sayede hizalanır.
+# Yalnızca günlük veri kullanan profiller bu yüzden tek bir `current` değişkeni ister.
+FULL = VariableProfile(
+    name="full",
+    current=(
+        "temperature_2m", "apparent_temperature", "relative_humidity_2m",
+        "precipitation", "pressure_msl", "surface_pressure",
+        "wind_speed_10m", "wind_direction_10m", "wind_gusts_10m",
+        "uv_index", "cloud_cover", "visibility", "weather_code",
+    ),
+    daily=(
+        "temperature_2m_max", "temperature_2m_min", "weathercode",
+        "sunrise", "sunset", "uv_index_max", "precipitation_sum",
+        "wind_speed_10m_max", "wind_direction_10m_dominant",
+    ),
+    forecast_days=MAX_FORECAST_DAYS,
+)
+
+# /weather, /weather/batch, /chat/weather: anlık veri ve bugünün özeti
+WEATHER = VariableProfile("weather", FULL.current, TODAY_SOURCES, 1)
+
+# /forecast/weekly: yalnızca 7 günlük tahmin satırları
+WEEKLY = VariableProfile("weekly", ("weather_code",), FORECAST_DAILY, MAX_FORECAST_DAYS)
+
+# /forecast/tomorrow: bugün ve yarının tahmin satırları
+TOMORROW = VariableProfile("tomorrow", ("weather_code",), FORECAST_DAILY, 2)
+
+# /tiles: karodaki her hücre için birkaç anlık alan, günlük veri yok
+TILE = VariableProfile(
+    "tile",
+    ("temperature_2m", "wind_speed_10m", "wind_direction_10m", "precipitation", "weather_code"),
+    (),
+    1,
+)
+
+# /forecast/hourly: tüm saatlik değişkenler. İstenen gün sayısı kademeye
+# yuvarlanır; farklı `days` istekleri böylece aynı (veya kapsayan) kaydı paylaşır,
+# değişken seçimi yanıt oluşturulurken yapılır
+HOURLY_TIERS: Tuple[int, ...] = (1, 3, 7, MAX_HOURLY_DAYS)
+HOURLY: Dict[int, VariableProfile] = {
+    days: VariableProfile(f"hourly{days}", ("weather_code",), (), days, HOURLY_SOURCES)
+    for days in HOURLY_TIERS
+}
+
+
+def hourly_profile(days: int) -> VariableProfile:
+    """`days` günü kapsayan en küçük saatlik profil"""
+    for tier in HOURLY_TIERS:
+        if days <= tier:
+            return HOURLY[tier]
+    return HOURLY[MAX_HOURLY_DAYS]
+
+
+PROFILES: Tuple[VariableProfile, ...] = (WEATHER, WEEKLY, TOMORROW, TILE, FULL, *HOURLY.values())
+
+SIGNATURES: Dict[VariableProfile, str] = {profile: _signature(profile) for profile in PROFILES}
+
+# Her profil için önbellekte aranacak profiller: önce kendisi, sonra onu kapsayan
+# profiller küçükten büyüğe
+COVERING: Dict[VariableProfile, Tuple[VariableProfile, ...]] = {
+    profile: (profile,) + tuple(sorted(
+        (other for other in PROFILES if other is not profile and other.covers(profile)),
+        key=lambda other: (len(other.current) + len(other.daily) + len(other.hourly), other.forecast_days),
+    ))
+    for profile in PROFILES
+}
@@ -0,0 +1,160 @@
+import asyncio
+import random
+import time
+from typing import Dict, Any
+
+
+class CircuitOpenError(Exception):
+    """Devre kesici açıkken upstream isteği yapılmadan hızlıca başarısız olunur"""
+
+
+class UpstreamBusyError(Exception):
+    """Eşzamanlılık sınırı dolu ve kuyrukta bekleme süresi aşıldı"""
+
+
+class CircuitBreaker:
+    """
+    Ardışık hatalarda upstream'e istek göndermeyi geçici olarak durduran devre kesici
+
+    closed    : istekler serbest, ardışık hatalar sayılır
+    open      : `reset_timeout` dolana kadar tüm istekler hemen reddedilir
+    half_open : tek bir deneme isteğine izin verilir; başarılıysa devre kapanır
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        """İsteğin upstream'e gönderilip gönderilemeyeceğini döndürür"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                return False
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+
+        if self.state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                self.rejected += 1
+                return False
+            self._probe_in_flight = True
+
+        return True
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def release(self) -> None:
+        """İzin verilen istek sonuç kaydedilmeden bittiğinde (kuyruk zaman aşımı, iptal) deneme hakkını geri verir"""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        retry_in = 0.0
+        if self.state == self.OPEN:
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_in": round(retry_in, 1),
+        }
+
+
+class RetryBudget:
+    """
+    Yeniden denemeleri normal trafiğin bir oranıyla sınırlayan jeton kovası
+
+    Her ilk istek `ratio` jeton ekler, her yeniden deneme bir jeton harcar. Böylece
+    upstream zorlandığında yeniden denemeler yükü katlayamaz.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.spent = 0
+        self.exhausted = 0
+
+    def deposit(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self.tokens >= 1:
+            self.tokens -= 1
+            self.spent += 1
+            return True
+        self.exhausted += 1
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tokens": round(self.tokens, 2),
+            "ratio": self.ratio,
+            "spent": self.spent,
+            "exhausted": self.exhausted,
+        }
+
+
+class ConcurrencyLimiter:
+    """Eşzamanlı upstream isteklerini sınırlayan, kuyruk derinliğini izleyen semafor"""
+
+    def __init__(self, limit: int = 20, queue_timeout: float = 5):
+        self.limit = limit
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.waiting = 0
+        self.timeouts = 0
+
+    async def __aenter__(self) -> "ConcurrencyLimiter":
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise UpstreamBusyError("Upstream eşzamanlılık kuyruğunda bekleme süresi aşıldı")
+        finally:
+            self.waiting -= 1
+        self.in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "queue_timeouts": self.timeouts,
+        }
+
+
+def backoff_delay(attempt: int, base: float, cap: float = 5.0) -> float:
+    """Üstel geri çekilme için "full jitter" bekleme süresi hesaplar"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
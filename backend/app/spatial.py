@@ -0,0 +1,137 @@
+import math
+from typing import Dict, Any, Hashable, List, Sequence, Set, Tuple
+
+# Ortalama dünya yarıçapı (km) ve bir enlem derecesinin uzunluğu
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+# Bilinear enterpolasyonla hesaplanan `current` alanları. Yön (dairesel), hava
+# kodu (kategorik) ve zaman enterpolasyona uygun değildir; en yakın köşeden alınır.
+INTERPOLATED_FIELDS: Tuple[str, ...] = (
+    "temperature", "apparent_temperature", "humidity", "pressure", "surface_pressure",
+    "wind_speed", "wind_gusts", "precipitation", "uv_index", "cloud_cover", "visibility",
+)
+
+PointKey = Tuple[Hashable, ...]
+
+
+class SpatialIndex:
+    """
+    Önbellek anahtarları üzerinde ızgara kovası indeksi
+
+    Anahtarlar (enlem, boylam, ...) biçimindedir; kalan kısım (birim, profil)
+    kovanın parçasıdır, böylece yalnızca aynı birim ve profildeki noktalar
+    karşılaştırılır. Sorgu yalnızca arama yarıçapıyla kesişen kovaları tarar.
+    """
+
+    def __init__(self, bucket_degrees: float = 0.05):
+        self.bucket_degrees = bucket_degrees
+        self._buckets: Dict[Tuple[Hashable, ...], Set[PointKey]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _bucket(self, lat: float, lon: float, rest: Tuple[Hashable, ...]) -> Tuple[Hashable, ...]:
+        return (math.floor(lat / self.bucket_degrees), math.floor(lon / self.bucket_degrees), *rest)
+
+    def add(self, key: PointKey) -> None:
+        points = self._buckets.setdefault(self._bucket(key[0], key[1], key[2:]), set())
+        if key not in points:
+            points.add(key)
+            self._size += 1
+
+    def discard(self, key: PointKey) -> None:
+        bucket = self._bucket(key[0], key[1], key[2:])
+        points = self._buckets.get(bucket)
+        if points is None or key not in points:
+            return
+        points.remove(key)
+        self._size -= 1
+        if not points:
+            del self._buckets[bucket]
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._size = 0
+
+    def nearby(self, lat: float, lon: float, rests: Sequence[Tuple[Hashable, ...]],
+               max_distance_km: float) -> List[Tuple[float, PointKey]]:
+        """
+        `max_distance_km` içindeki anahtarları mesafeye göre sıralı döndürür
+
+        Birkaç kilometrelik yarıçaplarda yeterince doğru olan eşdikdörtgen
+        (equirectangular) yaklaşım kullanılır; nokta başına trigonometri yapılmaz.
+
+        Args:
+            lat: Enlem
+            lon: Boylam
+            rests: Kabul edilen anahtar sonekleri (ör. birim ve kapsayan profiller),
+                eşit mesafede öncelik sırası
+            max_distance_km: Arama yarıçapı
+        """
+        scale = max(math.cos(math.radians(lat)), 0.01)
+        dlat = max_distance_km / KM_PER_DEGREE
+        dlon = dlat / scale
+        limit = dlat * dlat
+        size = self.bucket_degrees
+        rows = range(math.floor((lat - dlat) / size), math.floor((lat + dlat) / size) + 1)
+        cols = range(math.floor((lon - dlon) / size), math.floor((lon + dlon) / size) + 1)
+
+        found = []
+        for order, rest in enumerate(rests):
+            for row in rows:
+                for col in cols:
+                    for key in self._buckets.get((row, col, *rest), ()):
+                        dy = key[0] - lat
+                        dx = (key[1] - lon) * scale
+                        squared = dy * dy + dx * dx
+                        if squared <= limit:
+                            found.append((squared, order, key))
+        found.sort(key=lambda item: (item[0], item[1]))
+        return [(math.sqrt(squared) * KM_PER_DEGREE, key) for squared, _, key in found]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"points": self._size, "buckets": len(self._buckets), "bucket_degrees": self.bucket_degrees}
+
+
+def grid_corners(lat: float, lon: float, resolution: float) -> Tuple[Tuple[float, float, float, float], float, float]:
+    """
+    Noktayı çevreleyen ızgara hücresinin köşeleri ve nokta içindeki kesirli konumu
+
+    Returns:
+        ((güney, kuzey, batı, doğu), enlem kesri, boylam kesri)
+    """
+    south = math.floor(lat / resolution) * resolution
+    west = math.floor(lon / resolution) * resolution
+    return (
+        (south, south + resolution, west, west + resolution),
+        (lat - south) / resolution,
+        (lon - west) / resolution,
+    )
+
+
+def interpolate_bilinear(corners: Sequence[Dict[str, Any]], fy: float, fx: float) -> Dict[str, Any]:
+    """
+    Dört köşe kaydından noktadaki değeri bilinear enterpolasyonla hesaplar
+
+    Args:
+        corners: (güneybatı, güneydoğu, kuzeybatı, kuzeydoğu) sırasıyla normalize veriler
+        fy: Güneyden kuzeye kesir (0-1)
+        fx: Batıdan doğuya kesir (0-1)
+
+    Returns:
+        En yakın köşenin kopyası; `current` içindeki sayısal alanlar enterpole edilmiş.
+        `interpolated` işaretlidir: `updated_at` en yakın köşeninki olduğundan aynı
+        hücredeki diğer noktaların verisiyle karıştırılmamalıdır.
+    """
+    weights = ((1 - fy) * (1 - fx), (1 - fy) * fx, fy * (1 - fx), fy * fx)
+    nearest = corners[max(range(4), key=weights.__getitem__)]
+    current = dict(nearest["current"])
+    for field in INTERPOLATED_FIELDS:
+        values = [corner["current"].get(field) for corner in corners]
+        if any(value is None for value in values):
+            continue
+        current[field] = round(sum(weight * value for weight, value in zip(weights, values)), 2)
+    return {**nearest, "current": current, "interpolated": True}
+
@@ -0,0 +1,402 @@
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple, Callable
+
+from config import CACHE_GRID_RESOLUTION, SUMMARY_CACHE_MAX_ENTRIES
+from metrics import STAGE_SECONDS, timed
+
+# Tüm metin tabloları (Türkçe, İngilizce) sütunlarıyla tutulur; dil indeksi
+LANGUAGES: Dict[str, int] = {"tr": 0, "en": 1}
+DEFAULT_LANGUAGE = "tr"
+
+# WMO hava durumu kodu -> açıklama
+WEATHER_CODES: Dict[int, Tuple[str, str]] = {
+    0: ("Açık hava", "Clear sky"),
+    1: ("Çoğunlukla açık", "Mainly clear"),
+    2: ("Parçalı bulutlu", "Partly cloudy"),
+    3: ("Bulutlu", "Overcast"),
+    45: ("Sisli", "Fog"),
+    48: ("Kırağılı sis", "Depositing rime fog"),
+    51: ("Hafif çisenti", "Light drizzle"),
+    53: ("Orta çisenti", "Moderate drizzle"),
+    55: ("Yoğun çisenti", "Dense drizzle"),
+    61: ("Hafif yağmur", "Slight rain"),
+    63: ("Orta yağmur", "Moderate rain"),
+    65: ("Şiddetli yağmur", "Heavy rain"),
+    71: ("Hafif kar", "Slight snow"),
+    73: ("Orta kar", "Moderate snow"),
+    75: ("Şiddetli kar", "Heavy snow"),
+    80: ("Hafif sağanak", "Slight rain showers"),
+    81: ("Orta sağanak", "Moderate rain showers"),
+    82: ("Şiddetli sağanak", "Violent rain showers"),
+    95: ("Gök gürültülü fırtına", "Thunderstorm"),
+    96: ("Hafif dolu ile fırtına", "Thunderstorm with slight hail"),
+    99: ("Şiddetli dolu ile fırtına", "Thunderstorm with heavy hail"),
+}
+UNKNOWN_WEATHER: Tuple[str, str] = ("Bilinmeyen", "Unknown")
+WEATHER_CODE_FALLBACK: Tuple[str, str] = ("Hava kodu: {}", "Weather code: {}")
+
+# UV indeksi kova sınırları (üst sınır hariç) ve seviye adları
+UV_LEVELS: Tuple[Tuple[float, Tuple[str, str]], ...] = (
+    (3, ("Düşük", "Low")),
+    (6, ("Orta", "Moderate")),
+    (8, ("Yüksek", "High")),
+    (float("inf"), ("Çok Yüksek", "Very high")),
+)
+
+DAY_NAMES: Tuple[Tuple[str, str], ...] = (
+    ("Pazartesi", "Monday"),
+    ("Salı", "Tuesday"),
+    ("Çarşamba", "Wednesday"),
+    ("Perşembe", "Thursday"),
+    ("Cuma", "Friday"),
+    ("Cumartesi", "Saturday"),
+    ("Pazar", "Sunday"),
+)
+
+# Birim sistemi -> şablonlardaki birim yer tutucuları
+UNIT_SYMBOLS: Dict[str, Dict[str, str]] = {
+    "metric": {"{temp}": "°C", "{wind}": "m/s", "{pressure}": "hPa", "{precip}": "mm"},
+    "imperial": {"{temp}": "°F", "{wind}": "mph", "{pressure}": "inHg", "{precip}": "inch"},
+}
+
+# Satır şablonları; birim yer tutucuları derleme sırasında yerleştirilir,
+# `{}` alanları çizim sırasında `str.format` ile doldurulur
+TEMPLATES: Dict[str, Tuple[str, str]] = {
+    # Bugünün özeti
+    "summary_title": ("**Bugünün Hava Durumu**\n\n", "**Today's Weather**\n\n"),
+    "summary_unavailable": ("Üzgünüm, şu anda hava durumu verilerini alamıyorum.",
+                            "Sorry, weather data is not available right now."),
+    "location": ("Konum: {:.3f}, {:.3f}\n", "Location: {:.3f}, {:.3f}\n"),
+    "temperature": ("Sıcaklık: {}{temp}\n", "Temperature: {}{temp}\n"),
+    "apparent": ("Hissedilen: {}{temp}\n", "Feels like: {}{temp}\n"),
+    "today_range": ("Bugün: {}{temp} / {}{temp}\n", "Today: {}{temp} / {}{temp}\n"),
+    "condition": ("Durum: {}\n", "Condition: {}\n"),
+    "humidity": ("Nem: %{}\n", "Humidity: {}%\n"),
+    "pressure": ("Basınç: {} {pressure}\n", "Pressure: {} {pressure}\n"),
+    "wind": ("Rüzgar: {} {wind}\n", "Wind: {} {wind}\n"),
+    "gusts": ("Rüzgar Hızı (Max): {} {wind}\n", "Wind gusts: {} {wind}\n"),
+    "uv": ("UV İndeksi: {} ({})\n", "UV index: {} ({})\n"),
+    "cloud_cover": ("Bulutluluk: %{}\n", "Cloud cover: {}%\n"),
+    "visibility": ("Görüş: {} km\n", "Visibility: {} km\n"),
+    "precipitation_rate": ("Yağış: {} {precip}/h\n", "Precipitation: {} {precip}/h\n"),
+    "sun": ("\nGüneş Doğuş: {}\nGüneş Batış: {}\n", "\nSunrise: {}\nSunset: {}\n"),
+    "updated": ("\nGüncelleme: {}", "\nUpdated: {}"),
+    # Yarın
+    "tomorrow_title": ("**Yarın Hava Durumu**\n\n", "**Tomorrow's Weather**\n\n"),
+    "tomorrow_unavailable": ("Üzgünüm, şu anda yarın hava tahmini verilerini alamıyorum.",
+                             "Sorry, tomorrow's forecast is not available right now."),
+    "tomorrow_missing": ("Yarın için hava tahmini bulunamadı.", "No forecast found for tomorrow."),
+    "date": ("Tarih: {}\n", "Date: {}\n"),
+    "range": ("Sıcaklık: {}{temp} / {}{temp}\n", "Temperature: {}{temp} / {}{temp}\n"),
+    "precipitation_sum": ("Toplam Yağış: {} {precip}\n", "Total precipitation: {} {precip}\n"),
+    "wind_max": ("Max Rüzgar: {} {wind}\n", "Max wind: {} {wind}\n"),
+    "unknown_date": ("Bilinmiyor", "Unknown"),
+    # 7 günlük
+    "weekly_title": ("**7 Günlük Hava Tahmini**\n\n", "**7-Day Forecast**\n\n"),
+    "weekly_unavailable": ("7 günlük tahmin şu anda alınamıyor.", "The 7-day forecast is not available right now."),
+    "weekly_missing": ("Haftalık tahmin verisi bulunamadı.", "No weekly forecast data found."),
+    "weekly_day": ("{}: {}°/{}° - {}\n", "{}: {}°/{}° - {}\n"),
+    "weekly_precipitation": ("  Yağış: {} {precip}\n", "  Precipitation: {} {precip}\n"),
+    "day_today": ("Bugün", "Today"),
+    "day_tomorrow": ("Yarın", "Tomorrow"),
+    "day_label": ("{} ({})", "{} ({})"),
+    # Hava durumu dışındaki sohbet mesajları
+    "general_reply": (
+        "Merhaba! Ben bir hava durumu asistanıyım. 🌤️ Bugünün hava durumu hakkında bilgi almak için "
+        "'bugün hava nasıl?' gibi sorular sorabilirsiniz.",
+        "Hello! I'm a weather assistant. 🌤️ Ask questions like 'how is the weather today?', "
+        "'will it rain tomorrow?' or 'what's the forecast for this week?'.",
+    ),
+}
+
+NOT_AVAILABLE = "N/A"
+
+Catalog = Dict[str, str]
+Chunks = Tuple[str, ...]
+
+
+def _compile_catalog(language: str, units: str) -> Catalog:
+    """Dil ve birim sistemi için şablonları birim sembolleri yerleştirilmiş olarak hazırlar"""
+    index = LANGUAGES[language]
+    catalog = {}
+    for key, texts in TEMPLATES.items():
+        text = texts[index]
+        for placeholder, symbol in UNIT_SYMBOLS[units].items():
+            text = text.replace(placeholder, symbol)
+        catalog[key] = text
+    return catalog
+
+
+# (dil, birim) -> derlenmiş şablonlar; içe aktarımda bir kez oluşturulur
+CATALOGS: Dict[Tuple[str, str], Catalog] = {
+    (language, units): _compile_catalog(language, units)
+    for language in LANGUAGES
+    for units in UNIT_SYMBOLS
+}
+
+# Dil -> {hava kodu: açıklama}
+DESCRIPTIONS: Dict[str, Dict[int, str]] = {
+    language: {code: texts[index] for code, texts in WEATHER_CODES.items()}
+    for language, index in LANGUAGES.items()
+}
+
+
+def _language(language: Optional[str]) -> str:
+    return language if language in LANGUAGES else DEFAULT_LANGUAGE
+
+
+def catalog(language: str = DEFAULT_LANGUAGE, units: str = "metric") -> Catalog:
+    """Derlenmiş şablonları döndürür; bilinmeyen dil/birim varsayılana düşer"""
+    return CATALOGS[(_language(language), "imperial" if units == "imperial" else "metric")]
+
+
+def describe(weather_code: Optional[int], language: str = DEFAULT_LANGUAGE) -> str:
+    """Hava durumu kodundan açıklama döndürür"""
+    language = _language(language)
+    if weather_code is None:
+        return UNKNOWN_WEATHER[LANGUAGES[language]]
+    description = DESCRIPTIONS[language].get(weather_code)
+    if description is None:
+        return WEATHER_CODE_FALLBACK[LANGUAGES[language]].format(weather_code)
+    return description
+
+
+def uv_level(uv_index: float, language: str = DEFAULT_LANGUAGE) -> str:
+    """UV indeksini seviye adına çevirir"""
+    index = LANGUAGES[_language(language)]
+    for upper, names in UV_LEVELS:
+        if uv_index < upper:
+            return names[index]
+    return UV_LEVELS[-1][1][index]
+
+
+def clock(value: Optional[str]) -> Optional[str]:
+    """ISO 8601 zaman damgasından SS:DD döndürür; çözümlenemezse None"""
+    if not value:
+        return None
+    # Open-Meteo biçimi: YYYY-MM-DDTHH:MM
+    if len(value) >= 16 and value[10] == "T" and value[13] == ":":
+        return value[11:16]
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%H:%M")
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _weekday(date_text: str) -> Tuple[int, str]:
+    """Tarih metninden (haftanın günü, GG.AA) döndürür"""
+    return date.fromisoformat(date_text).weekday(), f"{date_text[8:10]}.{date_text[5:7]}"
+
+
+def _cell(value: float) -> float:
+    """Koordinatın ızgara hücresi indeksi (önbellek anahtarıyla aynı hücreleme)"""
+    return round(value / CACHE_GRID_RESOLUTION) if CACHE_GRID_RESOLUTION > 0 else value
+
+
+def _value(value: Any) -> Any:
+    return NOT_AVAILABLE if value is None else value
+
+
+def _render_summary_body(weather_data: Dict[str, Any], t: Catalog, language: str) -> Chunks:
+    """Bugünün özetinin başlık ve konum satırından sonraki bölümleri"""
+    current = weather_data.get("current") or {}
+    today = weather_data.get("today") or {}
+
+    lines = [t["temperature"].format(_value(current.get("temperature")))]
+    if current.get("apparent_temperature"):
+        lines.append(t["apparent"].format(current["apparent_temperature"]))
+    if today.get("max_temp") and today.get("min_temp"):
+        lines.append(t["today_range"].format(today["max_temp"], today["min_temp"]))
+    lines.append(t["condition"].format(describe(today.get("weather_code"), language)))
+    if current.get("humidity"):
+        lines.append(t["humidity"].format(current["humidity"]))
+    if current.get("pressure"):
+        lines.append(t["pressure"].format(current["pressure"]))
+    lines.append(t["wind"].format(_value(current.get("wind_speed"))))
+    if current.get("wind_gusts"):
+        lines.append(t["gusts"].format(current["wind_gusts"]))
+    if current.get("uv_index") is not None:
+        lines.append(t["uv"].format(current["uv_index"], uv_level(current["uv_index"], language)))
+    if current.get("cloud_cover"):
+        lines.append(t["cloud_cover"].format(current["cloud_cover"]))
+    if current.get("visibility"):
+        lines.append(t["visibility"].format(current["visibility"]))
+    if current.get("precipitation"):
+        lines.append(t["precipitation_rate"].format(current["precipitation"]))
+
+    chunks = ["".join(lines)]
+
+    sunrise, sunset = clock(today.get("sunrise")), clock(today.get("sunset"))
+    if sunrise and sunset:
+        chunks.append(t["sun"].format(sunrise, sunset))
+
+    updated = clock(weather_data.get("updated_at")) or datetime.now().strftime("%H:%M")
+    chunks.append(t["updated"].format(updated))
+    return tuple(chunks)
+
+
+def _render_tomorrow(weather_data: Dict[str, Any], t: Catalog, language: str) -> Chunks:
+    forecast = weather_data.get("forecast", {}).get("daily")
+    if not forecast:
+        return (t["tomorrow_unavailable"],)
+    if len(forecast) < 2:
+        return (t["tomorrow_missing"],)
+
+    tomorrow = forecast[1]
+    lines = [
+        t["tomorrow_title"],
+        t["date"].format(tomorrow.get("date") or t["unknown_date"]),
+        t["range"].format(_value(tomorrow.get("max_temp")), _value(tomorrow.get("min_temp"))),
+        t["condition"].format(describe(tomorrow.get("weather_code"), language)),
+    ]
+    if tomorrow.get("precipitation"):
+        lines.append(t["precipitation_sum"].format(tomorrow["precipitation"]))
+    if tomorrow.get("wind_speed"):
+        lines.append(t["wind_max"].format(tomorrow["wind_speed"]))
+    return ("".join(lines),)
+
+
+def _render_weekly(weather_data: Dict[str, Any], t: Catalog, language: str) -> Chunks:
+    """Başlık ve her gün için bir parça"""
+    forecast = weather_data.get("forecast", {}).get("daily", [])
+    if not forecast:
+        return (t["weekly_missing"],)
+
+    index = LANGUAGES[language]
+    chunks = [t["weekly_title"]]
+    for i, day in enumerate(forecast[:7]):
+        if not day.get("date"):
+            continue
+        try:
+            weekday, date_text = _weekday(day["date"])
+        except (TypeError, ValueError):
+            continue
+
+        if i == 0:
+            label = t["day_today"]
+        elif i == 1:
+            label = t["day_tomorrow"]
+        else:
+            label = t["day_label"].format(DAY_NAMES[weekday][index], date_text)
+
+        line = t["weekly_day"].format(
+            label,
+            _value(day.get("max_temp")),
+            _value(day.get("min_temp")),
+            describe(day.get("weather_code"), language),
+        )
+        if day.get("precipitation") and day["precipitation"] > 0:
+            line += t["weekly_precipitation"].format(day["precipitation"])
+        chunks.append(line)
+    return tuple(chunks)
+
+
+class SummaryCache:
+    """
+    Önbellekteki tahmin anlık görüntüsü başına oluşturulmuş metinlerin LRU önbelleği
+
+    Anahtar (tür, dil, birim, ızgara hücresi, updated_at, gün sayısı) olur;
+    upstream verisi yenilendiğinde `updated_at` değiştiği için eski metinler
+    kendiliğinden kullanılmaz olur ve LRU ile tahliye edilir. Enterpole edilmiş
+    veriler hücrenin kaydından farklı olduğu halde aynı anahtarı taşıdığından
+    önbelleğe alınmaz.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Any, ...], Chunks]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, kind: str, weather_data: Dict[str, Any], units: str, language: str,
+                      render: Callable[[Dict[str, Any], Catalog, str], Chunks]) -> Chunks:
+        t = catalog(language, units)
+        updated_at = weather_data.get("updated_at")
+        if updated_at is None or self.max_entries <= 0 or weather_data.get("interpolated"):
+            with timed(STAGE_SECONDS, ("render",)):
+                return render(weather_data, t, language)
+
+        location = weather_data.get("location") or {}
+        key = (
+            kind, language, units, updated_at,
+            _cell(location.get("latitude") or 0.0),
+            _cell(location.get("longitude") or 0.0),
+            len(weather_data.get("forecast", {}).get("daily") or ()),
+        )
+        chunks = self._entries.get(key)
+        if chunks is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return chunks
+
+        self.misses += 1
+        with timed(STAGE_SECONDS, ("render",)):
+            chunks = render(weather_data, t, language)
+        self._entries[key] = chunks
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return chunks
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+_cache = SummaryCache(SUMMARY_CACHE_MAX_ENTRIES)
+
+
+def summary_chunks(weather_data: Optional[Dict[str, Any]], lat: float, lon: float,
+                   units: str = "metric", language: str = DEFAULT_LANGUAGE) -> Chunks:
+    """
+    Bugünün hava durumu özetini parçalar halinde döndürür
+
+    Konum satırı isteğin koordinatlarıyla her çağrıda eklenir; geri kalanı
+    anlık görüntü başına bir kez oluşturulur.
+    """
+    language = _language(language)
+    t = catalog(language, units)
+    if not weather_data:
+        return (t["summary_unavailable"],)
+
+    body = _cache.get_or_render("summary", weather_data, units, language, _render_summary_body)
+    return (t["summary_title"] + t["location"].format(lat, lon) + body[0],) + body[1:]
+
+
+def tomorrow_chunks(weather_data: Optional[Dict[str, Any]], units: str = "metric",
+                    language: str = DEFAULT_LANGUAGE) -> Chunks:
+    """Yarın için tahmin metnini döndürür (tek parça)"""
+    language = _language(language)
+    if not weather_data:
+        return (catalog(language, units)["tomorrow_unavailable"],)
+    return _cache.get_or_render("tomorrow", weather_data, units, language, _render_tomorrow)
+
+
+def weekly_chunks(weather_data: Optional[Dict[str, Any]], units: str = "metric",
+                  language: str = DEFAULT_LANGUAGE) -> Chunks:
+    """7 günlük tahmin metnini başlık ve her gün için bir parça olarak döndürür"""
+    language = _language(language)
+    if not weather_data:
+        return (catalog(language, units)["weekly_unavailable"],)
+    return _cache.get_or_render("weekly", weather_data, units, language, _render_weekly)
+
+
+def general_reply(language: str = DEFAULT_LANGUAGE) -> str:
+    """Hava durumu ile ilgili olmayan sohbet mesajlarına verilen yanıt"""
+    return catalog(language)["general_reply"]
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Metin önbelleği sayaçlarını döndürür"""
+    return _cache.stats()
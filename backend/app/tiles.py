@@ -0,0 +1,150 @@
+import math
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime
+import logging
+
+from config import (
+    TILE_GRID_SIZE,
+    TILE_MAX_ZOOM,
+    TILE_CACHE_MAX_ENTRIES,
+    TILE_CACHE_TTL_SECONDS,
+)
+from cache import ForecastCache
+from weather_service import WeatherService
+from profiles import TILE
+
+logger = logging.getLogger(__name__)
+
+# Web Mercator'ın geçerli enlem sınırı
+MAX_MERCATOR_LAT = 85.05112878
+
+# Karodaki her hücre için döndürülen `current` alanları
+TILE_FIELDS = ["temperature", "wind_speed", "wind_direction", "precipitation", "weather_code"]
+
+
+def tile_to_lat(y: float, z: int) -> float:
+    """Karo y koordinatını (kesirli olabilir) enleme çevirir"""
+    n = math.pi - 2 * math.pi * y / (2 ** z)
+    return math.degrees(math.atan(math.sinh(n)))
+
+
+def tile_to_lon(x: float, z: int) -> float:
+    """Karo x koordinatını (kesirli olabilir) boylama çevirir"""
+    return x / (2 ** z) * 360.0 - 180.0
+
+
+def tile_bounds(z: int, x: int, y: int) -> Dict[str, float]:
+    """Slippy-map karosunun coğrafi sınırlarını döndürür"""
+    return {
+        "north": tile_to_lat(y, z),
+        "south": tile_to_lat(y + 1, z),
+        "west": tile_to_lon(x, z),
+        "east": tile_to_lon(x + 1, z),
+    }
+
+
+def tile_lattice(z: int, x: int, y: int, size: int) -> List[Tuple[float, float]]:
+    """
+    Karo içinde size x size hücre merkezlerini satır öncelikli (kuzeyden güneye,
+    batıdan doğuya) sırayla döndürür
+    """
+    points = []
+    for row in range(size):
+        lat = tile_to_lat(y + (row + 0.5) / size, z)
+        lat = max(-MAX_MERCATOR_LAT, min(MAX_MERCATOR_LAT, lat))
+        for col in range(size):
+            lon = tile_to_lon(x + (col + 0.5) / size, z)
+            points.append((round(lat, 4), round(lon, 4)))
+    return points
+
+
+class TileService:
+    """Harita karoları için önceden hesaplanmış hava durumu ızgaraları sağlar"""
+
+    # Karo anahtarı (z, x, y, birim) ile kendi TTL'si olan karo önbelleği
+    _cache = ForecastCache(TILE_CACHE_MAX_ENTRIES, TILE_CACHE_TTL_SECONDS)
+
+    @staticmethod
+    def is_valid_tile(z: int, x: int, y: int) -> bool:
+        """Karo koordinatlarının desteklenen aralıkta olup olmadığını kontrol eder"""
+        if z < 0 or z > TILE_MAX_ZOOM:
+            return False
+        limit = 2 ** z
+        return 0 <= x < limit and 0 <= y < limit
+
+    @staticmethod
+    def cache_stats() -> Dict[str, Any]:
+        """Karo önbelleği sayaçlarını döndürür"""
+        return TileService._cache.stats()
+
+    @staticmethod
+    def expires_at(z: int, x: int, y: int, units: str = "metric") -> Optional[float]:
+        """Önbellekteki karonun geçerliliğini yitireceği an (epoch); karo yoksa None"""
+        return TileService._cache.expires_at([(z, x, y, units)])
+
+    @staticmethod
+    async def get_weather_tile(z: int, x: int, y: int, units: str = "metric") -> Optional[Dict[str, Any]]:
+        """
+        Karo için sabit bir örnek ızgarasında mevcut hava durumunu döndürür
+
+        Noktalar WeatherService.get_weather_batch ile toplu çekilir; böylece
+        normalizasyon, nokta önbelleği ve single-flight yolu aynen kullanılır.
+        Her alan satır öncelikli düz bir sayı dizisidir.
+
+        Args:
+            z: Yakınlaştırma seviyesi
+            x: Karo sütunu
+            y: Karo satırı
+            units: Birim sistemi
+
+        Returns:
+            Karo ızgarasını içeren dict veya None (hiçbir nokta alınamazsa)
+        """
+        cache_key = (z, x, y, units)
+        cached = TileService._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        points = tile_lattice(z, x, y, TILE_GRID_SIZE)
+        results = await WeatherService.get_weather_batch([(lat, lon, units) for lat, lon in points], TILE)
+
+        if not any(results):
+            logger.error(f"Karo verisi alınamadı: {z}/{x}/{y}")
+            return None
+
+        columns: Dict[str, List[Any]] = {field: [] for field in TILE_FIELDS}
+        times = set()
+        for weather_data in results:
+            current = weather_data["current"] if weather_data else {}
+            for field in TILE_FIELDS:
+                columns[field].append(current.get(field))
+            if current.get("time"):
+                times.add(current["time"])
+
+        tile = {
+            "z": z,
+            "x": x,
+            "y": y,
+            "bounds": tile_bounds(z, x, y),
+            "grid": {
+                "rows": TILE_GRID_SIZE,
+                "cols": TILE_GRID_SIZE,
+                "latitudes": [points[row * TILE_GRID_SIZE][0] for row in range(TILE_GRID_SIZE)],
+                "longitudes": [points[col][1] for col in range(TILE_GRID_SIZE)],
+            },
+            "fields": columns,
+            "time": max(times) if times else None,
+            "units": units,
+            "updated_at": datetime.now().isoformat(),
+        }
+
+        # Eksik hücre içeren karolar önbelleğe alınmaz; bir sonraki istekte tamamlanır.
+        # Karo, noktalarından ilkinin güncellenmesiyle birlikte geçersiz olur.
+        if all(results):
+            deadlines = [
+                expires_at for expires_at in (WeatherService.expires_at(weather_data, TILE) for weather_data in results)
+                if expires_at is not None
+            ]
+            TileService._cache.set(cache_key, tile, min(deadlines) if deadlines else None)
+
+        return tile
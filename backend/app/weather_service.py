@@ -1,17 +1,306 @@
-import requests
-from typing import Optional, Dict, Any
-from datetime import datetime
+import asyncio
+import time
+import httpx
+from collections import Counter
+from typing import Optional, Dict, Any, List, Tuple, Iterator
+from datetime import datetime, timedelta, timezone
 import logging
 
+from config import (
+    OPEN_METEO_URL,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+    CACHE_ENABLED,
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL_SECONDS,
+    CACHE_GRID_RESOLUTION,
+    CACHE_STALE_GRACE_SECONDS,
+    CACHE_NEAREST_MAX_KM,
+    CACHE_SPATIAL_BUCKET_DEGREES,
+    CACHE_NEAREST_INTERPOLATE,
+    BATCH_CHUNK_SIZE,
+    DISK_CACHE_ENABLED,
+    DISK_CACHE_PATH,
+    DISK_CACHE_TTL_SECONDS,
+    DISK_CACHE_COMPACT_INTERVAL,
+    HOT_REFRESH_ENABLED,
+    HOT_REFRESH_TOP_N,
+    HOT_REFRESH_INTERVAL_SECONDS,
+    HOT_REFRESH_OFFSET_SECONDS,
+    UPSTREAM_MAX_CONCURRENCY,
+    UPSTREAM_QUEUE_TIMEOUT,
+    UPSTREAM_MAX_RETRIES,
+    UPSTREAM_RETRY_BASE_DELAY,
+    UPSTREAM_RETRY_BUDGET_RATIO,
+    UPSTREAM_RETRY_BUDGET_MAX,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_TIMEOUT,
+)
+from cache import ForecastCache, CacheKey, make_key, snap_coordinate
+from spatial import SpatialIndex, grid_corners, interpolate_bilinear
+from disk_cache import DiskForecastCache
+from resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ConcurrencyLimiter,
+    RetryBudget,
+    UpstreamBusyError,
+    backoff_delay,
+)
+from normalize import normalize_location, normalize_locations
+from profiles import VariableProfile, COVERING, FULL, WEATHER, WEEKLY, TOMORROW, hourly_profile
+import hourly
+import json_backend
+import summaries
+from metrics import STAGE_SECONDS, UPSTREAM_ERRORS, UPSTREAM_REQUEST_SECONDS, timed
+
 logger = logging.getLogger(__name__)
 
 class WeatherService:
     """Open-Meteo API kullanarak hava durumu verileri sağlar"""
     
-    BASE_URL = "https://api.open-meteo.com/v1/forecast"
+    BASE_URL = OPEN_METEO_URL
+    
+    # Uygulama ömrü boyunca paylaşılan keep-alive bağlantı havuzu
+    _client: Optional[httpx.AsyncClient] = None
+    
+    # Normalize edilmiş hava durumu verileri için önbellek (devre dışıysa None).
+    # Yakın kayıt araması açıksa hücreler uzamsal indekste de tutulur
+    _cache: Optional[ForecastCache] = (
+        ForecastCache(
+            CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS, CACHE_STALE_GRACE_SECONDS,
+            SpatialIndex(CACHE_SPATIAL_BUCKET_DEGREES) if CACHE_NEAREST_MAX_KM > 0 else None,
+        )
+        if CACHE_ENABLED else None
+    )
+    
+    # Hücre başına istek sayısı; saat başı yenilenecek popüler hücreleri belirler
+    _popularity: "Counter[CacheKey]" = Counter()
+    _refresh_task: Optional["asyncio.Task[None]"] = None
+    
+    # Referansı tutulması gereken arka plan görevleri (bayat kayıt yenileme)
+    _background_tasks: set = set()
+    
+    # Upstream dayanıklılık katmanı: devre kesici, yeniden deneme bütçesi ve
+    # eşzamanlılık sınırı (semafor event loop'a bağlı olduğu için startup'ta oluşturulur)
+    _breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT)
+    _retry_budget = RetryBudget(UPSTREAM_RETRY_BUDGET_RATIO, UPSTREAM_RETRY_BUDGET_MAX)
+    _limiter: Optional[ConcurrencyLimiter] = None
+    
+    # Yeniden denenebilecek upstream durum kodları
+    RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+    
+    # Worker'lar ve yeniden başlatmalar arasında paylaşılan disk önbelleği (startup'ta açılır)
+    _disk_cache: Optional[DiskForecastCache] = None
+    _compaction_task: Optional["asyncio.Task[None]"] = None
     
+    @classmethod
+    def _create_client(cls) -> httpx.AsyncClient:
+        """Yapılandırmaya göre yeni bir asenkron HTTP istemcisi oluşturur"""
+        # Tüm istekler tek bir hosta (Open-Meteo) gittiği için havuz sınırı
+        # aynı zamanda host başına bağlantı sınırıdır
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        )
+    
+    @classmethod
+    async def startup(cls) -> None:
+        """Paylaşılan HTTP bağlantı havuzunu ve disk önbelleğini açar (FastAPI başlangıcında çağrılır)"""
+        if cls._client is None:
+            cls._client = cls._create_client()
+        if cls._limiter is None:
+            cls._limiter = ConcurrencyLimiter(UPSTREAM_MAX_CONCURRENCY, UPSTREAM_QUEUE_TIMEOUT)
+        
+        # Her worker kendi SQLite bağlantısını fork sonrasında açar
+        if DISK_CACHE_ENABLED and cls._disk_cache is None:
+            cls._disk_cache = DiskForecastCache(DISK_CACHE_PATH, DISK_CACHE_TTL_SECONDS)
+            cls._compaction_task = asyncio.create_task(cls._compact_periodically())
+        
+        if HOT_REFRESH_ENABLED and cls._cache is not None and cls._refresh_task is None:
+            cls._refresh_task = asyncio.create_task(cls._refresh_hot_periodically())
+    
+    @classmethod
+    async def shutdown(cls) -> None:
+        """
+        Paylaşılan HTTP bağlantı havuzunu ve disk önbelleğini kapatır (FastAPI kapanışında çağrılır)
+        
+        Arka plan görevleri ve devam eden single-flight istekleri istemci kapanmadan
+        iptal edilip beklenir; bekleyenler "client has been closed" hatası yerine
+        CancelledError alır. Toplu isteklerin future'ları onları çağıran görevlerce
+        (istek, dışa aktarma işi) tamamlanır.
+        """
+        inflight = [future for future in cls._inflight.values() if isinstance(future, asyncio.Task)]
+        for task in (cls._compaction_task, cls._refresh_task, *cls._background_tasks, *inflight):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        cls._compaction_task = None
+        cls._refresh_task = None
+        cls._background_tasks.clear()
+        
+        if cls._client is not None:
+            await cls._client.aclose()
+            cls._client = None
+        cls._limiter = None
+        
+        if cls._disk_cache is not None:
+            cls._disk_cache.close()
+            cls._disk_cache = None
+    
+    @classmethod
+    async def _compact_periodically(cls) -> None:
+        """Disk önbelleğindeki süresi dolmuş kayıtları düzenli aralıklarla temizler"""
+        while True:
+            await asyncio.sleep(DISK_CACHE_COMPACT_INTERVAL)
+            if cls._disk_cache is not None:
+                deleted = await cls._disk_cache.compact()
+                if deleted:
+                    logger.info(f"Disk önbelleğinden {deleted} eski kayıt silindi")
+    
+    @classmethod
+    async def _refresh_hot_periodically(cls) -> None:
+        """
+        Her saat sınırından HOT_REFRESH_OFFSET_SECONDS sonra en popüler hücreleri yeniler
+        
+        Open-Meteo yeni veriyi sınırda yayınlar; sınırdan hemen önce yapılan bir
+        istek eski veriyi döndüreceği için yenileme sınırın hemen ardından yapılır.
+        """
+        while True:
+            now = time.time()
+            next_run = (now // HOT_REFRESH_INTERVAL_SECONDS) * HOT_REFRESH_INTERVAL_SECONDS + HOT_REFRESH_OFFSET_SECONDS
+            if next_run <= now:
+                next_run += HOT_REFRESH_INTERVAL_SECONDS
+            await asyncio.sleep(next_run - now)
+            try:
+                await cls.refresh_hot_locations()
+            except Exception as e:
+                logger.error(f"Popüler konumlar yenilenemedi: {e}")
+    
+    @classmethod
+    async def refresh_hot_locations(cls, top_n: int = HOT_REFRESH_TOP_N) -> int:
+        """
+        En çok istenen hücreleri önbelleğe bakmadan yeniden çeker
+        
+        Sayaçlar her turda yarıya indirilir; böylece popülerlik son talebi izler.
+        
+        Returns:
+            Yenilenen hücre sayısı
+        """
+        hot = [cache_key for cache_key, _ in cls._popularity.most_common(top_n)]
+        
+        cls._popularity = Counter({
+            cache_key: count // 2
+            for cache_key, count in cls._popularity.most_common(top_n * 10)
+            if count // 2
+        })
+        
+        if not hot:
+            return 0
+        results = await cls._fetch_many([(cache_key, *cache_key[:3]) for cache_key in hot])
+        refreshed = sum(1 for weather_data in results.values() if weather_data)
+        logger.info(f"{refreshed}/{len(hot)} popüler hücre yenilendi")
+        return refreshed
+    
+    @classmethod
+    def get_limiter(cls) -> ConcurrencyLimiter:
+        """Upstream eşzamanlılık sınırlayıcısını döndürür; yoksa tembel olarak oluşturur"""
+        if cls._limiter is None:
+            cls._limiter = ConcurrencyLimiter(UPSTREAM_MAX_CONCURRENCY, UPSTREAM_QUEUE_TIMEOUT)
+        return cls._limiter
+    
+    @classmethod
+    def upstream_stats(cls) -> Dict[str, Any]:
+        """Devre kesici durumu, kuyruk derinliği ve yeniden deneme bütçesini döndürür"""
+        return {
+            "breaker": cls._breaker.stats(),
+            "concurrency": cls.get_limiter().stats(),
+            "retry_budget": cls._retry_budget.stats(),
+        }
+    
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """Paylaşılan istemciyi döndürür; startup çağrılmadıysa tembel olarak oluşturur"""
+        if cls._client is None:
+            cls._client = cls._create_client()
+        return cls._client
+    
+    # Aynı (ızgara hücresi, birim, profil) için devam eden upstream istekleri
+    _inflight: Dict[CacheKey, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+    
+    @staticmethod
+    def cache_stats() -> Dict[str, Any]:
+        """Önbellek sayaçlarını döndürür"""
+        stats: Dict[str, Any] = {"enabled": False}
+        if WeatherService._cache is not None:
+            stats = {"enabled": True, **WeatherService._cache.stats()}
+        if WeatherService._disk_cache is not None:
+            stats["disk"] = WeatherService._disk_cache.stats()
+        stats["summaries"] = summaries.cache_stats()
+        return stats
+    
+    @staticmethod
+    def _next_update_at(data: Dict[str, Any]) -> Optional[float]:
+        """
+        Open-Meteo `current` bloğunun bir sonraki güncelleme anını (epoch) hesaplar
+        
+        `current.time` yerel saattir; `utc_offset_seconds` ile UTC'ye çevrilir ve
+        `current.interval` kadar ileri alınır. Hesaplanamazsa None döner.
+        """
+        current = data.get("current") or {}
+        if not current.get("time"):
+            return None
+        try:
+            local_time = datetime.fromisoformat(current["time"])
+        except (TypeError, ValueError):
+            return None
+        
+        offset = timedelta(seconds=data.get("utc_offset_seconds") or 0)
+        interval = timedelta(seconds=current.get("interval") or 900)
+        next_update = (local_time - offset + interval).replace(tzinfo=timezone.utc).timestamp()
+        
+        # Upstream verisi zaten eskiyse sınır geçmiştir; yalnızca TTL kullanılsın
+        if next_update <= datetime.now(timezone.utc).timestamp():
+            return None
+        return next_update
+    
+    @staticmethod
+    def _with_location(weather_data: Dict[str, Any], lat: float, lon: float) -> Dict[str, Any]:
+        """Önbellekteki kaydı istenen koordinatlarla kopyalar"""
+        return {**weather_data, "location": {"latitude": lat, "longitude": lon}}
+
     @staticmethod
-    async def get_weather_by_coordinates(lat: float, lon: float, units: str = "metric") -> Optional[Dict[str, Any]]:
+    def expires_at(weather_data: Dict[str, Any], profile: VariableProfile = FULL) -> Optional[float]:
+        """
+        Yanıtın geldiği önbellek kaydının geçerliliğini yitireceği an (epoch)
+
+        Kayıtlar bir sonraki Open-Meteo güncellemesinde (en geç TTL sonunda)
+        geçersiz olur; HTTP önbellek süresi buna göre ayarlanır. `location`
+        yanıtı veren ızgara hücresini gösterdiğinden komşu hücre yanıtlarında da
+        doğru kayıt bulunur. Önbellek kapalıysa veya kayıt bayatsa None döner.
+        """
+        if WeatherService._cache is None:
+            return None
+        location = weather_data["location"]
+        cache_key = WeatherService._cache_key(
+            location["latitude"], location["longitude"], weather_data["units"], profile
+        )
+        return WeatherService._cache.expires_at(WeatherService._covering_keys(cache_key))
+
+    @staticmethod
+    async def get_weather_by_coordinates(lat: float, lon: float, units: str = "metric",
+                                         profile: VariableProfile = FULL) -> Optional[Dict[str, Any]]:
         """
         Koordinatlara göre mevcut hava durumu verilerini alır
         
@@ -19,216 +308,514 @@ class WeatherService:
             lat: Enlem
             lon: Boylam
             units: Birim sistemi ('metric' veya 'imperial')
+            profile: İstenecek değişken kümesi; onu kapsayan önbellek kaydı da kullanılır
+        
+        Hücre önbellekte yoksa CACHE_NEAREST_MAX_KM içindeki en yakın geçerli kayıt
+        döndürülür; bu durumda `location` yanıtlayan ızgara noktasıdır.
+        CACHE_NEAREST_INTERPOLATE açıksa ızgara noktası üzerinde olmayan noktalar
+        çevreleyen dört hücreden enterpole edilir.
         
         Returns:
             Hava durumu verilerini içeren dict veya None
         """
-        try:
-            # Open-Meteo API parametreleri
-            params = {
-                "latitude": lat,
-                "longitude": lon,
-                "current": [
-                    "temperature_2m", "apparent_temperature", "relative_humidity_2m", 
-                    "precipitation", "pressure_msl", "surface_pressure",
-                    "wind_speed_10m", "wind_direction_10m", "wind_gusts_10m",
-                    "uv_index", "cloud_cover", "visibility"
-                ],
-                "daily": [
-                    "temperature_2m_max", "temperature_2m_min", "weathercode",
-                    "sunrise", "sunset", "uv_index_max", "precipitation_sum",
-                    "wind_speed_10m_max", "wind_direction_10m_dominant"
-                ],
-                "timezone": "auto",
-                "forecast_days": 7  # 7 günlük tahmin için
-            }
-            
-            # Birim ayarları
-            if units == "imperial":
-                params["temperature_unit"] = "fahrenheit"
-                params["wind_speed_unit"] = "mph"
-                params["precipitation_unit"] = "inch"
-            
-            response = requests.get(WeatherService.BASE_URL, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Veriyi düzenle
-            current = data.get("current", {})
-            daily = data.get("daily", {})
-            
-            weather_data = {
-                "location": {
-                    "latitude": lat,
-                    "longitude": lon
-                },
-                "current": {
-                    "temperature": current.get("temperature_2m"),
-                    "apparent_temperature": current.get("apparent_temperature"),
-                    "humidity": current.get("relative_humidity_2m"),
-                    "pressure": current.get("pressure_msl"),
-                    "surface_pressure": current.get("surface_pressure"),
-                    "wind_speed": current.get("wind_speed_10m"),
-                    "wind_direction": current.get("wind_direction_10m"),
-                    "wind_gusts": current.get("wind_gusts_10m"),
-                    "precipitation": current.get("precipitation"),
-                    "uv_index": current.get("uv_index"),
-                    "cloud_cover": current.get("cloud_cover"),
-                    "visibility": current.get("visibility"),
-                    "time": current.get("time")
-                },
-                "today": {
-                    "max_temp": daily.get("temperature_2m_max", [None])[0] if daily.get("temperature_2m_max") else None,
-                    "min_temp": daily.get("temperature_2m_min", [None])[0] if daily.get("temperature_2m_min") else None,
-                    "weather_code": daily.get("weathercode", [None])[0] if daily.get("weathercode") else None,
-                    "sunrise": daily.get("sunrise", [None])[0] if daily.get("sunrise") else None,
-                    "sunset": daily.get("sunset", [None])[0] if daily.get("sunset") else None,
-                    "uv_index_max": daily.get("uv_index_max", [None])[0] if daily.get("uv_index_max") else None,
-                    "precipitation_sum": daily.get("precipitation_sum", [None])[0] if daily.get("precipitation_sum") else None
-                },
-                "forecast": {
-                    "daily": []
-                },
-                "units": units,
-                "updated_at": datetime.now().isoformat()
-            }
-            
-            # 7 günlük tahmin ekle
-            if daily.get("time"):
-                for i in range(min(7, len(daily.get("time", [])))):
-                    forecast_day = {
-                        "date": daily.get("time", [])[i] if i < len(daily.get("time", [])) else None,
-                        "max_temp": daily.get("temperature_2m_max", [])[i] if i < len(daily.get("temperature_2m_max", [])) else None,
-                        "min_temp": daily.get("temperature_2m_min", [])[i] if i < len(daily.get("temperature_2m_min", [])) else None,
-                        "weather_code": daily.get("weathercode", [])[i] if i < len(daily.get("weathercode", [])) else None,
-                        "precipitation": daily.get("precipitation_sum", [])[i] if i < len(daily.get("precipitation_sum", [])) else None,
-                        "wind_speed": daily.get("wind_speed_10m_max", [])[i] if i < len(daily.get("wind_speed_10m_max", [])) else None,
-                        "wind_direction": daily.get("wind_direction_10m_dominant", [])[i] if i < len(daily.get("wind_direction_10m_dominant", [])) else None
-                    }
-                    weather_data["forecast"]["daily"].append(forecast_day)
-            
-            return weather_data
-            
-        except requests.RequestException as e:
-            logger.error(f"API isteği başarısız: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Hava durumu verileri alınırken hata: {e}")
+        cache = WeatherService._cache
+        cache_key = WeatherService._cache_key(lat, lon, units, profile)
+        WeatherService._track(cache_key)
+        if cache is not None:
+            cached, stale, answered = cache.lookup_near(
+                WeatherService._covering_keys(cache_key), lat, lon, CACHE_NEAREST_MAX_KM
+            )
+            if cached is not None:
+                # Bayat kayıt hemen döndürülür, arka planda tek bir görevle yenilenir
+                if stale:
+                    WeatherService._start_fetch(lat, lon, units, cache_key)
+                elif CACHE_NEAREST_INTERPOLATE and (lat, lon) != cache_key[:2]:
+                    interpolated = WeatherService._interpolate(lat, lon, cache_key)
+                    if interpolated is not None:
+                        return interpolated
+                if answered[:2] != cache_key[:2]:
+                    return WeatherService._with_location(cached, answered[0], answered[1])
+                return WeatherService._with_location(cached, lat, lon)
+        
+        inflight = WeatherService._start_fetch(lat, lon, units, cache_key)
+        
+        # Bir çağıranın iptali, aynı isteği bekleyen diğerlerini etkilemesin
+        weather_data = await asyncio.shield(inflight)
+        if weather_data is None:
             return None
+        return WeatherService._with_location(weather_data, lat, lon)
     
     @staticmethod
-    def get_weather_description(weather_code: Optional[int]) -> str:
-        """Hava durumu kodundan açıklama döndürür"""
-        if not weather_code:
-            return "Bilinmeyen"
-            
-        weather_codes = {
-            0: "Açık hava",
-            1: "Çoğunlukla açık",
-            2: "Parçalı bulutlu",
-            3: "Bulutlu",
-            45: "Sisli",
-            48: "Kırağılı sis",
-            51: "Hafif çisenti",
-            53: "Orta çisenti", 
-            55: "Yoğun çisenti",
-            61: "Hafif yağmur",
-            63: "Orta yağmur",
-            65: "Şiddetli yağmur",
-            71: "Hafif kar",
-            73: "Orta kar",
-            75: "Şiddetli kar",
-            80: "Hafif sağanak",
-            81: "Orta sağanak",
-            82: "Şiddetli sağanak",
-            95: "Gök gürültülü fırtına",
-            96: "Hafif dolu ile fırtına",
-            99: "Şiddetli dolu ile fırtına"
-        }
+    def _interpolate(lat: float, lon: float, cache_key: CacheKey) -> Optional[Dict[str, Any]]:
+        """
+        Noktayı çevreleyen dört ızgara hücresinin geçerli kayıtlarından bilinear
+        enterpolasyonla veri üretir; köşelerden biri eksikse None döner
+        """
+        (south, north, west, east), fy, fx = grid_corners(lat, lon, CACHE_GRID_RESOLUTION)
+        corners = []
+        for corner_lat, corner_lon in ((south, west), (south, east), (north, west), (north, east)):
+            key = (
+                snap_coordinate(corner_lat, CACHE_GRID_RESOLUTION),
+                snap_coordinate(corner_lon, CACHE_GRID_RESOLUTION),
+                *cache_key[2:],
+            )
+            weather_data = WeatherService._cache.peek_fresh(WeatherService._covering_keys(key))
+            if weather_data is None:
+                return None
+            corners.append(weather_data)
+        return WeatherService._with_location(interpolate_bilinear(corners, fy, fx), lat, lon)
+    
+    @staticmethod
+    def _cache_key(lat: float, lon: float, units: str, profile: VariableProfile) -> CacheKey:
+        """(ızgara hücresi, birim, profil) önbellek anahtarı"""
+        return (*make_key(lat, lon, units, CACHE_GRID_RESOLUTION), profile)
+    
+    @staticmethod
+    def _covering_keys(cache_key: CacheKey) -> List[CacheKey]:
+        """Aynı hücre için isteği karşılayabilecek anahtarlar: önce kendisi, sonra daha geniş profiller"""
+        profile = cache_key[3]
+        return [(*cache_key[:3], other) for other in COVERING.get(profile, (profile,))]
+    
+    @staticmethod
+    def _find_inflight(cache_key: CacheKey) -> Optional["asyncio.Future"]:
+        """Hücre için isteği karşılayabilecek devam eden bir upstream isteği döndürür"""
+        for key in WeatherService._covering_keys(cache_key):
+            inflight = WeatherService._inflight.get(key)
+            if inflight is not None:
+                return inflight
+        return None
+    
+    @staticmethod
+    def _track(cache_key: CacheKey) -> None:
+        """Hücrenin istek sayısını artırır (popüler hücre yenilemesi için)"""
+        if HOT_REFRESH_ENABLED:
+            WeatherService._popularity[cache_key] += 1
+    
+    @staticmethod
+    def _start_fetch(lat: float, lon: float, units: str, cache_key: CacheKey) -> "asyncio.Future":
+        """
+        Hücre için devam eden isteği döndürür; yoksa yenisini başlatır (single-flight)
         
-        return weather_codes.get(weather_code, f"Hava kodu: {weather_code}")
+        Aynı hücre için daha geniş bir profille devam eden istek de paylaşılır.
+        """
+        inflight = WeatherService._find_inflight(cache_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(WeatherService._fetch_weather(lat, lon, units, cache_key))
+            WeatherService._inflight[cache_key] = inflight
+            inflight.add_done_callback(lambda _: WeatherService._inflight.pop(cache_key, None))
+        return inflight
     
     @staticmethod
-    async def get_weather_summary(lat: float, lon: float, units: str = "metric") -> Optional[str]:
+    def _build_params(latitude: Any, longitude: Any, units: str, profile: VariableProfile = FULL) -> Dict[str, Any]:
         """
-        Sohbet için hava durumu özeti döndürür
+        Open-Meteo istek parametrelerini oluşturur
         
         Args:
-            lat: Enlem
-            lon: Boylam
+            latitude: Enlem veya virgülle ayrılmış enlem listesi
+            longitude: Boylam veya virgülle ayrılmış boylam listesi
             units: Birim sistemi
+            profile: İstenecek `current`/`daily`/`hourly` değişkenleri ve gün sayısı
+        """
+        params = {
+            "latitude": latitude,
+            "longitude": longitude,
+            "timezone": "auto",
+            "forecast_days": profile.forecast_days
+        }
+        if profile.current:
+            params["current"] = ",".join(profile.current)
+        if profile.daily:
+            params["daily"] = ",".join(profile.daily)
+        if profile.hourly:
+            params["hourly"] = ",".join(profile.hourly)
+        
+        # Birim ayarları
+        if units == "imperial":
+            params["temperature_unit"] = "fahrenheit"
+            params["wind_speed_unit"] = "mph"
+            params["precipitation_unit"] = "inch"
+        
+        return params
+    
+    @staticmethod
+    async def _request_forecast(params: Dict[str, Any]) -> Any:
+        """
+        Open-Meteo'ya isteği gönderir ve çözümlenmiş JSON gövdesini döndürür
+        
+        İstekler eşzamanlılık sınırından geçer. Bağlantı hataları, zaman aşımları ve
+        429/5xx yanıtları yeniden deneme bütçesi izin verdiği sürece jitter'lı
+        üstel geri çekilmeyle tekrarlanır. Devre kesici açıkken hiç istek yapılmaz.
+        Yerel kuyrukta bekleme süresinin aşılması upstream sağlığını göstermediğinden
+        yeniden denenmez ve devre kesiciye hata olarak sayılmaz.
+        İstek sonucu kaydedilmeden iptal edilirse devre kesicinin deneme hakkı
+        geri verilir.
+        
+        Raises:
+            CircuitOpenError: Devre kesici açık
+            UpstreamBusyError: Eşzamanlılık kuyruğunda bekleme süresi aşıldı
+            httpx.HTTPError: Yeniden denemeler tükendikten sonraki son hata
+        """
+        breaker = WeatherService._breaker
+        budget = WeatherService._retry_budget
+        budget.deposit()
+        
+        attempt = 0
+        while True:
+            if not breaker.allow_request():
+                UPSTREAM_ERRORS.inc(("none", "CircuitOpenError"))
+                raise CircuitOpenError("Open-Meteo devre kesicisi açık")
             
-        Returns:
-            Formatlanmış hava durumu metni
+            try:
+                async with WeatherService.get_limiter():
+                    # Kuyrukta bekleme süresi upstream süresine dahil edilmez
+                    start = time.perf_counter()
+                    response = await WeatherService.get_client().get(WeatherService.BASE_URL, params=params)
+                UPSTREAM_REQUEST_SECONDS.observe(time.perf_counter() - start, (str(response.status_code),))
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                UPSTREAM_ERRORS.inc((str(e.response.status_code), "HTTPStatusError"))
+                if e.response.status_code not in WeatherService.RETRYABLE_STATUS:
+                    # İstemci hatası upstream sağlığını göstermez
+                    breaker.record_success()
+                    raise
+                error = e
+            except UpstreamBusyError:
+                UPSTREAM_ERRORS.inc(("none", "UpstreamBusyError"))
+                breaker.release()
+                raise
+            except httpx.TransportError as e:
+                UPSTREAM_REQUEST_SECONDS.observe(time.perf_counter() - start, ("error",))
+                UPSTREAM_ERRORS.inc(("none", type(e).__name__))
+                error = e
+            except BaseException:
+                # İptal (istemci ayrıldı, kapanış) veya beklenmeyen hata: sonuç
+                # kaydedilmediğinden deneme hakkı geri verilmezse devre yarı açık kalır
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                with timed(STAGE_SECONDS, ("parse",)):
+                    return json_backend.loads(response.content)
+            
+            breaker.record_failure()
+            if attempt >= UPSTREAM_MAX_RETRIES or not budget.try_spend():
+                raise error
+            
+            await asyncio.sleep(backoff_delay(attempt, UPSTREAM_RETRY_BASE_DELAY))
+            attempt += 1
+    
+    @staticmethod
+    def _last_known(cache_key: CacheKey) -> Optional[Dict[str, Any]]:
+        """Upstream erişilemezken bellek önbelleğindeki son bilinen değeri döndürür"""
+        if WeatherService._cache is None:
+            return None
+        for key in WeatherService._covering_keys(cache_key):
+            weather_data = WeatherService._cache.peek(key)
+            if weather_data is not None:
+                logger.warning(f"Upstream erişilemiyor, son bilinen veri kullanılıyor: {cache_key[:3]} ({key[3].name})")
+                return weather_data
+        return None
+    
+    @staticmethod
+    def _disk_key(cache_key: CacheKey) -> CacheKey:
+        """Disk önbelleği anahtarı: (ızgara hücresi, birim, değişken kümesi imzası)"""
+        return (*cache_key[:3], cache_key[3].signature)
+    
+    @staticmethod
+    async def _store(entries: List[Tuple[CacheKey, Dict[str, Any], Dict[str, Any]]],
+                     remember: bool = True) -> None:
         """
-        weather_data = await WeatherService.get_weather_by_coordinates(lat, lon, units)
+        Normalize edilmiş verileri bir sonraki güncelleme sınırına kadar bellek ve
+        disk önbelleğine yazar
         
-        if not weather_data:
-            return "Üzgünüm, şu anda hava durumu verilerini alamıyorum."
+        Args:
+            entries: (önbellek anahtarı, normalize veri, ham Open-Meteo verisi) listesi
+            remember: False ise yalnızca diske yazılır, bellek önbelleğine girmez
+        """
+        rows = [
+            (cache_key, weather_data, WeatherService._next_update_at(data))
+            for cache_key, weather_data, data in entries
+        ]
+        if remember and WeatherService._cache is not None:
+            for cache_key, weather_data, expires_at in rows:
+                WeatherService._cache.set(cache_key, weather_data, expires_at)
+        if WeatherService._disk_cache is not None:
+            await WeatherService._disk_cache.set_many([
+                (WeatherService._disk_key(cache_key), weather_data, expires_at)
+                for cache_key, weather_data, expires_at in rows
+            ])
+    
+    @staticmethod
+    async def _load_from_disk(cache_keys: List[CacheKey],
+                              remember: bool = True) -> Dict[CacheKey, Dict[str, Any]]:
+        """
+        Bellekte bulunamayan kayıtları disk önbelleğinden okur ve belleğe yükler
         
-        current = weather_data["current"]
-        today = weather_data["today"]
+        Her anahtar için onu kapsayan daha geniş profillerin kayıtlarına da bakılır.
+        `remember` False ise kayıtlar belleğe yüklenmeden döndürülür.
         
-        temp_unit = "°F" if units == "imperial" else "°C"
-        wind_unit = "mph" if units == "imperial" else "m/s"
-        pressure_unit = "inHg" if units == "imperial" else "hPa"
+        Returns:
+            Diskte bulunan kayıtlar (önbellek anahtarı -> normalize veri)
+        """
+        disk = WeatherService._disk_cache
+        if disk is None or not cache_keys:
+            return {}
+        
+        candidates = {cache_key: WeatherService._covering_keys(cache_key) for cache_key in cache_keys}
+        disk_keys = {
+            DiskForecastCache.serialize_key(WeatherService._disk_key(key)): key
+            for keys in candidates.values() for key in keys
+        }
+        found = await disk.get_many([WeatherService._disk_key(key) for key in disk_keys.values()])
+        found_by_key = {disk_keys[serialized]: entry for serialized, entry in found.items()}
+        
+        loaded = {}
+        for cache_key, keys in candidates.items():
+            for key in keys:
+                if key not in found_by_key:
+                    continue
+                weather_data, expires_at = found_by_key[key]
+                if remember and WeatherService._cache is not None:
+                    WeatherService._cache.set(key, weather_data, expires_at)
+                loaded[cache_key] = weather_data
+                break
+        return loaded
+    
+    @staticmethod
+    async def _fetch_weather(lat: float, lon: float, units: str, cache_key: CacheKey) -> Optional[Dict[str, Any]]:
+        """
+        Open-Meteo'dan veriyi çeker, normalize eder ve önbelleğe yazar
         
-        description = WeatherService.get_weather_description(today.get("weather_code"))
+        Args:
+            lat: Enlem
+            lon: Boylam
+            units: Birim sistemi
+            cache_key: Önbellek / single-flight anahtarı
         
-        summary = f"**Bugünün Hava Durumu**\n\n"
-        summary += f"Konum: {lat:.3f}, {lon:.3f}\n"
-        summary += f"Sıcaklık: {current.get('temperature', 'N/A')}{temp_unit}\n"
+        Returns:
+            Hava durumu verilerini içeren dict veya None
+        """
+        try:
+            loaded = await WeatherService._load_from_disk([cache_key])
+            if cache_key in loaded:
+                return loaded[cache_key]
+            
+            data = await WeatherService._request_forecast(WeatherService._build_params(lat, lon, units, cache_key[3]))
+            with timed(STAGE_SECONDS, ("normalize",)):
+                weather_data = normalize_location(data, lat, lon, units)
+            await WeatherService._store([(cache_key, weather_data, data)])
+            return weather_data
+            
+        except (CircuitOpenError, UpstreamBusyError) as e:
+            logger.warning(f"API isteği yapılmadı: {e}")
+            return WeatherService._last_known(cache_key)
+        except httpx.HTTPError as e:
+            logger.error(f"API isteği başarısız: {e}")
+            return WeatherService._last_known(cache_key)
+        except Exception as e:
+            logger.error(f"Hava durumu verileri alınırken hata: {e}")
+            return WeatherService._last_known(cache_key)
+    
+    @staticmethod
+    async def _fetch_weather_chunk(chunk: List[Tuple[CacheKey, float, float, "asyncio.Future"]], units: str,
+                                   profile: VariableProfile, remember: bool = True) -> None:
+        """
+        Bir grup konumu Open-Meteo'nun çoklu konum biçimiyle tek istekte çeker
         
-        if current.get("apparent_temperature"):
-            summary += f"Hissedilen: {current['apparent_temperature']}{temp_unit}\n"
+        Önce disk önbelleğine bakılır, yalnızca bulunamayanlar upstream'e gider.
+        Her konumun sonucu kendi single-flight future'ına yazılır; hata durumunda
+        çözülmemiş future'lar son bilinen değerle (yoksa None) tamamlanır.
+        """
+        try:
+            loaded = await WeatherService._load_from_disk([cache_key for cache_key, _, _, _ in chunk], remember)
+            for cache_key, _, _, future in chunk:
+                if cache_key in loaded:
+                    future.set_result(loaded[cache_key])
+            
+            missing = [item for item in chunk if item[0] not in loaded]
+            if not missing:
+                return
+            
+            params = WeatherService._build_params(
+                ",".join(str(lat) for _, lat, _, _ in missing),
+                ",".join(str(lon) for _, _, lon, _ in missing),
+                units,
+                profile
+            )
+            data = await WeatherService._request_forecast(params)
+            
+            # Tek konum istendiğinde Open-Meteo liste yerine nesne döndürür
+            locations = data if isinstance(data, list) else [data]
+            with timed(STAGE_SECONDS, ("normalize",)):
+                normalized = normalize_locations(locations, [(lat, lon) for _, lat, lon, _ in missing], units)
+            
+            await WeatherService._store([
+                (cache_key, weather_data, location_data)
+                for (cache_key, _, _, _), location_data, weather_data in zip(missing, locations, normalized)
+            ], remember)
+            for (_, _, _, future), weather_data in zip(missing, normalized):
+                future.set_result(weather_data)
+                
+        except (CircuitOpenError, UpstreamBusyError) as e:
+            logger.warning(f"Toplu API isteği yapılmadı: {e}")
+        except httpx.HTTPError as e:
+            logger.error(f"Toplu API isteği başarısız: {e}")
+        except Exception as e:
+            logger.error(f"Toplu hava durumu verileri alınırken hata: {e}")
+        finally:
+            for cache_key, _, _, future in chunk:
+                if not future.done():
+                    future.set_result(WeatherService._last_known(cache_key))
+                if WeatherService._inflight.get(cache_key) is future:
+                    del WeatherService._inflight[cache_key]
+    
+    @staticmethod
+    async def _fetch_many(items: List[Tuple[CacheKey, float, float, str]],
+                          remember: bool = True) -> Dict[CacheKey, Optional[Dict[str, Any]]]:
+        """
+        Hücreleri bellek önbelleğine bakmadan toplu olarak çeker
         
-        if today.get("max_temp") and today.get("min_temp"):
-            summary += f"Bugün: {today['max_temp']}{temp_unit} / {today['min_temp']}{temp_unit}\n"
+        Devam eden isteği olan hücreler ona katılır; diğerleri birim ve profil
+        bazında BATCH_CHUNK_SIZE büyüklüğündeki çoklu konum istekleriyle çekilir.
         
-        summary += f"Durum: {description}\n"
+        Args:
+            items: (önbellek anahtarı, enlem, boylam, birim) listesi; profil anahtardadır
+            remember: Çekilen kayıtlar bellek önbelleğine yazılsın mı
         
-        if current.get("humidity"):
-            summary += f"Nem: %{current['humidity']}\n"
-            
-        if current.get("pressure"):
-            summary += f"Basınç: {current['pressure']} {pressure_unit}\n"
+        Returns:
+            Önbellek anahtarı -> hava durumu verisi (alınamayanlar için None)
+        """
+        loop = asyncio.get_running_loop()
+        waiting: Dict[CacheKey, "asyncio.Future"] = {}
+        pending: Dict[Tuple[str, VariableProfile], List[Tuple[CacheKey, float, float, "asyncio.Future"]]] = {}
         
-        summary += f"Rüzgar: {current.get('wind_speed', 'N/A')} {wind_unit}\n"
+        for cache_key, lat, lon, units in items:
+            if cache_key in waiting:
+                continue
+            inflight = WeatherService._find_inflight(cache_key)
+            if inflight is None:
+                inflight = loop.create_future()
+                WeatherService._inflight[cache_key] = inflight
+                pending.setdefault((units, cache_key[3]), []).append((cache_key, lat, lon, inflight))
+            waiting[cache_key] = inflight
+        
+        chunks = [
+            (chunk_items[i:i + BATCH_CHUNK_SIZE], units, profile)
+            for (units, profile), chunk_items in pending.items()
+            for i in range(0, len(chunk_items), BATCH_CHUNK_SIZE)
+        ]
+        await asyncio.gather(*(
+            WeatherService._fetch_weather_chunk(chunk, units, profile, remember) for chunk, units, profile in chunks
+        ))
+        
+        return {cache_key: await asyncio.shield(future) for cache_key, future in waiting.items()}
+    
+    @staticmethod
+    def _spawn(coro) -> None:
+        """Arka plan görevini başlatır ve bitene kadar referansını tutar"""
+        task = asyncio.ensure_future(coro)
+        WeatherService._background_tasks.add(task)
+        task.add_done_callback(WeatherService._background_tasks.discard)
+    
+    @staticmethod
+    async def get_weather_batch(points: List[Tuple[float, float, str]],
+                                profile: VariableProfile = FULL,
+                                track: bool = True, remember: bool = True) -> List[Optional[Dict[str, Any]]]:
+        """
+        Birden çok konum için hava durumu verilerini toplu olarak alır
         
-        if current.get("wind_gusts"):
-            summary += f"Rüzgar Hızı (Max): {current['wind_gusts']} {wind_unit}\n"
+        Aynı ızgara hücresine düşen noktalar tekilleştirilir; önbellekte olmayanlar
+        BATCH_CHUNK_SIZE büyüklüğündeki gruplar halinde çoklu konum isteğiyle çekilir.
+        Bayat kayıtlar hemen döndürülür ve arka planda toplu olarak yenilenir.
         
-        if current.get("uv_index") is not None:
-            uv_level = "Düşük" if current['uv_index'] < 3 else "Orta" if current['uv_index'] < 6 else "Yüksek" if current['uv_index'] < 8 else "Çok Yüksek"
-            summary += f"UV İndeksi: {current['uv_index']} ({uv_level})\n"
+        Args:
+            points: (enlem, boylam, birim) listesi
+            profile: İstenecek değişken kümesi
+            track: Hücreler popülerlik sayacına eklensin mi (toplu dışa aktarım eklemez)
+            remember: Eksik hücreler çekildikten sonra bellek önbelleğine yazılsın mı;
+                toplu dışa aktarım yalnızca diske yazar, sık kullanılan kayıtları
+                LRU'dan atmaz
         
-        if current.get("cloud_cover"):
-            summary += f"Bulutluluk: %{current['cloud_cover']}\n"
+        Returns:
+            Girdi sırasıyla hava durumu verileri (alınamayanlar için None)
+        """
+        cache = WeatherService._cache
+        keys = [WeatherService._cache_key(lat, lon, units, profile) for lat, lon, units in points]
         
-        if current.get("visibility"):
-            summary += f"Görüş: {current['visibility']} km\n"
+        results: Dict[CacheKey, Optional[Dict[str, Any]]] = {}
+        missing: List[Tuple[CacheKey, float, float, str]] = []
+        stale_items: List[Tuple[CacheKey, float, float, str]] = []
+        seen = set()
         
-        if current.get("precipitation"):
-            prec_unit = "inch" if units == "imperial" else "mm"
-            summary += f"Yağış: {current['precipitation']} {prec_unit}/h\n"
+        for cache_key, (lat, lon, units) in zip(keys, points):
+            if cache_key in seen:
+                continue
+            seen.add(cache_key)
+            if track:
+                WeatherService._track(cache_key)
+            
+            cached, stale = (
+                cache.lookup_any(WeatherService._covering_keys(cache_key)) if cache is not None else (None, False)
+            )
+            if cached is not None:
+                results[cache_key] = cached
+                if stale and WeatherService._find_inflight(cache_key) is None:
+                    stale_items.append((cache_key, lat, lon, units))
+            else:
+                missing.append((cache_key, lat, lon, units))
+        
+        if stale_items:
+            WeatherService._spawn(WeatherService._fetch_many(stale_items))
+        if missing:
+            results.update(await WeatherService._fetch_many(missing, remember))
+        
+        return [
+            WeatherService._with_location(results[cache_key], lat, lon) if results[cache_key] else None
+            for cache_key, (lat, lon, _) in zip(keys, points)
+        ]
+    
+    @staticmethod
+    def get_weather_description(weather_code: Optional[int], language: str = "tr") -> str:
+        """Hava durumu kodundan açıklama döndürür"""
+        return summaries.describe(weather_code, language)
+    
+    @staticmethod
+    def iter_weather_summary(weather_data: Optional[Dict[str, Any]], lat: float, lon: float,
+                             units: str = "metric", language: str = "tr") -> Iterator[str]:
+        """
+        Bugünün hava durumu özetini bölüm bölüm üretir
         
-        # Güneş doğuş/batış
-        if today.get("sunrise") and today.get("sunset"):
-            try:
-                sunrise = datetime.fromisoformat(today['sunrise'].replace('Z', '+00:00'))
-                sunset = datetime.fromisoformat(today['sunset'].replace('Z', '+00:00'))
-                summary += f"\nGüneş Doğuş: {sunrise.strftime('%H:%M')}\n"
-                summary += f"Güneş Batış: {sunset.strftime('%H:%M')}\n"
-            except:
-                pass
+        Parçaların birleşimi get_weather_summary metniyle aynıdır; akış uç noktaları
+        her parçayı hazır olur olmaz gönderir.
+        """
+        return iter(summaries.summary_chunks(weather_data, lat, lon, units, language))
+    
+    @staticmethod
+    async def get_weather_summary(lat: float, lon: float, units: str = "metric",
+                                  weather_data: Optional[Dict[str, Any]] = None,
+                                  language: str = "tr") -> Optional[str]:
+        """
+        Sohbet için hava durumu özeti döndürür
         
-        summary += f"\nGüncelleme: {datetime.now().strftime('%H:%M')}"
+        Args:
+            lat: Enlem
+            lon: Boylam
+            units: Birim sistemi
+            weather_data: Önceden alınmış veri (verilirse yeniden istek yapılmaz)
+            language: Metin dili ('tr' veya 'en')
+            
+        Returns:
+            Formatlanmış hava durumu metni
+        """
+        if weather_data is None:
+            weather_data = await WeatherService.get_weather_by_coordinates(lat, lon, units, WEATHER)
         
-        return summary
+        return "".join(summaries.summary_chunks(weather_data, lat, lon, units, language))
     
     @staticmethod
-    async def get_tomorrow_forecast(lat: float, lon: float, units: str = "metric") -> str:
+    async def get_tomorrow_forecast(lat: float, lon: float, units: str = "metric",
+                                    weather_data: Optional[Dict[str, Any]] = None,
+                                    language: str = "tr") -> str:
         """
         Yarın için hava tahmini formatlanmış metin
         
@@ -236,59 +823,37 @@ class WeatherService:
             lat: Enlem
             lon: Boylam
             units: Birim sistemi
+            weather_data: Önceden alınmış veri (verilirse yeniden istek yapılmaz)
+            language: Metin dili ('tr' veya 'en')
             
         Returns:
             Formatlanmış yarın hava tahmini metni
         """
-        weather_data = await WeatherService.get_weather_by_coordinates(lat, lon, units)
-        
-        if not weather_data or not weather_data.get("forecast", {}).get("daily"):
-            return "Üzgünüm, şu anda yarın hava tahmini verilerini alamıyorum."
+        if weather_data is None:
+            weather_data = await WeatherService.get_weather_by_coordinates(lat, lon, units, TOMORROW)
         
-        forecast_data = weather_data["forecast"]["daily"]
-        
-        if len(forecast_data) < 2:
-            return "Yarın için hava tahmini bulunamadı."
-        
-        tomorrow = forecast_data[1]  # İkinci gün (yarın)
-        
-        temp_unit = "°F" if units == "imperial" else "°C"
-        
-        description = WeatherService.get_weather_description(tomorrow.get("weather_code"))
-        
-        summary = f"**Yarın Hava Durumu**\n\n"
-        summary += f"Tarih: {tomorrow.get('date', 'Bilinmiyor')}\n"
-        summary += f"Sıcaklık: {tomorrow.get('max_temp', 'N/A')}{temp_unit} / {tomorrow.get('min_temp', 'N/A')}{temp_unit}\n"
-        summary += f"Durum: {description}\n"
-        
-        if tomorrow.get("precipitation_probability"):
-            summary += f"Yağış İhtimali: %{tomorrow['precipitation_probability']}\n"
-        
-        if tomorrow.get("precipitation_sum"):
-            prec_unit = "inch" if units == "imperial" else "mm"
-            summary += f"Toplam Yağış: {tomorrow['precipitation_sum']} {prec_unit}\n"
-        
-        if tomorrow.get("uv_index_max"):
-            uv_level = "Düşük" if tomorrow['uv_index_max'] < 3 else "Orta" if tomorrow['uv_index_max'] < 6 else "Yüksek" if tomorrow['uv_index_max'] < 8 else "Çok Yüksek"
-            summary += f"Max UV İndeksi: {tomorrow['uv_index_max']} ({uv_level})\n"
-        
-        if tomorrow.get("wind_speed_max"):
-            wind_unit = "mph" if units == "imperial" else "m/s"
-            summary += f"Max Rüzgar: {tomorrow['wind_speed_max']} {wind_unit}\n"
-        
-        if tomorrow.get("sunrise") and tomorrow.get("sunset"):
-            try:
-                sunrise = datetime.fromisoformat(tomorrow['sunrise'].replace('Z', '+00:00'))
-                sunset = datetime.fromisoformat(tomorrow['sunset'].replace('Z', '+00:00'))
-                summary += f"Güneş Doğuş: {sunrise.strftime('%H:%M')}\n"
-                summary += f"Güneş Batış: {sunset.strftime('%H:%M')}\n"
-            except:
-                pass
+        return "".join(summaries.tomorrow_chunks(weather_data, units, language))
+    
+    @staticmethod
+    def iter_tomorrow_forecast(weather_data: Optional[Dict[str, Any]], units: str = "metric",
+                               language: str = "tr") -> Iterator[str]:
+        """Yarın tahmini metnini parça olarak üretir (get_tomorrow_forecast ile aynı metin)"""
+        return iter(summaries.tomorrow_chunks(weather_data, units, language))
+    
+    @staticmethod
+    def iter_weekly_forecast(weather_data: Optional[Dict[str, Any]], units: str = "metric",
+                             language: str = "tr") -> Iterator[str]:
+        """
+        7 günlük tahmin metnini başlık ve her gün için bir parça olarak üretir
         
-        return summary
+        Parçaların birleşimi get_weekly_forecast metniyle aynıdır.
+        """
+        return iter(summaries.weekly_chunks(weather_data, units, language))
     
     @staticmethod
-    async def get_weekly_forecast(lat: float, lon: float, units: str = "metric") -> Optional[str]:
+    async def get_weekly_forecast(lat: float, lon: float, units: str = "metric",
+                                  weather_data: Optional[Dict[str, Any]] = None,
+                                  language: str = "tr") -> Optional[str]:
         """
         7 günlük hava tahmini döndürür
         
@@ -296,51 +861,37 @@ class WeatherService:
             lat: Enlem
             lon: Boylam
             units: Birim sistemi
+            weather_data: Önceden alınmış veri (verilirse yeniden istek yapılmaz)
+            language: Metin dili ('tr' veya 'en')
             
         Returns:
             Formatlanmış haftalık tahmin metni
         """
-        weather_data = await WeatherService.get_weather_by_coordinates(lat, lon, units)
-        
-        if not weather_data:
-            return "7 günlük tahmin şu anda alınamıyor."
-        
-        forecast = weather_data.get("forecast", {}).get("daily", [])
-        
-        if not forecast:
-            return "Haftalık tahmin verisi bulunamadı."
+        if weather_data is None:
+            weather_data = await WeatherService.get_weather_by_coordinates(lat, lon, units, WEEKLY)
         
-        temp_unit = "°F" if units == "imperial" else "°C"
-        
-        summary = f"**7 Günlük Hava Tahmini**\n\n"
+        return "".join(summaries.weekly_chunks(weather_data, units, language))
+    
+    @staticmethod
+    async def get_hourly_forecast(lat: float, lon: float, units: str = "metric", days: int = 7,
+                                  variables: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Saatlik tahmini sütun düzeninde döndürür
         
-        for i, day in enumerate(forecast[:7]):
-            if not day.get("date"):
-                continue
-                
-            try:
-                date_obj = datetime.fromisoformat(day["date"])
-                day_name = ["Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma", "Cumartesi", "Pazar"][date_obj.weekday()]
-                date_str = date_obj.strftime("%d.%m")
-                
-                if i == 0:
-                    day_label = "Bugün"
-                elif i == 1:
-                    day_label = "Yarın"
-                else:
-                    day_label = f"{day_name} ({date_str})"
-                
-                description = WeatherService.get_weather_description(day.get("weather_code"))
-                max_temp = day.get("max_temp", "N/A")
-                min_temp = day.get("min_temp", "N/A")
-                
-                summary += f"{day_label}: {max_temp}°/{min_temp}° - {description}\n"
-                
-                if day.get("precipitation") and day["precipitation"] > 0:
-                    prec_unit = "inch" if units == "imperial" else "mm"
-                    summary += f"  Yağış: {day['precipitation']} {prec_unit}\n"
-                    
-            except Exception as e:
-                continue
+        Gün sayısı saatlik profil kademesine yuvarlanarak önbellek ve single-flight
+        yolundan alınır; yanıt istenen gün ve değişkenlere indirgenir.
         
-        return summary
\ No newline at end of file
+        Args:
+            lat: Enlem
+            lon: Boylam
+            units: Birim sistemi
+            days: Gün sayısı (1-16)
+            variables: Servis alanı adları; None ise tüm saatlik değişkenler
+            
+        Returns:
+            `time` ve değişken sütunlarını içeren dict veya None
+        """
+        weather_data = await WeatherService.get_weather_by_coordinates(lat, lon, units, hourly_profile(days))
+        if weather_data is None:
+            return None
+        return hourly.select_hourly(weather_data, days, variables)
@@ -0,0 +1,84 @@
+"""
+100 noktayı tek /weather/batch isteğiyle ve 100 ayrı /weather isteğiyle karşılaştırır.
+
+Önbellek kapatılır; her iki yol da upstream'e gider. Mock sunucunun gecikmesi
+istek başınadır, böylece toplu isteğin daha az round trip yaptığı görülür.
+
+Kullanım:
+    python benchmarks/bench_batch.py --points 100 --latency 0.05
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import httpx  # noqa: E402
+
+from mock_open_meteo import MockOpenMeteo  # noqa: E402
+from weather_service import WeatherService  # noqa: E402
+import main as app_main  # noqa: E402
+
+
+def make_points(count: int) -> list:
+    # 0.1 derecelik ızgara; her nokta farklı bir önbellek hücresine düşer
+    return [
+        {"latitude": 36.0 + (i // 10) * 0.1, "longitude": 26.0 + (i % 10) * 0.1}
+        for i in range(count)
+    ]
+
+
+async def run(points: list, mock: MockOpenMeteo, concurrency: int) -> None:
+    transport = httpx.ASGITransport(app=app_main.app)
+    await WeatherService.startup()
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # Tekil istekler (tarayıcı gibi sınırlı eşzamanlılıkla)
+            mock.reset()
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def single(point: dict) -> None:
+                async with semaphore:
+                    response = await client.post("/weather", json=point)
+                    response.raise_for_status()
+
+            start = time.perf_counter()
+            await asyncio.gather(*(single(p) for p in points))
+            single_time = time.perf_counter() - start
+            single_hits = mock.hits
+
+            # Toplu istek
+            mock.reset()
+            start = time.perf_counter()
+            response = await client.post("/weather/batch", json=points)
+            response.raise_for_status()
+            batch_time = time.perf_counter() - start
+            batch_hits = mock.hits
+            errors = sum(1 for item in response.json() if item["error"])
+    finally:
+        await WeatherService.shutdown()
+
+    print(f"{len(points)} nokta, upstream gecikmesi {mock.latency:.3f}s")
+    print(f"  tekil  (eşzamanlılık {concurrency}): {single_time:.3f}s, upstream istek = {single_hits}")
+    print(f"  toplu                  : {batch_time:.3f}s, upstream istek = {batch_hits}, hata = {errors}")
+    print(f"  hızlanma               : {single_time / batch_time:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=6, help="Tekil istekler için eşzamanlılık")
+    args = parser.parse_args()
+
+    WeatherService._cache = None
+
+    with MockOpenMeteo(latency=args.latency) as mock:
+        WeatherService.BASE_URL = mock.url
+        asyncio.run(run(make_points(args.points), mock, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
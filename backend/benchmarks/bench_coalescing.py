@@ -0,0 +1,68 @@
+"""
+Single-flight birleştirmesinin upstream istek sayısına etkisini ölçer.
+
+Önbellek kapatılır; böylece yalnızca eşzamanlı isteklerin birleştirilmesi ve
+/chat/weather içindeki veri paylaşımı ölçülür. Mock sunucunun saydığı istek
+sayısı beklenen değerle karşılaştırılır.
+
+Kullanım:
+    python benchmarks/bench_coalescing.py --callers 100 --latency 0.1
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from mock_open_meteo import MockOpenMeteo  # noqa: E402
+from weather_service import WeatherService  # noqa: E402
+
+
+async def burst(callers: int) -> float:
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        WeatherService.get_weather_by_coordinates(41.0082, 28.9784)
+        for _ in range(callers)
+    ))
+    elapsed = time.perf_counter() - start
+    assert all(r is not None for r in results), "başarısız istek var"
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--callers", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+
+    WeatherService._cache = None
+
+    with MockOpenMeteo(latency=args.latency) as mock:
+        WeatherService.BASE_URL = mock.url
+
+        async def run_burst() -> float:
+            await WeatherService.startup()
+            try:
+                return await burst(args.callers)
+            finally:
+                await WeatherService.shutdown()
+
+        elapsed = asyncio.run(run_burst())
+        print(f"{args.callers} eşzamanlı aynı istek: {elapsed:.3f}s, upstream istek sayısı = {mock.hits} (beklenen 1)")
+
+        from fastapi.testclient import TestClient
+        import main as app_main
+
+        mock.reset()
+        with TestClient(app_main.app) as client:
+            response = client.post("/chat/weather", json={
+                "latitude": 41.0082, "longitude": 28.9784, "message": "bugün hava nasıl?"
+            })
+            response.raise_for_status()
+        print(f"/chat/weather tek mesaj: upstream istek sayısı = {mock.hits} (beklenen 1)")
+
+
+if __name__ == "__main__":
+    main()
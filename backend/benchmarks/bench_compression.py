@@ -0,0 +1,92 @@
+"""
+Yanıt sıkıştırması (identity, gzip, Brotli) ve `format=compact` kipinin
+kablodaki bayt ve uçtan uca gecikme etkisini ölçer.
+
+API ayrı bir uvicorn sürecinde, Open-Meteo yerine yerel mock sunucuyla çalışır.
+Önbellek ısındıktan sonra her (uç nokta, biçim, kodlama) için istekler
+tekrarlanır; sıkıştırılmış gövde boyutu (kablodaki bayt) ve yerel p50 gecikme
+raporlanır. Mobil ağlarda aktarım süresi baskın olduğundan, `--mbps` bant
+genişliğinde tahmini toplam süre (p50 + bayt / bant genişliği) de verilir.
+
+Brotli yalnızca `brotli` paketi kuruluysa ölçülür.
+
+Kullanım:
+    python benchmarks/bench_compression.py --repeat 50 --mbps 1.5
+    python benchmarks/bench_compression.py --batch-size 500 --min-size 512
+"""
+import argparse
+import statistics
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from loadtest import ApiServer
+from mock_open_meteo import MockOpenMeteo
+
+try:
+    import brotli  # noqa: F401 - httpx'in br çözmesi için
+except ImportError:  # pragma: no cover - isteğe bağlı bağımlılık
+    brotli = None
+
+
+def scenarios(batch_size: int) -> List[Tuple[str, str, str, Optional[Any]]]:
+    """(ad, yöntem, yol, JSON gövde) listesi"""
+    batch = [{"latitude": round(36 + i * 0.05, 2), "longitude": 29.0} for i in range(batch_size)]
+    return [
+        ("weather", "GET", "/weather?lat=41&lon=29", None),
+        ("weather compact", "GET", "/weather?lat=41&lon=29&format=compact", None),
+        (f"batch x{batch_size}", "POST", "/weather/batch", batch),
+        (f"batch x{batch_size} compact", "POST", "/weather/batch?format=compact", batch),
+        ("weekly", "GET", "/forecast/weekly?lat=41&lon=29", None),
+        ("tile", "GET", "/tiles/6/37/24", None),
+    ]
+
+
+def measure(client: httpx.Client, method: str, path: str, body: Any, encoding: str,
+            repeat: int) -> Dict[str, float]:
+    headers = {"Accept-Encoding": encoding}
+    # Önbelleği ısıt
+    client.request(method, path, json=body, headers=headers).raise_for_status()
+
+    timings = []
+    wire = decoded = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.request(method, path, json=body, headers=headers)
+        timings.append(time.perf_counter() - start)
+        response.raise_for_status()
+        wire = response.num_bytes_downloaded
+        decoded = len(response.content)
+    return {"wire": wire, "decoded": decoded, "p50_ms": statistics.median(timings) * 1000}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--mbps", type=float, default=1.5, help="Tahmini mobil bant genişliği (Mbit/s)")
+    parser.add_argument("--min-size", type=int, default=1024, help="COMPRESSION_MIN_SIZE")
+    args = parser.parse_args()
+
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+    bytes_per_ms = args.mbps * 1e6 / 8 / 1000
+
+    with MockOpenMeteo().start() as mock, \
+            ApiServer(mock.url, env={"COMPRESSION_MIN_SIZE": str(args.min_size)}) as server, \
+            httpx.Client(base_url=server.url, timeout=30) as client:
+        print(f"{args.repeat} tekrar, tahmini bant genişliği {args.mbps} Mbit/s, "
+              f"eşik {args.min_size} B, Brotli: {'var' if brotli is not None else 'yok'}")
+        print(f"{'senaryo':<22} {'kodlama':<9} {'gövde B':>9} {'kablo B':>9} {'oran':>6} "
+              f"{'p50 ms':>8} {'mobil ms':>9}")
+        for name, method, path, body in scenarios(args.batch_size):
+            for encoding in encodings:
+                result = measure(client, method, path, body, encoding, args.repeat)
+                ratio = result["wire"] / result["decoded"] if result["decoded"] else 1.0
+                mobile = result["p50_ms"] + result["wire"] / bytes_per_ms
+                print(f"{name:<22} {encoding:<9} {result['decoded']:>9} {result['wire']:>9} "
+                      f"{ratio:>6.2f} {result['p50_ms']:>8.2f} {mobile:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Eşzamanlı isteklerin event loop'u bloklamadan üst üste bindiğini ölçer.
+
+Mock sunucu her isteğe sabit gecikme ekler. Bloklayan bir istemcide toplam süre
+yaklaşık `istek sayısı x gecikme` olurken, asenkron havuzda yaklaşık tek bir
+gecikme kadar sürmelidir.
+
+Kullanım:
+    python benchmarks/bench_concurrency.py --requests 50 --latency 0.2
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from mock_open_meteo import MockOpenMeteo  # noqa: E402
+from weather_service import WeatherService  # noqa: E402
+
+
+async def run(requests: int) -> float:
+    await WeatherService.startup()
+    try:
+        # Isınma: bağlantı havuzunu doldur
+        await WeatherService.get_weather_by_coordinates(41.0, 29.0)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(
+            WeatherService.get_weather_by_coordinates(41.0 + i * 0.5, 29.0)
+            for i in range(requests)
+        ))
+        elapsed = time.perf_counter() - start
+    finally:
+        await WeatherService.shutdown()
+
+    failed = sum(1 for r in results if r is None)
+    if failed:
+        print(f"Uyarı: {failed} istek başarısız oldu")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with MockOpenMeteo(latency=args.latency) as mock:
+        WeatherService.BASE_URL = mock.url
+        elapsed = asyncio.run(run(args.requests))
+
+    serial = args.requests * args.latency
+    print(f"{args.requests} eşzamanlı istek, upstream gecikmesi {args.latency:.3f}s")
+    print(f"  toplam süre      : {elapsed:.3f}s")
+    print(f"  seri (bloklayan) : ~{serial:.3f}s")
+    print(f"  hızlanma         : {serial / elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Saatlik tahmin yanıt biçimlerini karşılaştırır: JSON sütun dizileri ve ikili
+(JSON başlık + float32 sütunlar) biçim.
+
+Gün sayısına göre yanıt boyutu (ham ve gzip), kodlama ve çözme süresi ölçülür.
+
+Kullanım:
+    python benchmarks/bench_hourly.py --repeat 200
+"""
+import argparse
+import gzip
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import json_backend  # noqa: E402
+from hourly import decode_binary, encode_binary, select_hourly  # noqa: E402
+from mock_open_meteo import build_payload  # noqa: E402
+from normalize import HOURLY_SOURCES, MAX_HOURLY_DAYS, normalize_location  # noqa: E402
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = build_payload(41.0, 29.0, MAX_HOURLY_DAYS, ["weather_code"], [], list(HOURLY_SOURCES))
+    weather_data = normalize_location(payload, 41.0, 29.0, "metric")
+
+    print(f"JSON arka ucu: {json_backend.BACKEND}, {args.repeat} tekrar")
+    print(f"{'gün':>4} {'JSON B':>8} {'gzip':>7} {'ikili B':>8} {'gzip':>7} "
+          f"{'JSON kod µs':>11} {'ikili kod µs':>12} {'JSON çöz µs':>11} {'ikili çöz µs':>12}")
+    for days in (1, 3, 7, MAX_HOURLY_DAYS):
+        forecast = select_hourly(weather_data, days)
+        as_json = json_backend.dumps(forecast)
+        as_binary = encode_binary(forecast)
+        print(
+            f"{days:>4} {len(as_json):>8} {len(gzip.compress(as_json)):>7} "
+            f"{len(as_binary):>8} {len(gzip.compress(as_binary)):>7} "
+            f"{timed(lambda: json_backend.dumps(forecast), args.repeat) * 1e6:>11.0f} "
+            f"{timed(lambda: encode_binary(forecast), args.repeat) * 1e6:>12.0f} "
+            f"{timed(lambda: json_backend.loads(as_json), args.repeat) * 1e6:>11.0f} "
+            f"{timed(lambda: decode_binary(as_binary), args.repeat) * 1e6:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Sohbet niyeti sınıflandırmasının hızını ve doğruluğunu ölçer.
+
+- eski yol : mesajı küçük harfe çevirip 12 anahtar kelimeyi `in` ile tek tek arama
+             (yalnızca hava durumu / değil ayrımı)
+- yeni yol : içe aktarımda derlenen trie regex'leriyle bugün / yarın / haftalık
+- önbellekli: aynı mesajın tekrarı (arayüzdeki hazır sorular)
+
+Türkçe ve İngilizce etiketli bir derlem üzerinde saniyedeki mesaj sayısı ve
+doğru sınıflandırılan mesaj oranı raporlanır. Uzun mesajlar için derlem, her
+mesajın sonuna dolgu metni eklenerek ayrıca ölçülür.
+
+Kullanım:
+    python benchmarks/bench_intents.py --repeat 2000 --rounds 5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import intents  # noqa: E402
+
+LEGACY_KEYWORDS = [
+    "hava", "sıcaklık", "yağmur", "kar", "rüzgar", "bugün", "weather",
+    "derece", "soğuk", "sıcak", "nasıl", "durum"
+]
+
+# (mesaj, beklenen niyet)
+CORPUS = [
+    ("Bugün hava nasıl?", intents.TODAY),
+    ("BUGÜN HAVA NASIL", intents.TODAY),
+    ("dışarısı soğuk mu", intents.TODAY),
+    ("Şu an kaç derece?", intents.TODAY),
+    ("Rüzgarlı mı?", intents.TODAY),
+    ("Şemsiye almalı mıyım?", intents.TODAY),
+    ("Yarın yağmur yağacak mı?", intents.TOMORROW),
+    ("YARIN HAVA NASIL OLACAK", intents.TOMORROW),
+    ("yarin kar var mi", intents.TOMORROW),
+    ("Merhaba,yarın hava nasıl?", intents.TOMORROW),
+    ("Bu hafta hava nasıl olacak?", intents.WEEKLY),
+    ("Haftalık tahmin", intents.WEEKLY),
+    ("Önümüzdeki günlerde yağış var mı?", intents.WEEKLY),
+    ("What's the weather like today?", intents.TODAY),
+    ("Is it cold outside?", intents.TODAY),
+    ("Do I need an umbrella?", intents.TODAY),
+    ("Will it rain tomorrow?", intents.TOMORROW),
+    ("Tomorrow's temperature please", intents.TOMORROW),
+    ("Show me the 7-day forecast", intents.WEEKLY),
+    ("What's the weather this week?", intents.WEEKLY),
+    ("Merhaba", None),
+    ("Teşekkürler!", None),
+    ("Karar veremedim", None),
+    ("Kardeşim geldi", None),
+    ("Hello there", None),
+    ("Thanks a lot", None),
+    ("Book me a hotel", None),
+    ("Who are you?", None),
+]
+
+
+def legacy_is_weather(message: str) -> bool:
+    message = message.lower()
+    return any(keyword in message for keyword in LEGACY_KEYWORDS)
+
+
+def throughput(fns, messages, repeat: int, rounds: int) -> list:
+    """
+    Her fonksiyonun en hızlı turdaki saniyedeki mesaj sayısı
+
+    Fonksiyonlar her turda sırayla çalışır; makinedeki gürültü hepsini
+    benzer etkiler ve en hızlı tur daha kararlı bir karşılaştırma verir.
+    """
+    best = [float("inf")] * len(fns)
+    for _ in range(rounds):
+        for index, fn in enumerate(fns):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                for message in messages:
+                    fn(message)
+            best[index] = min(best[index], time.perf_counter() - start)
+    return [repeat * len(messages) / elapsed for elapsed in best]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5, help="Ölçüm turu; en hızlısı raporlanır")
+    args = parser.parse_args()
+
+    messages = [message for message, _ in CORPUS]
+    padding = " " + "lorem ipsum dolor sit amet " * 8
+    long_messages = [message + padding for message in messages]
+
+    classify = intents.classify.__wrapped__
+    legacy_correct = sum(legacy_is_weather(m) == (expected is not None) for m, expected in CORPUS)
+    weather_correct = sum((classify(m) is not None) == (expected is not None) for m, expected in CORPUS)
+    intent_correct = sum(classify(m) == expected for m, expected in CORPUS)
+
+    print(f"{len(CORPUS)} mesaj (Türkçe + İngilizce), {args.repeat} tekrar")
+    print(f"  doğruluk  eski (hava/değil): {legacy_correct}/{len(CORPUS)} | "
+          f"yeni (hava/değil): {weather_correct}/{len(CORPUS)} | yeni (niyet): {intent_correct}/{len(CORPUS)}")
+    for label, corpus in (("kısa", messages), ("uzun", long_messages)):
+        legacy, compiled, cached = throughput(
+            (legacy_is_weather, classify, intents.classify), corpus, args.repeat, args.rounds
+        )
+        print(f"  {label:<5} eski {legacy / 1e3:6.0f}k mesaj/s | yeni {compiled / 1e3:6.0f}k mesaj/s "
+              f"({compiled / legacy:.2f}x) | önbellekli {cached / 1e3:6.0f}k mesaj/s ({cached / legacy:.1f}x)")
+
+    wrong = [(m, classify(m), expected) for m, expected in CORPUS if classify(m) != expected]
+    for message, got, expected in wrong:
+        print(f"  yanlış: {message!r} -> {got} (beklenen {expected})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Standart `json` ile orjson arka ucunu kayıtlı yanıtlar üzerinde karşılaştırır.
+
+Ölçülenler: Open-Meteo gövdesinin çözümlenmesi (upstream yolu) ve normalize
+edilmiş verinin yeniden serileştirilmesi (FastAPI yanıt yolu).
+
+Kullanım:
+    python benchmarks/bench_json.py --repeat 200
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import json_backend  # noqa: E402
+from normalize import normalize_locations  # noqa: E402
+
+PAYLOADS = Path(__file__).resolve().parent / "payloads"
+
+
+def stdlib_dumps(content) -> bytes:
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def measure(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def report(label: str, stdlib: float, fast: float) -> None:
+    print(f"  {label:<22} json: {stdlib * 1e3:7.3f} ms   {json_backend.BACKEND}: {fast * 1e3:7.3f} ms   ({stdlib / fast:.1f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    if json_backend.orjson is None:
+        print("orjson kurulu değil; her iki yol da standart json kullanıyor")
+
+    for name in ("single.json", "multi_100.json"):
+        body = (PAYLOADS / name).read_bytes()
+        data = json.loads(body)
+        locations = data if isinstance(data, list) else [data]
+        normalized = normalize_locations(locations, [(l["latitude"], l["longitude"]) for l in locations], "metric")
+
+        print(f"{name} ({len(body):,} bayt, {len(locations)} konum)")
+        report("upstream çözümleme", measure(lambda: json.loads(body), args.repeat),
+               measure(lambda: json_backend.loads(body), args.repeat))
+        report("yanıt serileştirme", measure(lambda: stdlib_dumps(normalized), args.repeat),
+               measure(lambda: json_backend.dumps(normalized), args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Metrik toplamanın ek yükünü ölçer.
+
+1. Mikro: histogram gözlemi, `timed` bağlam yöneticisi ve sayaç artırma maliyeti
+2. ASGI: aynı uygulamanın MetricsMiddleware ile ve onsuz istek başına süresi
+   (ağ yok; servis çıktısı sabit, yalnızca HTTP katmanı ölçülür)
+3. /metrics çıktısının oluşturulma süresi
+
+Kullanım:
+    python benchmarks/bench_metrics.py --requests 5000
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from json_backend import FastJSONResponse  # noqa: E402
+from metrics import (  # noqa: E402
+    Counter, Histogram, MetricsMiddleware, REGISTRY, STAGE_BUCKETS, timed,
+)
+from normalize import normalize_location  # noqa: E402
+
+PAYLOADS = Path(__file__).resolve().parent / "payloads"
+
+
+def micro(repeat: int) -> None:
+    histogram = Histogram("bench_seconds", "bench", ("stage",), STAGE_BUCKETS)
+    counter = Counter("bench_total", "bench", ("status",))
+    labels = ("parse",)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        pass
+    empty = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        histogram.observe(0.0003, labels)
+    observe = time.perf_counter() - start - empty
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        with timed(histogram, labels):
+            pass
+    timer = time.perf_counter() - start - empty
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        counter.inc(("503",))
+    inc = time.perf_counter() - start - empty
+
+    print(f"Mikro ({repeat} tekrar)")
+    print(f"  Histogram.observe : {observe / repeat * 1e9:7.0f} ns")
+    print(f"  timed(...)        : {timer / repeat * 1e9:7.0f} ns")
+    print(f"  Counter.inc       : {inc / repeat * 1e9:7.0f} ns")
+
+
+def build_app(weather_data: dict, instrumented: bool) -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse)
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+
+    @app.post("/weather")
+    async def weather():
+        return FastJSONResponse(content=weather_data)
+
+    return app
+
+
+async def run(app: FastAPI, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(100):
+            await client.post("/weather")
+        start = time.perf_counter()
+        for _ in range(requests):
+            response = await client.post("/weather")
+            response.raise_for_status()
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    micro(args.requests * 100)
+
+    payload = json.loads((PAYLOADS / "single.json").read_text(encoding="utf-8"))
+    weather_data = normalize_location(payload, payload["latitude"], payload["longitude"], "metric")
+
+    # Makine gürültüsü iki tarafa eşit dağılsın diye turlar dönüşümlü çalışır;
+    # her taraf için en iyi tur alınır
+    plain_app, instrumented_app = build_app(weather_data, False), build_app(weather_data, True)
+    plain_runs, instrumented_runs = [], []
+    for _ in range(args.rounds):
+        plain_runs.append(asyncio.run(run(plain_app, args.requests)))
+        instrumented_runs.append(asyncio.run(run(instrumented_app, args.requests)))
+    plain, instrumented = min(plain_runs), min(instrumented_runs)
+
+    per_plain = plain / args.requests * 1e6
+    per_instrumented = instrumented / args.requests * 1e6
+    print(f"ASGI ({args.requests} istek, en iyi {args.rounds} tur)")
+    print(f"  middleware yok : {per_plain:7.1f} µs/istek")
+    print(f"  middleware var : {per_instrumented:7.1f} µs/istek")
+    print(f"  ek yük         : {per_instrumented - per_plain:7.1f} µs/istek "
+          f"(%{(per_instrumented / per_plain - 1) * 100:.1f})")
+
+    start = time.perf_counter()
+    for _ in range(100):
+        text = REGISTRY.render()
+    print(f"/metrics oluşturma: {(time.perf_counter() - start) / 100 * 1e6:.0f} µs, {len(text)} bayt")
+
+
+if __name__ == "__main__":
+    main()
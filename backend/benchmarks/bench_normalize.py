@@ -0,0 +1,112 @@
+"""
+Open-Meteo yanıt normalizasyonu için mikro benchmark.
+
+Kayıtlı yanıtları (payloads/) çok sayıda kez normalize eder ve sütun bazlı
+normalizer'ı eski indeks döngülü uygulamayla karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_normalize.py --repeat 200
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from normalize import normalize_location, normalize_locations  # noqa: E402
+
+PAYLOADS = Path(__file__).resolve().parent / "payloads"
+
+
+def legacy_normalize(data: dict, lat: float, lon: float, units: str) -> dict:
+    """Önceki indeks döngülü normalizasyon (karşılaştırma için)"""
+    current = data.get("current", {})
+    daily = data.get("daily", {})
+    result = {
+        "location": {"latitude": lat, "longitude": lon},
+        "current": {
+            "temperature": current.get("temperature_2m"),
+            "apparent_temperature": current.get("apparent_temperature"),
+            "humidity": current.get("relative_humidity_2m"),
+            "pressure": current.get("pressure_msl"),
+            "surface_pressure": current.get("surface_pressure"),
+            "wind_speed": current.get("wind_speed_10m"),
+            "wind_direction": current.get("wind_direction_10m"),
+            "wind_gusts": current.get("wind_gusts_10m"),
+            "precipitation": current.get("precipitation"),
+            "uv_index": current.get("uv_index"),
+            "cloud_cover": current.get("cloud_cover"),
+            "visibility": current.get("visibility"),
+            "weather_code": current.get("weather_code"),
+            "time": current.get("time"),
+        },
+        "today": {
+            "max_temp": daily.get("temperature_2m_max", [None])[0] if daily.get("temperature_2m_max") else None,
+            "min_temp": daily.get("temperature_2m_min", [None])[0] if daily.get("temperature_2m_min") else None,
+            "weather_code": daily.get("weathercode", [None])[0] if daily.get("weathercode") else None,
+            "sunrise": daily.get("sunrise", [None])[0] if daily.get("sunrise") else None,
+            "sunset": daily.get("sunset", [None])[0] if daily.get("sunset") else None,
+            "uv_index_max": daily.get("uv_index_max", [None])[0] if daily.get("uv_index_max") else None,
+            "precipitation_sum": daily.get("precipitation_sum", [None])[0] if daily.get("precipitation_sum") else None,
+        },
+        "forecast": {"daily": []},
+        "units": units,
+        "updated_at": datetime.now().isoformat(),
+    }
+    if daily.get("time"):
+        for i in range(min(7, len(daily.get("time", [])))):
+            result["forecast"]["daily"].append({
+                "date": daily.get("time", [])[i] if i < len(daily.get("time", [])) else None,
+                "max_temp": daily.get("temperature_2m_max", [])[i] if i < len(daily.get("temperature_2m_max", [])) else None,
+                "min_temp": daily.get("temperature_2m_min", [])[i] if i < len(daily.get("temperature_2m_min", [])) else None,
+                "weather_code": daily.get("weathercode", [])[i] if i < len(daily.get("weathercode", [])) else None,
+                "precipitation": daily.get("precipitation_sum", [])[i] if i < len(daily.get("precipitation_sum", [])) else None,
+                "wind_speed": daily.get("wind_speed_10m_max", [])[i] if i < len(daily.get("wind_speed_10m_max", [])) else None,
+                "wind_direction": daily.get("wind_direction_10m_dominant", [])[i] if i < len(daily.get("wind_direction_10m_dominant", [])) else None,
+            })
+    return result
+
+
+def timed(label: str, func, count: int) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<10}: {elapsed:.3f}s ({count / elapsed:,.0f} konum/s)")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    locations = json.loads((PAYLOADS / "multi_100.json").read_text(encoding="utf-8"))
+    points = [(loc["latitude"], loc["longitude"]) for loc in locations]
+    count = len(locations) * args.repeat
+
+    # Çıktı biçiminin değişmediğini doğrula
+    for loc, (lat, lon) in zip(locations, points):
+        new = normalize_location(loc, lat, lon, "metric")
+        old = legacy_normalize(loc, lat, lon, "metric")
+        new.pop("updated_at")
+        old.pop("updated_at")
+        assert new == old
+
+    print(f"{count:,} konum normalizasyonu ({len(locations)} konumluk yanıt x {args.repeat})")
+    legacy = timed("eski", lambda: [
+        legacy_normalize(loc, lat, lon, "metric")
+        for _ in range(args.repeat)
+        for loc, (lat, lon) in zip(locations, points)
+    ], count)
+    columnar = timed("sütunlu", lambda: [
+        normalize_locations(locations, points, "metric")
+        for _ in range(args.repeat)
+    ], count)
+    print(f"  hızlanma  : {legacy / columnar:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Uç nokta değişken profillerinin yük boyutuna ve çözümleme süresine etkisini ölçer.
+
+1. Her profil için mock'un ürettiği yanıtın boyutu ve JSON çözümleme +
+   normalizasyon süresi tam profille karşılaştırılır.
+2. Önbellek kapsaması: geniş profille çekilen bir hücre için dar profilli
+   istekler upstream'e gitmeden önbellekten karşılanır.
+
+Kullanım:
+    python benchmarks/bench_profiles.py --repeat 2000
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from mock_open_meteo import MockOpenMeteo, build_payload  # noqa: E402
+from normalize import normalize_location  # noqa: E402
+from profiles import PROFILES, FULL, WEATHER, WEEKLY, TOMORROW, TILE  # noqa: E402
+from weather_service import WeatherService  # noqa: E402
+import json_backend  # noqa: E402
+
+
+def measure(profile, repeat: int) -> tuple:
+    payload = build_payload(41.0, 29.0, profile.forecast_days, list(profile.current), list(profile.daily))
+    body = json.dumps(payload).encode()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        normalize_location(json_backend.loads(body), 41.0, 29.0, "metric")
+    return len(body), (time.perf_counter() - start) / repeat
+
+
+async def coverage(mock: MockOpenMeteo) -> None:
+    await WeatherService.startup()
+    try:
+        mock.reset()
+        await WeatherService.get_weather_by_coordinates(41.0, 29.0, "metric", FULL)
+        for profile in (WEATHER, WEEKLY, TOMORROW, TILE):
+            await WeatherService.get_weather_by_coordinates(41.0, 29.0, "metric", profile)
+        print(f"  tam profil + 4 dar profil (aynı hücre): upstream {mock.hits} (beklenen 1)")
+
+        mock.reset()
+        await asyncio.gather(
+            WeatherService.get_weather_by_coordinates(38.0, 27.0, "metric", WEEKLY),
+            WeatherService.get_weather_by_coordinates(38.0, 27.0, "metric", TOMORROW),
+        )
+        print(f"  eşzamanlı haftalık + yarın (yeni hücre): upstream {mock.hits} (beklenen 1)")
+    finally:
+        await WeatherService.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    backend = json_backend.BACKEND
+    full_size, full_time = measure(FULL, args.repeat)
+    print(f"Profil başına yanıt boyutu ve çözümleme+normalizasyon ({backend})")
+    for profile in PROFILES:
+        size, elapsed = measure(profile, args.repeat)
+        print(f"  {profile.name:<9}: {size:6d} bayt (%{size / full_size * 100:5.1f}), "
+              f"{elapsed * 1e6:7.1f} µs ({full_time / elapsed:.2f}x)")
+
+    print("Önbellek kapsaması")
+    with MockOpenMeteo() as mock:
+        WeatherService.BASE_URL = mock.url
+        asyncio.run(coverage(mock))
+
+
+if __name__ == "__main__":
+    main()
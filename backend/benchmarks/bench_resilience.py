@@ -0,0 +1,97 @@
+"""
+Dayanıklılık katmanını arıza enjekte eden mock sunucuya karşı çalıştırır.
+
+Senaryolar:
+  1. Kısmi arıza   : isteklerin bir kısmı 503 döner; yeniden denemeler çoğunu kurtarır
+  2. Tam kesinti   : devre kesici açılır, istekler upstream'e gitmeden hızla döner
+                     ve önbellekteki son bilinen değer sunulur
+  3. İyileşme      : reset süresinden sonra deneme isteği başarılı olur, devre kapanır
+
+Kullanım:
+    python benchmarks/bench_resilience.py
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from mock_open_meteo import MockOpenMeteo  # noqa: E402
+from weather_service import WeatherService  # noqa: E402
+from resilience import CircuitBreaker, RetryBudget  # noqa: E402
+
+
+def points(count: int, offset: float = 0.0) -> list:
+    return [(30.0 + offset + i * 0.5, 30.0) for i in range(count)]
+
+
+async def request_all(coords: list) -> tuple:
+    start = time.perf_counter()
+    results = await asyncio.gather(*(WeatherService.get_weather_by_coordinates(lat, lon) for lat, lon in coords))
+    return sum(1 for r in results if r is not None), time.perf_counter() - start
+
+
+async def run(mock: MockOpenMeteo, requests: int, reset_timeout: float) -> None:
+    await WeatherService.startup()
+    try:
+        print(f"1) Kısmi arıza (%{mock.error_rate * 100:.0f} hata)")
+        mock.reset()
+        ok, elapsed = await request_all(points(requests))
+        budget = WeatherService._retry_budget.stats()
+        print(f"   başarılı {ok}/{requests}, süre {elapsed:.2f}s, upstream {mock.hits} (hata {mock.errors}), "
+              f"harcanan yeniden deneme {budget['spent']}, bütçe tükendi {budget['exhausted']}")
+
+        print("2) Tam kesinti")
+        # Önbellekte yalnızca ilk yarının (süresi dolmuş) son bilinen değeri olsun
+        WeatherService._cache.clear()
+        mock.error_rate = 0.0
+        await request_all(points(requests // 2, offset=100))
+        for key, (_, value) in list(WeatherService._cache._entries.items()):
+            WeatherService._cache._entries[key] = (0.0, value)
+        mock.error_rate = 1.0
+        mock.reset()
+
+        ok, elapsed = await request_all(points(requests, offset=100))
+        stats = WeatherService.upstream_stats()
+        print(f"   yanıtlanan {ok}/{requests} (son bilinen değer), süre {elapsed:.2f}s, upstream {mock.hits}, "
+              f"devre {stats['breaker']['state']}, reddedilen {stats['breaker']['rejected']}")
+
+        mock.reset()
+        ok, elapsed = await request_all(points(requests, offset=100))
+        print(f"   devre açıkken tekrar: süre {elapsed * 1000:.1f} ms, upstream {mock.hits}")
+
+        print("3) İyileşme")
+        mock.error_rate = 0.0
+        await asyncio.sleep(reset_timeout)
+        mock.reset()
+        ok, elapsed = await request_all(points(1, offset=200))
+        ok, elapsed = await request_all(points(requests, offset=300))
+        print(f"   başarılı {ok}/{requests}, upstream {mock.hits}, devre {WeatherService._breaker.state}")
+    finally:
+        await WeatherService.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--error-rate", type=float, default=0.3)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--reset-timeout", type=float, default=1.0)
+    args = parser.parse_args()
+
+    # Enjekte edilen hataların log çıktısı sonuçları boğmasın
+    logging.disable(logging.CRITICAL)
+
+    WeatherService._breaker = CircuitBreaker(failure_threshold=5, reset_timeout=args.reset_timeout)
+    WeatherService._retry_budget = RetryBudget(ratio=0.5, max_tokens=20)
+
+    with MockOpenMeteo(latency=args.latency, error_rate=args.error_rate) as mock:
+        WeatherService.BASE_URL = mock.url
+        asyncio.run(run(mock, args.requests, args.reset_timeout))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Servis çıktısının yanıt olarak serileştirilmesini karşılaştırır.
+
+- eski yol  : WeatherResponse(**weather_data) + FastAPI response_model doğrulaması
+- güvenilir : servis dict'inin FastJSONResponse ile tek seferde serileştirilmesi
+
+Her iki yol da aynı FastAPI uygulaması üzerinden ASGI ile çağrılır; upstream
+yerine önceden normalize edilmiş kayıtlı veri kullanılır.
+
+Kullanım:
+    python benchmarks/bench_response.py --requests 2000
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from json_backend import FastJSONResponse, dumps  # noqa: E402
+from models import WeatherResponse  # noqa: E402
+from normalize import normalize_location  # noqa: E402
+
+PAYLOADS = Path(__file__).resolve().parent / "payloads"
+
+
+def build_app(weather_data: dict) -> FastAPI:
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.get("/legacy", response_model=WeatherResponse)
+    async def legacy():
+        return WeatherResponse(**weather_data)
+
+    @app.get("/trusted", response_model=WeatherResponse)
+    async def trusted():
+        return FastJSONResponse(content=weather_data)
+
+    return app
+
+
+async def run(app: FastAPI, path: str, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get(path)
+        start = time.perf_counter()
+        for _ in range(requests):
+            response = await client.get(path)
+            response.raise_for_status()
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    payload = json.loads((PAYLOADS / "single.json").read_text(encoding="utf-8"))
+    weather_data = normalize_location(payload, payload["latitude"], payload["longitude"], "metric")
+
+    # Servis çıktısının modelle uyumlu olduğunu ve hiçbir alanın düşmediğini doğrula
+    validated = WeatherResponse.model_validate(weather_data).model_dump()
+    assert validated.keys() == weather_data.keys()
+    assert validated["current"].keys() == weather_data["current"].keys()
+    assert validated["today"].keys() == weather_data["today"].keys()
+
+    app = build_app(weather_data)
+    legacy = asyncio.run(run(app, "/legacy", args.requests))
+    trusted = asyncio.run(run(app, "/trusted", args.requests))
+
+    print(f"{args.requests} istek (ASGI, ağ yok)")
+    print(f"  eski yol  : {legacy / args.requests * 1e6:8.1f} µs/istek")
+    print(f"  güvenilir : {trusted / args.requests * 1e6:8.1f} µs/istek")
+    print(f"  hızlanma  : {legacy / trusted:.2f}x")
+
+    # Yalnızca doğrulama + serileştirme maliyeti (ASGI yükü olmadan)
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        dumps(WeatherResponse(**weather_data).model_dump(mode="json"))
+    model_path = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        dumps(weather_data)
+    direct_path = time.perf_counter() - start
+
+    print("Yalnızca serileştirme")
+    print(f"  model     : {model_path / args.requests * 1e6:8.1f} µs/istek")
+    print(f"  doğrudan  : {direct_path / args.requests * 1e6:8.1f} µs/istek")
+    print(f"  hızlanma  : {model_path / direct_path:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Yakın kayıt aramasının (uzamsal indeks) etkin isabet oranına ve arama
+maliyetine etkisini ölçer.
+
+Yoğun bir kent alanında rastgele harita tıklamaları üretilir; her tıklama
+önbellekte aranır, bulunamazsa upstream'den alınmış gibi önbelleğe yazılır.
+Kesin hücre araması ile farklı yarıçaplardaki yakın kayıt araması için
+upstream çağrısı sayısı, isabet oranı ve arama süresi raporlanır (ağ yok).
+
+Kullanım:
+    python benchmarks/bench_spatial.py --clicks 20000 --radius-km 10
+"""
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from cache import ForecastCache, make_key  # noqa: E402
+from profiles import COVERING, WEATHER  # noqa: E402
+from spatial import KM_PER_DEGREE, SpatialIndex  # noqa: E402
+
+RESOLUTION = 0.01
+CENTER = (41.015, 28.979)
+
+
+def clicks(count: int, radius_km: float, seed: int):
+    """Merkez etrafında yoğunluğu merkeze doğru artan rastgele noktalar"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        distance = abs(rng.gauss(0, radius_km / 2)) / KM_PER_DEGREE
+        angle = rng.uniform(0, 2 * math.pi)
+        yield (
+            round(CENTER[0] + distance * math.sin(angle), 5),
+            round(CENTER[1] + distance * math.cos(angle) / math.cos(math.radians(CENTER[0])), 5),
+        )
+
+
+def run(points, max_distance_km: float, max_entries: int):
+    index = SpatialIndex(0.05) if max_distance_km > 0 else None
+    cache = ForecastCache(max_entries, ttl=3600, index=index)
+    value = {"current": {}}
+    upstream = 0
+    elapsed = 0.0
+    for lat, lon in points:
+        key = (*make_key(lat, lon, "metric", RESOLUTION), WEATHER)
+        keys = [(*key[:3], profile) for profile in COVERING[WEATHER]]
+        start = time.perf_counter()
+        cached, _, _ = cache.lookup_near(keys, lat, lon, max_distance_km)
+        elapsed += time.perf_counter() - start
+        if cached is None:
+            upstream += 1
+            cache.set(key, value)
+    return upstream, cache.stats()["hit_ratio"], elapsed / len(points)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clicks", type=int, default=20000)
+    parser.add_argument("--radius-km", type=float, default=10.0, help="Tıklamaların dağıldığı yarıçap")
+    parser.add_argument("--max-entries", type=int, default=2048)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    points = list(clicks(args.clicks, args.radius_km, args.seed))
+    print(f"{args.clicks} tıklama, {args.radius_km:g} km yarıçap, önbellek {args.max_entries} kayıt")
+    print(f"{'yakın arama':>12} {'upstream':>9} {'isabet':>8} {'arama µs':>9}")
+    for max_distance_km in (0, 0.5, 1, 2, 3):
+        upstream, hit_ratio, per_lookup = run(points, max_distance_km, args.max_entries)
+        label = "kapalı" if max_distance_km == 0 else f"{max_distance_km:g} km"
+        print(f"{label:>12} {upstream:>9} {hit_ratio:>8.1%} {per_lookup * 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Sohbet/tahmin metni oluşturmayı karşılaştırır.
+
+- eski yol  : her çağrıda `+=` ile metin kurma, hava kodu sözlüğünü yeniden oluşturma
+- derlenmiş : modül düzeyinde tablolar ve (dil, birim) başına derlenmiş şablonlar
+- önbellekli: aynı anlık görüntü için tekrar eden istek (sözlük araması)
+
+Eski ve yeni çıktıların (güncelleme satırı hariç) aynı olduğu da doğrulanır.
+
+Kullanım:
+    python benchmarks/bench_summaries.py --repeat 5000
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import summaries  # noqa: E402
+from normalize import normalize_location  # noqa: E402
+
+PAYLOADS = Path(__file__).resolve().parent / "payloads"
+
+
+def legacy_description(weather_code):
+    # Eski uygulamadaki `if not weather_code` hatası (0 -> "Bilinmeyen") burada
+    # düzeltilmiştir; yalnızca performans karşılaştırılır
+    if weather_code is None:
+        return "Bilinmeyen"
+    weather_codes = {
+        0: "Açık hava", 1: "Çoğunlukla açık", 2: "Parçalı bulutlu", 3: "Bulutlu",
+        45: "Sisli", 48: "Kırağılı sis", 51: "Hafif çisenti", 53: "Orta çisenti",
+        55: "Yoğun çisenti", 61: "Hafif yağmur", 63: "Orta yağmur", 65: "Şiddetli yağmur",
+        71: "Hafif kar", 73: "Orta kar", 75: "Şiddetli kar", 80: "Hafif sağanak",
+        81: "Orta sağanak", 82: "Şiddetli sağanak", 95: "Gök gürültülü fırtına",
+        96: "Hafif dolu ile fırtına", 99: "Şiddetli dolu ile fırtına",
+    }
+    return weather_codes.get(weather_code, f"Hava kodu: {weather_code}")
+
+
+def legacy_summary(weather_data: dict, lat: float, lon: float, units: str) -> str:
+    """Önceki `+=` tabanlı özet (karşılaştırma için)"""
+    current = weather_data["current"]
+    today = weather_data["today"]
+    temp_unit = "°F" if units == "imperial" else "°C"
+    wind_unit = "mph" if units == "imperial" else "m/s"
+    pressure_unit = "inHg" if units == "imperial" else "hPa"
+    description = legacy_description(today.get("weather_code"))
+
+    summary = "**Bugünün Hava Durumu**\n\n"
+    summary += f"Konum: {lat:.3f}, {lon:.3f}\n"
+    summary += f"Sıcaklık: {current.get('temperature', 'N/A')}{temp_unit}\n"
+    if current.get("apparent_temperature"):
+        summary += f"Hissedilen: {current['apparent_temperature']}{temp_unit}\n"
+    if today.get("max_temp") and today.get("min_temp"):
+        summary += f"Bugün: {today['max_temp']}{temp_unit} / {today['min_temp']}{temp_unit}\n"
+    summary += f"Durum: {description}\n"
+    if current.get("humidity"):
+        summary += f"Nem: %{current['humidity']}\n"
+    if current.get("pressure"):
+        summary += f"Basınç: {current['pressure']} {pressure_unit}\n"
+    summary += f"Rüzgar: {current.get('wind_speed', 'N/A')} {wind_unit}\n"
+    if current.get("wind_gusts"):
+        summary += f"Rüzgar Hızı (Max): {current['wind_gusts']} {wind_unit}\n"
+    if current.get("uv_index") is not None:
+        uv = current["uv_index"]
+        uv_level = "Düşük" if uv < 3 else "Orta" if uv < 6 else "Yüksek" if uv < 8 else "Çok Yüksek"
+        summary += f"UV İndeksi: {uv} ({uv_level})\n"
+    if current.get("cloud_cover"):
+        summary += f"Bulutluluk: %{current['cloud_cover']}\n"
+    if current.get("visibility"):
+        summary += f"Görüş: {current['visibility']} km\n"
+    if current.get("precipitation"):
+        prec_unit = "inch" if units == "imperial" else "mm"
+        summary += f"Yağış: {current['precipitation']} {prec_unit}/h\n"
+    if today.get("sunrise") and today.get("sunset"):
+        sunrise = datetime.fromisoformat(today["sunrise"].replace("Z", "+00:00"))
+        sunset = datetime.fromisoformat(today["sunset"].replace("Z", "+00:00"))
+        summary += f"\nGüneş Doğuş: {sunrise.strftime('%H:%M')}\n"
+        summary += f"Güneş Batış: {sunset.strftime('%H:%M')}\n"
+    summary += f"\nGüncelleme: {datetime.now().strftime('%H:%M')}"
+    return summary
+
+
+def legacy_weekly(weather_data: dict, units: str) -> str:
+    """Önceki `+=` tabanlı haftalık tahmin (karşılaştırma için)"""
+    forecast = weather_data.get("forecast", {}).get("daily", [])
+    summary = "**7 Günlük Hava Tahmini**\n\n"
+    for i, day in enumerate(forecast[:7]):
+        date_obj = datetime.fromisoformat(day["date"])
+        day_name = ["Pazartesi", "Salı", "Çarşamba", "Perşembe", "Cuma", "Cumartesi", "Pazar"][date_obj.weekday()]
+        date_str = date_obj.strftime("%d.%m")
+        day_label = "Bugün" if i == 0 else "Yarın" if i == 1 else f"{day_name} ({date_str})"
+        description = legacy_description(day.get("weather_code"))
+        summary += f"{day_label}: {day.get('max_temp', 'N/A')}°/{day.get('min_temp', 'N/A')}° - {description}\n"
+        if day.get("precipitation") and day["precipitation"] > 0:
+            prec_unit = "inch" if units == "imperial" else "mm"
+            summary += f"  Yağış: {day['precipitation']} {prec_unit}\n"
+    return summary
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def without_update_line(text: str) -> str:
+    return text.rsplit("\n", 1)[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5000)
+    args = parser.parse_args()
+
+    payload = json.loads((PAYLOADS / "single.json").read_text(encoding="utf-8"))
+    lat, lon = payload["latitude"], payload["longitude"]
+    weather_data = normalize_location(payload, lat, lon, "metric")
+
+    new_summary = "".join(summaries.summary_chunks(weather_data, lat, lon, "metric"))
+    assert without_update_line(new_summary) == without_update_line(legacy_summary(weather_data, lat, lon, "metric"))
+    assert "".join(summaries.weekly_chunks(weather_data, "metric")) == legacy_weekly(weather_data, "metric")
+
+    def uncached(render):
+        # Her çağrıda yeni bir anlık görüntü gibi davranması için önbelleği boşalt
+        def run():
+            summaries._cache.clear()
+            render()
+        return run
+
+    cases = {
+        "özet": (
+            lambda: legacy_summary(weather_data, lat, lon, "metric"),
+            lambda: summaries.summary_chunks(weather_data, lat, lon, "metric"),
+        ),
+        "haftalık": (
+            lambda: legacy_weekly(weather_data, "metric"),
+            lambda: summaries.weekly_chunks(weather_data, "metric"),
+        ),
+    }
+
+    print(f"{args.repeat} tekrar")
+    for name, (legacy, compiled) in cases.items():
+        legacy_time = timed(legacy, args.repeat)
+        compiled_time = timed(uncached(compiled), args.repeat)
+        compiled()
+        cached_time = timed(compiled, args.repeat)
+        print(f"  {name:<9} eski {legacy_time * 1e6:6.1f} µs | derlenmiş {compiled_time * 1e6:6.1f} µs "
+              f"({legacy_time / compiled_time:.1f}x) | önbellekli {cached_time * 1e6:6.2f} µs "
+              f"({legacy_time / cached_time:.0f}x)")
+
+    print("İngilizce örnek:")
+    print("".join(summaries.weekly_chunks(weather_data, "imperial", "en")))
+
+
+if __name__ == "__main__":
+    main()
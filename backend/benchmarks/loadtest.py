@@ -0,0 +1,275 @@
+"""
+Uç noktalar için tekrarlanabilir yük testi.
+
+Her senaryo (uç nokta x eşzamanlılık) için API ayrı bir uvicorn sürecinde soğuk
+önbellekle başlatılır; Open-Meteo yerine yerel mock sunucu (kayıtlı yanıt,
+ayarlanabilir gecikme ve hata oranı) kullanılır. İstekler sabit tohumlu rastgele
+bir konum kümesinden seçilir; böylece önbellek isabet oranı çalıştırmalar arasında
+aynıdır.
+
+Her senaryo için verim (istek/s), p50/p95/p99 gecikme, hata sayısı ve upstream
+çağrı sayısı raporlanır. Sonuçlar JSON olarak kaydedilir ve önceki bir sonuçla
+karşılaştırılabilir; eşik aşılırsa çıkış kodu 1 olur.
+
+Kullanım:
+    python benchmarks/loadtest.py --output benchmarks/results/baseline.json
+    python benchmarks/loadtest.py --compare benchmarks/results/baseline.json --threshold 10
+    python benchmarks/loadtest.py --endpoints /weather --concurrency 1,50 --requests 1000
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from mock_open_meteo import MockOpenMeteo
+
+BENCHMARKS = Path(__file__).resolve().parent
+APP_DIR = BENCHMARKS.parent / "app"
+RESULTS = BENCHMARKS / "results"
+
+# Uç nokta -> istek gövdesine eklenecek alanlar
+ENDPOINTS: Dict[str, Dict[str, Any]] = {
+    "/weather": {},
+    "/chat/weather": {"message": "bugün hava nasıl?"},
+    "/forecast/weekly": {},
+    "/forecast/tomorrow": {},
+}
+
+# Karşılaştırmada daha yüksek değerin kötü olduğu ölçümler
+LOWER_IS_BETTER = ("p50_ms", "p95_ms", "p99_ms", "upstream_calls", "errors")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """En yakın sıra yöntemiyle yüzdelik"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+class ApiServer:
+    """API'yi verilen ortam değişkenleriyle ayrı bir uvicorn sürecinde çalıştırır"""
+
+    def __init__(self, upstream_url: str, workers: int = 1, env: Optional[Dict[str, str]] = None):
+        self.port = free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.workers = workers
+        self.env = {
+            **os.environ,
+            "OPEN_METEO_URL": upstream_url,
+            # Arka plan işleri ölçümleri bozmasın; her senaryo soğuk önbellekle başlar
+            "HOT_REFRESH_ENABLED": "false",
+            "DISK_CACHE_ENABLED": "false",
+            **(env or {}),
+        }
+        self._process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> "ApiServer":
+        self._process = subprocess.Popen(
+            [
+                sys.executable, "-m", "uvicorn", "main:app",
+                "--app-dir", str(APP_DIR),
+                "--port", str(self.port),
+                "--workers", str(self.workers),
+                "--log-level", "warning",
+                "--no-access-log",
+            ],
+            env=self.env,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                if httpx.get(f"{self.url}/health", timeout=1).status_code == 200:
+                    return self
+            except httpx.TransportError:
+                pass
+            if self._process.poll() is not None:
+                raise RuntimeError("API süreci başlatılamadı")
+            time.sleep(0.1)
+        raise RuntimeError("API süreci zamanında hazır olmadı")
+
+    def __exit__(self, *exc) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+
+async def drive(url: str, endpoint: str, concurrency: int, requests: int,
+                locations: List[tuple], seed: int) -> Dict[str, Any]:
+    """`concurrency` işçiyle toplam `requests` istek gönderir ve süreleri toplar"""
+    rng = random.Random(seed)
+    bodies = [
+        {"latitude": lat, "longitude": lon, "units": "metric", **ENDPOINTS[endpoint]}
+        for lat, lon in (rng.choice(locations) for _ in range(requests))
+    ]
+    latencies: List[float] = []
+    errors = 0
+    next_index = 0
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        async def worker() -> None:
+            nonlocal next_index, errors
+            while next_index < len(bodies):
+                body = bodies[next_index]
+                next_index += 1
+                start = time.perf_counter()
+                try:
+                    response = await client.post(endpoint, json=body)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        duration = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "duration_s": round(duration, 4),
+        "throughput_rps": round(requests / duration, 2),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCHMARKS,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(scenarios: List[Dict[str, Any]]) -> None:
+    print(f"{'senaryo':<28} {'istek/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'hata':>5} {'upstream':>8}")
+    for s in scenarios:
+        print(f"{s['name']:<28} {s['throughput_rps']:>9.1f} {s['p50_ms']:>8.1f} {s['p95_ms']:>8.1f} "
+              f"{s['p99_ms']:>8.1f} {s['errors']:>5} {s['upstream_calls']:>8}")
+
+
+def compare(current: List[Dict[str, Any]], baseline_path: Path, threshold: float) -> bool:
+    """
+    Sonuçları kayıtlı temel çizgiyle karşılaştırır
+
+    Returns:
+        Eşiği aşan bir gerileme varsa True
+    """
+    baseline = {s["name"]: s for s in json.loads(baseline_path.read_text(encoding="utf-8"))["scenarios"]}
+    regressed = False
+    print(f"\nTemel çizgiyle karşılaştırma ({baseline_path}, eşik %{threshold:g})")
+    for scenario in current:
+        old = baseline.get(scenario["name"])
+        if old is None:
+            print(f"  {scenario['name']:<28} temel çizgide yok")
+            continue
+        changes = []
+        for key in ("throughput_rps",) + LOWER_IS_BETTER:
+            before, after = old[key], scenario[key]
+            if before == after:
+                continue
+            change = (after - before) / before * 100 if before else float("inf")
+            worse = change > threshold if key in LOWER_IS_BETTER else change < -threshold
+            regressed |= worse
+            changes.append(f"{key} {before:g}->{after:g} ({change:+.1f}%){' GERİLEME' if worse else ''}")
+        print(f"  {scenario['name']:<28} " + ("; ".join(changes) or "değişiklik yok"))
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API yük testi")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS), help="Virgülle ayrılmış uç noktalar")
+    parser.add_argument("--concurrency", default="1,10,50", help="Virgülle ayrılmış eşzamanlılık düzeyleri")
+    parser.add_argument("--requests", type=int, default=500, help="Senaryo başına istek sayısı")
+    parser.add_argument("--locations", type=int, default=100, help="Farklı konum sayısı")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock upstream gecikmesi (saniye)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Mock upstream hata oranı (0-1)")
+    parser.add_argument("--payload", default=str(BENCHMARKS / "payloads" / "single.json"),
+                        help="Mock'un sunacağı kayıtlı yanıt")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker sayısı")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Sonuç JSON dosyası (varsayılan: results/<zaman>.json)")
+    parser.add_argument("--compare", help="Karşılaştırılacak temel çizgi JSON dosyası")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Gerileme eşiği (yüzde)")
+    args = parser.parse_args()
+
+    endpoints = [e for e in args.endpoints.split(",") if e]
+    unknown = [e for e in endpoints if e not in ENDPOINTS]
+    if unknown:
+        parser.error(f"bilinmeyen uç nokta: {', '.join(unknown)}")
+    levels = [int(c) for c in args.concurrency.split(",") if c]
+
+    rng = random.Random(args.seed)
+    locations = [(round(rng.uniform(36, 42), 4), round(rng.uniform(26, 45), 4)) for _ in range(args.locations)]
+    template = json.loads(Path(args.payload).read_text(encoding="utf-8"))
+
+    scenarios = []
+    with MockOpenMeteo(latency=args.latency, error_rate=args.error_rate, seed=args.seed, payload=template) as mock:
+        for endpoint in endpoints:
+            for concurrency in levels:
+                name = f"{endpoint}@c{concurrency}"
+                with ApiServer(mock.url, workers=args.workers) as server:
+                    mock.reset()
+                    result = asyncio.run(drive(server.url, endpoint, concurrency, args.requests, locations, args.seed))
+                scenarios.append({
+                    "name": name,
+                    "endpoint": endpoint,
+                    "concurrency": concurrency,
+                    **result,
+                    "upstream_calls": mock.hits,
+                    "upstream_errors": mock.errors,
+                })
+                print(f"  {name} tamamlandı", file=sys.stderr)
+
+    print_results(scenarios)
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "settings": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        },
+        "scenarios": scenarios,
+    }
+    output = Path(args.output) if args.output else RESULTS / f"loadtest_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nSonuçlar kaydedildi: {output}")
+
+    if args.compare and compare(scenarios, Path(args.compare), args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
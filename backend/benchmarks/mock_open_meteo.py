@@ -0,0 +1,297 @@
+"""
+Benchmark'lar için yerel Open-Meteo mock sunucusu.
+
+Gerçek API'ye benzeyen yanıtlar üretir veya kayıtlı bir yanıtı (payloads/)
+koordinatları değiştirerek sunar; her isteğe yapay gecikme ekler.
+`error_rate` oranındaki isteklere `error_status` durum koduyla hata döndürerek
+arıza enjekte edebilir. Gelen istek sayısı `MockOpenMeteo.hits` ile izlenir.
+
+Kullanım:
+    python mock_open_meteo.py --port 8765 --latency 0.2 --error-rate 0.1
+    python mock_open_meteo.py --payload payloads/single.json
+"""
+import argparse
+import copy
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+CURRENT_UNITS = {
+    "time": "iso8601", "interval": "seconds", "temperature_2m": "°C",
+    "apparent_temperature": "°C", "relative_humidity_2m": "%", "precipitation": "mm",
+    "pressure_msl": "hPa", "surface_pressure": "hPa", "wind_speed_10m": "km/h",
+    "wind_direction_10m": "°", "wind_gusts_10m": "km/h", "uv_index": "",
+    "cloud_cover": "%", "visibility": "m", "weather_code": "wmo code",
+}
+
+DAILY_UNITS = {
+    "time": "iso8601", "temperature_2m_max": "°C", "temperature_2m_min": "°C",
+    "weathercode": "wmo code", "sunrise": "iso8601", "sunset": "iso8601",
+    "uv_index_max": "", "precipitation_sum": "mm", "wind_speed_10m_max": "km/h",
+    "wind_direction_10m_dominant": "°",
+}
+
+HOURLY_UNITS = {
+    "time": "iso8601", "temperature_2m": "°C", "apparent_temperature": "°C",
+    "relative_humidity_2m": "%", "precipitation": "mm", "precipitation_probability": "%",
+    "pressure_msl": "hPa", "wind_speed_10m": "km/h", "wind_direction_10m": "°",
+    "wind_gusts_10m": "km/h", "cloud_cover": "%", "uv_index": "", "weather_code": "wmo code",
+}
+
+
+def build_hourly(lat: float, start: str, days: int) -> dict:
+    """`start` gününden itibaren `days` gün için saatlik blok üretir"""
+    first = datetime.fromisoformat(start)
+    hours = days * 24
+    base = 15 + (lat % 10)
+    cycle = [round(base + 5 * ((h % 24) - 12) / 12, 1) for h in range(hours)]
+    return {
+        "time": [(first + timedelta(hours=h)).isoformat(timespec="minutes") for h in range(hours)],
+        "temperature_2m": cycle,
+        "apparent_temperature": [round(t - 1.5, 1) for t in cycle],
+        "relative_humidity_2m": [60 + h % 20 for h in range(hours)],
+        "precipitation": [round((h % 7) * 0.1, 1) for h in range(hours)],
+        "precipitation_probability": [(h * 5) % 100 for h in range(hours)],
+        "pressure_msl": [round(1013.2 + (h % 12) * 0.1, 1) for h in range(hours)],
+        "wind_speed_10m": [round(3.6 + (h % 10) * 0.5, 1) for h in range(hours)],
+        "wind_direction_10m": [(200 + h * 3) % 360 for h in range(hours)],
+        "wind_gusts_10m": [round(7.2 + (h % 10), 1) for h in range(hours)],
+        "cloud_cover": [(h * 7) % 100 for h in range(hours)],
+        "uv_index": [round(max(0.0, 6 - abs((h % 24) - 13)), 1) for h in range(hours)],
+        "weather_code": [(0, 1, 2, 3, 61, 80, 95)[(h // 6) % 7] for h in range(hours)],
+    }
+
+
+def build_payload(lat: float, lon: float, days: int = 7, current: list | None = None,
+                  daily: list | None = None, hourly: list | None = None) -> dict:
+    """
+    Verilen koordinat için Open-Meteo biçiminde örnek yanıt üretir
+
+    `current`/`daily`/`hourly` verilirse gerçek API gibi yalnızca istenen
+    değişkenler (ve her zaman gelen `time`/`interval`) döndürülür; boş liste
+    bloğu kaldırır. Saatlik blok yalnızca istendiğinde üretilir.
+    """
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0, tzinfo=None)
+    today = now.date()
+    base = 15 + (lat % 10)
+    dates = [(today + timedelta(days=i)).isoformat() for i in range(days)]
+    payload = {
+        "latitude": lat,
+        "longitude": lon,
+        "generationtime_ms": 0.12,
+        "utc_offset_seconds": 0,
+        "timezone": "GMT",
+        "timezone_abbreviation": "GMT",
+        "elevation": 38.0,
+        "current_units": CURRENT_UNITS,
+        "current": {
+            "time": now.isoformat(timespec="minutes"),
+            "interval": 3600,
+            "temperature_2m": round(base, 1),
+            "apparent_temperature": round(base - 1.5, 1),
+            "relative_humidity_2m": 60,
+            "precipitation": 0.0,
+            "pressure_msl": 1013.2,
+            "surface_pressure": 1008.4,
+            "wind_speed_10m": 3.6,
+            "wind_direction_10m": 220,
+            "wind_gusts_10m": 7.2,
+            "uv_index": 4.1,
+            "cloud_cover": 35,
+            "visibility": 24140.0,
+            "weather_code": 2,
+        },
+        "daily_units": DAILY_UNITS,
+        "daily": {
+            "time": dates,
+            "temperature_2m_max": [round(base + 5 + i * 0.3, 1) for i in range(days)],
+            "temperature_2m_min": [round(base - 4 + i * 0.2, 1) for i in range(days)],
+            "weathercode": [(0, 1, 2, 3, 61, 80, 95)[i % 7] for i in range(days)],
+            "sunrise": [f"{d}T06:12" for d in dates],
+            "sunset": [f"{d}T19:03" for d in dates],
+            "uv_index_max": [round(5.0 + i * 0.1, 2) for i in range(days)],
+            "precipitation_sum": [round(i * 0.4, 1) for i in range(days)],
+            "wind_speed_10m_max": [round(10 + i, 1) for i in range(days)],
+            "wind_direction_10m_dominant": [(200 + i * 10) % 360 for i in range(days)],
+        },
+    }
+    if hourly:
+        payload["hourly_units"] = HOURLY_UNITS
+        payload["hourly"] = build_hourly(lat, dates[0], days)
+    return select_variables(payload, days, current, daily, hourly)
+
+
+def select_variables(payload: dict, days: int, current: list | None = None, daily: list | None = None,
+                     hourly: list | None = None) -> dict:
+    """
+    Yanıtı istenen değişkenlere ve gün sayısına indirger (yerinde)
+
+    Blok için None verilirse olduğu gibi kalır, boş liste bloğu kaldırır.
+    """
+    blocks = (
+        ("current", current, ("time", "interval")),
+        ("daily", daily, ("time",)),
+        ("hourly", hourly, ("time",)),
+    )
+    for block, names, always in blocks:
+        if block not in payload or names is None:
+            continue
+        if not names:
+            payload.pop(block, None)
+            payload.pop(f"{block}_units", None)
+            continue
+        keep = set(names) | set(always)
+        for key in (block, f"{block}_units"):
+            if key in payload:
+                payload[key] = {name: value for name, value in payload[key].items() if name in keep}
+    if "daily" in payload:
+        payload["daily"] = {name: values[:days] for name, values in payload["daily"].items()}
+    if "hourly" in payload:
+        payload["hourly"] = {name: values[:days * 24] for name, values in payload["hourly"].items()}
+    return payload
+
+
+def recorded_payload(template: dict, lat: float, lon: float, days: int = 7, current: list | None = None,
+                     daily: list | None = None, hourly: list | None = None) -> dict:
+    """
+    Kayıtlı yanıtı istenen koordinat ve değişkenlerle döndürür
+
+    Kayıtta saatlik blok yoksa ve istenmişse üretilmiş saatlik veri eklenir.
+    """
+    payload = copy.deepcopy(template)
+    payload["latitude"] = lat
+    payload["longitude"] = lon
+    if hourly and "hourly" not in payload:
+        start = (payload.get("daily") or {}).get("time") or [datetime.now(timezone.utc).date().isoformat()]
+        payload["hourly_units"] = HOURLY_UNITS
+        payload["hourly"] = build_hourly(lat, start[0], days)
+    return select_variables(payload, days, current, daily, hourly)
+
+
+def _variables(query: dict, name: str) -> list:
+    """Tekrarlanan veya virgülle ayrılmış değişken parametresini listeye çevirir"""
+    if name not in query:
+        return []
+    return [variable for value in query[name] for variable in value.split(",") if variable]
+
+
+class MockOpenMeteo:
+    """Arka planda çalışan, thread tabanlı mock Open-Meteo sunucusu"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, seed: int = 0,
+                 payload: dict | None = None):
+        self.latency = latency
+        # Kayıtlı yanıt şablonu; verilmezse build_payload ile üretilir. Çoklu konum
+        # kaydında ilk konum şablon olarak kullanılır
+        self.payload = payload[0] if isinstance(payload, list) else payload
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.hits = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1/forecast"
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.errors = 0
+
+    def _make_handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with mock._lock:
+                    mock.hits += 1
+                    fail = mock.error_rate > 0 and mock._random.random() < mock.error_rate
+                    if fail:
+                        mock.errors += 1
+                if mock.latency:
+                    time.sleep(mock.latency)
+
+                if fail:
+                    body = b'{"error": true, "reason": "injected fault"}'
+                    self.send_response(mock.error_status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+
+                query = parse_qs(urlparse(self.path).query)
+                lats = [float(v) for v in query.get("latitude", ["0"])[0].split(",")]
+                lons = [float(v) for v in query.get("longitude", ["0"])[0].split(",")]
+                days = int(query.get("forecast_days", ["7"])[0])
+                current = _variables(query, "current")
+                daily = _variables(query, "daily")
+                hourly = _variables(query, "hourly")
+
+                # Çoklu konum isteğinde Open-Meteo gibi liste döndür
+                if mock.payload is not None:
+                    payloads = [recorded_payload(mock.payload, lat, lon, days, current, daily, hourly)
+                                for lat, lon in zip(lats, lons)]
+                else:
+                    payloads = [build_payload(lat, lon, days, current, daily, hourly) for lat, lon in zip(lats, lons)]
+                body = json.dumps(payloads if len(payloads) > 1 else payloads[0]).encode()
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "MockOpenMeteo":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockOpenMeteo":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Yerel Open-Meteo mock sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="İstek başına gecikme (saniye)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Hata döndürülecek istek oranı (0-1)")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--payload", help="Sunulacak kayıtlı Open-Meteo yanıtı (JSON dosyası)")
+    args = parser.parse_args()
+
+    template = json.loads(open(args.payload, encoding="utf-8").read()) if args.payload else None
+    server = MockOpenMeteo(args.host, args.port, args.latency, args.error_rate, args.error_status,
+                           payload=template)
+    print(f"Mock Open-Meteo: {server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
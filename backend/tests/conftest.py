@@ -0,0 +1,63 @@
+"""
+Testler için ortak kurulum.
+
+Uygulama modülleri yapılandırmayı içe aktarılırken ortam değişkenlerinden
+okuduğundan, değişkenler burada herhangi bir uygulama modülünden önce
+ayarlanır. Open-Meteo yerine benchmark'ların yerel mock sunucusu kullanılır.
+
+Kullanım:
+    cd backend && python -m pytest -q tests
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND / "benchmarks"))
+sys.path.insert(0, str(BACKEND / "app"))
+
+os.environ["DISK_CACHE_ENABLED"] = "false"
+os.environ["HOT_REFRESH_ENABLED"] = "false"
+os.environ["UPSTREAM_RETRY_BASE_DELAY"] = "0.01"
+
+from mock_open_meteo import MockOpenMeteo  # noqa: E402
+from resilience import CircuitBreaker, RetryBudget  # noqa: E402
+from weather_service import WeatherService  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def mock_server():
+    with MockOpenMeteo().start() as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock(mock_server):
+    """Her test için sıfırlanmış mock sunucu ve boş önbellek/dayanıklılık durumu"""
+    mock_server.reset()
+    mock_server.latency = 0.0
+    mock_server.error_rate = 0.0
+    WeatherService.BASE_URL = mock_server.url
+    if WeatherService._cache is not None:
+        WeatherService._cache.clear()
+    WeatherService._inflight.clear()
+    WeatherService._breaker = CircuitBreaker(WeatherService._breaker.failure_threshold,
+                                             WeatherService._breaker.reset_timeout)
+    WeatherService._retry_budget = RetryBudget(WeatherService._retry_budget.ratio,
+                                               WeatherService._retry_budget.max_tokens)
+    yield mock_server
+
+
+def run(coro):
+    """Korutini WeatherService açıkken yeni bir olay döngüsünde çalıştırır"""
+    async def wrapper():
+        await WeatherService.startup()
+        try:
+            return await coro
+        finally:
+            await WeatherService.shutdown()
+
+    return asyncio.run(wrapper())
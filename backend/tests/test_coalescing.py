@@ -0,0 +1,70 @@
+"""Single-flight birleştirmesi: aynı hücre için eşzamanlı istekler tek upstream isteği yapar"""
+import asyncio
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from conftest import run
+from profiles import WEATHER
+from weather_service import WeatherService
+
+
+def test_concurrent_burst_makes_one_upstream_request(mock):
+    mock.latency = 0.1
+
+    async def burst():
+        return await asyncio.gather(*(
+            WeatherService.get_weather_by_coordinates(41.0082, 28.9784) for _ in range(50)
+        ))
+
+    results = run(burst())
+
+    assert all(result is not None for result in results)
+    assert mock.hits == 1
+
+
+def test_burst_with_narrower_profile_joins_wider_request(mock):
+    mock.latency = 0.1
+
+    async def burst():
+        full = asyncio.ensure_future(WeatherService.get_weather_by_coordinates(41.0082, 28.9784))
+        await asyncio.sleep(0)
+        return await asyncio.gather(full, *(
+            WeatherService.get_weather_by_coordinates(41.0082, 28.9784, profile=WEATHER) for _ in range(10)
+        ))
+
+    results = run(burst())
+
+    assert all(result is not None for result in results)
+    assert mock.hits == 1
+
+
+def test_chat_weather_makes_one_upstream_request(mock):
+    with TestClient(main.app) as client:
+        response = client.post("/chat/weather", json={
+            "latitude": 41.0082, "longitude": 28.9784, "message": "bugün hava nasıl?"
+        })
+
+    assert response.status_code == 200
+    assert response.json()["response"]
+    assert mock.hits == 1
+
+
+def test_shutdown_cancels_inflight_fetch_before_closing_client(mock, caplog):
+    mock.latency = 0.5
+
+    async def scenario():
+        await WeatherService.startup()
+        caller = asyncio.ensure_future(WeatherService.get_weather_by_coordinates(41.0082, 28.9784))
+        await asyncio.sleep(0.05)
+        await WeatherService.shutdown()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert not WeatherService._inflight
+
+    with caplog.at_level(logging.ERROR):
+        asyncio.run(scenario())
+
+    assert not caplog.records
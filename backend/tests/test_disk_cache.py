@@ -0,0 +1,34 @@
+"""Disk önbelleği: istatistiklerdeki satır sayısı tahmini"""
+import asyncio
+import time
+
+from disk_cache import DiskForecastCache
+
+
+def test_entry_estimate_tracks_writes_and_compaction(tmp_path):
+    cache = DiskForecastCache(str(tmp_path / "cache.sqlite3"), ttl=60)
+
+    async def scenario():
+        await cache.set_many([((i, 0.0), {"i": i}, None) for i in range(3)])
+        assert cache.stats()["entries"] == 3
+        # Biri mevcut kaydın üzerine yazar, biri yenidir
+        await cache.set_many([((0, 0.0), {"i": 0}, None), ((3, 0.0), {"i": 3}, time.time() - 1)])
+        assert cache.stats()["entries"] == 4
+        assert await cache.compact() == 1
+        assert cache.stats()["entries"] == 3
+
+    asyncio.run(scenario())
+    cache.close()
+
+
+def test_estimate_is_counted_on_open_and_stats_skips_database(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = DiskForecastCache(path, ttl=60)
+    asyncio.run(first.set_many([((i, 0.0), {"i": i}, None) for i in range(5)]))
+    first.close()
+
+    second = DiskForecastCache(path, ttl=60)
+    second.close()
+
+    # Bağlantı kapalıyken de çalışır: metrik yolunda sorgu yapılmaz
+    assert second.stats()["entries"] == 5
@@ -0,0 +1,41 @@
+"""Sohbet niyeti sınıflandırması ve mesaj uzunluğu sınırı"""
+import pytest
+from fastapi.testclient import TestClient
+
+import intents
+import main
+from bench_intents import CORPUS
+from config import CHAT_MESSAGE_MAX_LENGTH
+
+
+@pytest.mark.parametrize("message, expected", CORPUS)
+def test_classify_corpus(message, expected):
+    assert intents.classify.__wrapped__(message) == expected
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("Hava (yarın) nasıl?", intents.TOMORROW),
+    ("Merhaba,yarın hava nasıl?", intents.TOMORROW),
+    ("selam.yarın yağmur var mı", intents.TOMORROW),
+    ("Hava?Yarın?", intents.TOMORROW),
+    ("-yarın hava", intents.TOMORROW),
+    ("hava:haftalık", intents.WEEKLY),
+    ("İstanbul'da 7-gün", intents.WEEKLY),
+    ("seven\nday forecast", intents.WEEKLY),
+    ("bugün hava güzel\nhaftaya ne olacak", intents.WEEKLY),
+    ("ŞEMSİYE LAZIM MI", intents.TODAY),
+    ("yarın değil, bu hafta", intents.WEEKLY),
+    ("hotel karar", None),
+])
+def test_classify_priority_and_normalization(message, expected):
+    assert intents.classify.__wrapped__(message) == expected
+
+
+def test_chat_rejects_overlong_message(mock):
+    with TestClient(main.app) as client:
+        response = client.post("/chat/weather", json={
+            "latitude": 41.0, "longitude": 29.0, "message": "hava " * CHAT_MESSAGE_MAX_LENGTH
+        })
+
+    assert response.status_code == 422
+    assert mock.hits == 0
@@ -0,0 +1,137 @@
+"""Devre kesici ve son bilinen değer: arıza enjekte eden mock sunucuya karşı"""
+import asyncio
+import time
+
+import pytest
+
+from conftest import run
+from resilience import CircuitBreaker, ConcurrencyLimiter
+from weather_service import WeatherService
+
+
+def points(count: int, offset: float = 0.0) -> list:
+    return [(30.0 + offset + i * 0.5, 30.0) for i in range(count)]
+
+
+async def request_all(coords: list) -> list:
+    return await asyncio.gather(*(WeatherService.get_weather_by_coordinates(lat, lon) for lat, lon in coords))
+
+
+def expire_cache() -> None:
+    """Önbellekteki kayıtları süresi çoktan dolmuş (yalnızca son bilinen değer) yapar"""
+    for key, (_, value) in list(WeatherService._cache._entries.items()):
+        WeatherService._cache._entries[key] = (0.0, value)
+
+
+def test_breaker_opens_after_threshold(mock):
+    mock.error_rate = 1.0
+    breaker = WeatherService._breaker
+
+    async def until_open():
+        for lat, lon in points(breaker.failure_threshold):
+            await WeatherService.get_weather_by_coordinates(lat, lon)
+            if breaker.state == CircuitBreaker.OPEN:
+                break
+
+    run(until_open())
+
+    assert breaker.state == CircuitBreaker.OPEN
+    # Her başarısız deneme bir hata sayar; devre açıldıktan sonra upstream'e gidilmez
+    assert mock.hits == breaker.failure_threshold
+
+
+def test_open_breaker_rejects_without_upstream_requests(mock):
+    mock.error_rate = 1.0
+    breaker = WeatherService._breaker
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    results = run(request_all(points(20)))
+
+    assert results == [None] * 20
+    assert mock.hits == 0
+    assert breaker.rejected >= 20
+
+
+def test_open_breaker_serves_last_known_value(mock):
+    coords = points(5, offset=100)
+    fresh = run(request_all(coords))
+    assert all(result is not None for result in fresh)
+
+    expire_cache()
+    mock.error_rate = 1.0
+    for _ in range(WeatherService._breaker.failure_threshold):
+        WeatherService._breaker.record_failure()
+    mock.reset()
+
+    results = run(request_all(coords))
+
+    assert mock.hits == 0
+    assert [result["current"] for result in results] == [result["current"] for result in fresh]
+
+
+def test_breaker_closes_after_successful_probe(mock):
+    WeatherService._breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.2)
+    breaker = WeatherService._breaker
+    mock.error_rate = 1.0
+    run(request_all(points(3)))
+    assert breaker.state == CircuitBreaker.OPEN
+
+    mock.error_rate = 0.0
+    mock.reset()
+    time.sleep(0.25)
+    probe = run(request_all(points(1, offset=200)))
+
+    assert probe[0] is not None
+    assert mock.hits == 1
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    results = run(request_all(points(5, offset=300)))
+    assert all(result is not None for result in results)
+    assert mock.hits == 6
+
+
+def test_queue_timeout_is_not_retried_or_counted_as_upstream_failure(mock):
+    mock.latency = 0.3
+    WeatherService._limiter = ConcurrencyLimiter(limit=1, queue_timeout=0.05)
+    breaker = WeatherService._breaker
+
+    results = run(request_all(points(breaker.failure_threshold + 2)))
+
+    assert sum(1 for result in results if result is not None) == 1
+    assert mock.hits == 1
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.consecutive_failures == 0
+    assert WeatherService._retry_budget.spent == 0
+
+
+def test_cancelled_probe_releases_half_open_breaker(mock):
+    WeatherService._breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker = WeatherService._breaker
+    mock.error_rate = 1.0
+    run(request_all(points(1)))
+    assert breaker.state == CircuitBreaker.OPEN
+
+    mock.error_rate = 0.0
+    mock.latency = 0.3
+    time.sleep(0.06)
+
+    async def cancel_probe():
+        probe = asyncio.ensure_future(WeatherService.get_weather_batch(
+            [(lat, lon, "metric") for lat, lon in points(1, offset=400)]
+        ))
+        await asyncio.sleep(0.05)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+    run(cancel_probe())
+
+    mock.latency = 0.0
+    probe = run(request_all(points(1, offset=500)))
+    assert probe[0] is not None
+    assert breaker.state == CircuitBreaker.CLOSED
+    results = run(request_all(points(3, offset=600)))
+    assert all(result is not None for result in results)
@@ -0,0 +1,64 @@
+"""Uç noktaların yanıt biçimi: profile göre alanlar"""
+from fastapi.testclient import TestClient
+
+import main
+from conftest import run
+from models import CompactBatchWeatherResponse, CompactWeatherResponse, WeatherResponse
+from profiles import FULL
+from weather_service import WeatherService
+
+
+def test_weather_has_no_forecast_even_from_wider_cache_entry(mock):
+    # Aynı hücre için 7 günlük tahmini de içeren geniş kayıt önbellekte
+    run(WeatherService.get_weather_by_coordinates(41.0, 29.0, "metric", FULL))
+
+    with TestClient(main.app) as client:
+        narrow = client.get("/weather", params={"lat": 40.0, "lon": 29.0}).json()
+        wide = client.get("/weather", params={"lat": 41.0, "lon": 29.0}).json()
+        compact = client.get("/weather", params={"lat": 41.0, "lon": 29.0, "format": "compact"}).json()
+        batch = client.post("/weather/batch", json=[{"latitude": 41.0, "longitude": 29.0}]).json()
+
+    assert narrow["forecast"] is None
+    assert wide["forecast"] is None
+    assert compact["forecast"] is None
+    assert batch[0]["data"]["forecast"] is None
+
+
+def test_chat_forecast_only_for_forecast_intents(mock):
+    with TestClient(main.app) as client:
+        today = client.post("/chat/weather", json={
+            "latitude": 41.0, "longitude": 29.0, "message": "bugün hava nasıl?"
+        }).json()
+        weekly = client.post("/chat/weather", json={
+            "latitude": 41.0, "longitude": 29.0, "message": "bu hafta hava nasıl?"
+        }).json()
+
+    assert today["weather_data"]["forecast"] is None
+    days = weekly["weather_data"]["forecast"]["daily"]
+    assert len(days) == 7
+    assert all(day["wind_speed"] is not None for day in days)
+
+
+def test_interpolated_flag_is_always_present(mock):
+    with TestClient(main.app) as client:
+        single = client.get("/weather", params={"lat": 41.0, "lon": 29.0}).json()
+        batch = client.post("/weather/batch", json=[{"latitude": 39.0, "longitude": 32.0}]).json()
+        chat = client.post("/chat/weather", json={
+            "latitude": 41.0, "longitude": 29.0, "message": "yarın hava nasıl?"
+        }).json()
+
+    assert single["interpolated"] is False
+    assert batch[0]["data"]["interpolated"] is False
+    assert chat["weather_data"]["interpolated"] is False
+
+
+def test_compact_payloads_match_declared_schema(mock):
+    with TestClient(main.app) as client:
+        single = client.get("/weather", params={"lat": 41.0, "lon": 29.0, "format": "compact"}).json()
+        batch = client.post("/weather/batch", params={"format": "compact"},
+                            json=[{"latitude": 41.0, "longitude": 29.0}]).json()
+        full = client.get("/weather", params={"lat": 41.0, "lon": 29.0}).json()
+
+    assert CompactWeatherResponse.model_validate(single).keys.current
+    assert CompactBatchWeatherResponse.model_validate(batch).items[0].data is not None
+    assert WeatherResponse.model_validate(full).forecast is None